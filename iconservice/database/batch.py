@@ -15,15 +15,16 @@
 # limitations under the License.
 
 
+import hashlib
 from collections import OrderedDict
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 from copy import copy
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 from ..base.block import Block
 from ..base.exception import DatabaseException, AccessDeniedException
 from ..icx import IcxStorage
-from ..utils import sha3_256, to_camel_case
+from ..utils import to_camel_case
 
 
 class BatchValue:
@@ -91,20 +92,59 @@ class BlockBatchValue(BatchValue):
                self.tx_indexes == other.tx_indexes
 
 
-def digest(ordered_dict: OrderedDict):
-    # items in data MUST be byte-like objects
-    data = []
+# Pieces are gathered up to this size before being fed to a hasher
+_DIGEST_CHUNK_SIZE = 64 * 1024
 
-    for key, tx_batch_value in ordered_dict.items():
-        if tx_batch_value.include_state_root_hash is True:
-            value: bytes = tx_batch_value.value
-        else:
+
+def digest(ordered_dict: OrderedDict) -> bytes:
+    """Returns sha3_256(b'key0|value0|key1|value1|...) for the values included in state root hash
+
+    The data is fed to a hasher incrementally instead of being joined into one bytes object,
+    so peak memory does not depend on the size of a batch
+
+    :param ordered_dict: items in data MUST be byte-like objects
+    :return: sha3_256 hash value
+    """
+    hasher = hashlib.sha3_256()
+    # Pieces are joined with b'|' by chunk and the chunks are also joined with b'|'
+    pieces: List[bytes] = []
+    size: int = 0
+    separator: bytes = b''
+
+    for key, batch_value in ordered_dict.items():
+        if batch_value.include_state_root_hash is not True:
             continue
-        data.append(key)
+
+        value: Optional[bytes] = batch_value.value
+        pieces.append(key)
+        size += len(key)
         if value is not None:
-            data.append(value)
-    value: bytes = b'|'.join(data)
-    return sha3_256(value)
+            if len(value) >= _DIGEST_CHUNK_SIZE:
+                # Feed a large value directly without copying it
+                hasher.update(separator)
+                hasher.update(b'|'.join(pieces))
+                hasher.update(b'|')
+                hasher.update(value)
+                pieces.clear()
+                size = 0
+                separator = b'|'
+                continue
+
+            pieces.append(value)
+            size += len(value)
+
+        if size >= _DIGEST_CHUNK_SIZE:
+            hasher.update(separator)
+            hasher.update(b'|'.join(pieces))
+            pieces.clear()
+            size = 0
+            separator = b'|'
+
+    if len(pieces) > 0:
+        hasher.update(separator)
+        hasher.update(b'|'.join(pieces))
+
+    return hasher.digest()
 
 
 class Batch(OrderedDict):
@@ -144,29 +184,28 @@ class TransactionBatch(MutableMapping):
         super().__init__()
         self.hash = tx_hash
         self._call_batches = [OrderedDict()]
+        # Merged view of all call batches (the innermost call wins)
+        # It makes lookups independent of the depth of inter-SCORE calls
+        self._index: Dict[bytes, 'TransactionBatchValue'] = {}
 
     def __getitem__(self, item):
-        for call_batch in reversed(self._call_batches):
-            if item in call_batch:
-                return call_batch[item]
-
-        return None
+        return self._index.get(item)
 
     def __setitem__(self, key, value):
         assert isinstance(value, TransactionBatchValue)
 
         call_batch: OrderedDict = self._call_batches[-1]
         call_batch[key] = value
+        self._index[key] = value
 
     def __delitem__(self, key):
         raise DatabaseException('delete item is not allowed')
 
     def __contains__(self, item):
-        for call_batch in self._call_batches:
-            if item in call_batch:
-                return True
+        return item in self._index
 
-        return False
+    def get(self, key, default=None):
+        return self._index.get(key, default)
 
     def __iter__(self):
         for call_batch in self._call_batches:
@@ -186,6 +225,16 @@ class TransactionBatch(MutableMapping):
 
     def revert_call(self):
         call_batch: OrderedDict = self._call_batches[-1]
+
+        # Restore the values shadowed by the reverted call from the outer calls
+        for key in call_batch:
+            for outer_call_batch in reversed(self._call_batches[:-1]):
+                if key in outer_call_batch:
+                    self._index[key] = outer_call_batch[key]
+                    break
+            else:
+                del self._index[key]
+
         call_batch.clear()
 
     def leave_call(self):
@@ -207,6 +256,7 @@ class TransactionBatch(MutableMapping):
     def clear(self):
         self.hash = None
         self._call_batches = [OrderedDict()]
+        self._index.clear()
 
 
 class BlockBatch(Batch):
@@ -223,10 +273,31 @@ class BlockBatch(Batch):
         """
         super().__init__()
         self.block = block
+        # The values of keys before this block (None if absent) used to backup the previous block state
+        # A value is recorded the first time its key is read from state_db or written in this block
+        self._pre_images: Dict[bytes, Optional[bytes]] = {}
 
     def __setitem__(self, key, value):
         raise AccessDeniedException("Can not set data on block batch directly.")
 
+    @property
+    def pre_images(self) -> Dict[bytes, Optional[bytes]]:
+        return self._pre_images
+
+    def has_pre_image(self, key: bytes) -> bool:
+        return key in self._pre_images
+
+    def set_pre_image(self, key: bytes, value: Optional[bytes]):
+        """Record the value of a key before this block
+
+        Only the first one is recorded, since the later ones could be changed by this block
+
+        :param key:
+        :param value: None if the key does not exist
+        """
+        if key not in self._pre_images:
+            self._pre_images[key] = value
+
     def to_list(self) -> list:
         """
         Return list of key, value for Debugging
@@ -269,4 +340,71 @@ class BlockBatch(Batch):
 
     def clear(self) -> None:
         self.block = None
+        self._pre_images.clear()
         super().clear()
+
+
+class BlockBatchOverlay(Mapping):
+    """Read-only merged view of the uncommitted block batches on a precommit chain
+
+    A key is looked up in the block batch of its block first
+    and then in the overlay of the parent block (newest wins).
+    A value whose BatchValue.value is None is a tombstone for a deleted key.
+    Nothing is copied to build an overlay, and a read costs one dict lookup per uncommitted block.
+    The chain is cut with detach_parent() when its block is committed,
+    so it is never longer than the number of precommit blocks.
+
+    key: bytes
+    value: BlockBatchValue
+    """
+
+    def __init__(self, block_batch: 'BlockBatch', parent: Optional['BlockBatchOverlay'] = None):
+        """Constructor
+
+        :param block_batch: the states changed by the newest uncommitted block
+        :param parent: the overlay of the previous uncommitted block
+            None if the previous block has already been committed
+        """
+        self._block_batch: 'BlockBatch' = block_batch
+        self._parent: Optional['BlockBatchOverlay'] = parent
+
+    def detach_parent(self):
+        """Called when the block of this overlay is committed
+        after the states of its previous blocks have been written to state_db
+        """
+        self._parent = None
+
+    def __getitem__(self, key: bytes) -> 'BlockBatchValue':
+        value: Optional['BlockBatchValue'] = self.get(key)
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self.get(key) is not None
+
+    def __iter__(self):
+        keys = set()
+        overlay: Optional['BlockBatchOverlay'] = self
+
+        while overlay is not None:
+            for key in overlay._block_batch:
+                if key not in keys:
+                    keys.add(key)
+                    yield key
+            overlay = overlay._parent
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def get(self, key: bytes, default=None) -> Optional['BlockBatchValue']:
+        overlay: Optional['BlockBatchOverlay'] = self
+
+        while overlay is not None:
+            value: Optional['BlockBatchValue'] = overlay._block_batch.get(key)
+            if value is not None:
+                return value
+            overlay = overlay._parent
+
+        return default
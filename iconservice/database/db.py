@@ -13,7 +13,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import TYPE_CHECKING, Optional, Tuple, Iterable
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, Tuple, Iterable, Iterator, Dict, Any, List
 
 import plyvel
 from iconcommons.logger import Logger
@@ -24,10 +26,50 @@ from ..icon_constant import ICON_DB_LOG_TAG, IconScoreContextType
 from ..iconscore.context.context import ContextGetter
 
 if TYPE_CHECKING:
+    from .batch import BatchValue, BlockBatch, BlockBatchOverlay
     from ..base.address import Address
     from ..iconscore.icon_score_context import IconScoreContext
 
 
+# The maximum number of sub dbs of all depths cached for a SCORE
+_MAX_SUB_DB_CACHE_SIZE = 1024
+
+
+def _get_many(db, keys: Iterable[bytes]) -> Dict[bytes, bytes]:
+    """Read the values of given keys with one iterator instead of a lookup for each key
+
+    The iterator walks over the sorted keys and seeks only over the keys which are not given
+
+    :param db: plyvel db or snapshot
+    :param keys: keys to retrieve
+    :return: the values of the keys which are found
+    """
+    values: Dict[bytes, bytes] = {}
+
+    sorted_keys: List[bytes] = sorted(set(keys))
+    if len(sorted_keys) == 0:
+        return values
+
+    with db.iterator(start=sorted_keys[0], stop=sorted_keys[-1], include_stop=True) as it:
+        item: Optional[Tuple[bytes, bytes]] = next(it, None)
+
+        for key in sorted_keys:
+            if item is None:
+                break
+
+            if item[0] < key:
+                it.seek(key)
+                item = next(it, None)
+                if item is None:
+                    break
+
+            if item[0] == key:
+                values[key] = item[1]
+                item = next(it, None)
+
+    return values
+
+
 def _is_db_writable_on_context(context: 'IconScoreContext'):
     """Check if db is writable on a given context
 
@@ -40,7 +82,79 @@ def _is_db_writable_on_context(context: 'IconScoreContext'):
         return not context.readonly
 
 
+class Snapshot(object):
+    """Read-only view of a KeyValueDatabase at a point in time
+
+    It is shared by the readers which run while no state is written to the database.
+    The underlying plyvel snapshot is closed when the last reference is released.
+    """
+
+    def __init__(self, db: 'KeyValueDatabase', snapshot) -> None:
+        """Constructor
+
+        :param db: the database which this snapshot is taken from
+        :param snapshot: plyvel snapshot
+        """
+        self._db = db
+        self._snapshot = snapshot
+        # The database holds a reference until a new state is written to it
+        self._ref_count: int = 1
+        self._lock = Lock()
+
+    @property
+    def db(self) -> 'KeyValueDatabase':
+        return self._db
+
+    @property
+    def ref_count(self) -> int:
+        return self._ref_count
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Get the value for the specified key at the time this snapshot was taken
+
+        :param key: (bytes): key to retrieve
+        :return: value for the specified key, or None if not found
+        """
+        return self._snapshot.get(key)
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, bytes]:
+        """Get the values for the specified keys at the time this snapshot was taken
+
+        :param keys: keys to retrieve
+        :return: the values of the keys which are found
+        """
+        return _get_many(self._snapshot, keys)
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._ref_count < 1:
+                raise DatabaseException("Snapshot has already been released")
+            self._ref_count += 1
+
+    def release(self) -> None:
+        with self._lock:
+            self._ref_count -= 1
+            if self._ref_count == 0:
+                self._snapshot.close()
+                self._snapshot = None
+
+
 class KeyValueDatabase(object):
+    # plyvel.DB options(lru_cache_size, bloom_filter_bits, etc) for all databases opened by from_path()
+    _default_options: Dict[str, Any] = {}
+
+    @classmethod
+    def set_default_options(cls, options: Dict[str, Any]) -> None:
+        """Set the options used to open databases from now on
+
+        :param options: keyword arguments of plyvel.DB
+        """
+        cls._default_options = dict(options)
+
+    @classmethod
+    def get_default_options(cls) -> Dict[str, Any]:
+        return dict(cls._default_options)
+
     @staticmethod
     def from_path(path: str,
                   create_if_missing: bool = True) -> 'KeyValueDatabase':
@@ -50,7 +164,7 @@ class KeyValueDatabase(object):
         :param create_if_missing:
         :return: KeyValueDatabase instance
         """
-        db = plyvel.DB(path, create_if_missing=create_if_missing)
+        db = plyvel.DB(path, create_if_missing=create_if_missing, **KeyValueDatabase._default_options)
         return KeyValueDatabase(db)
 
     def __init__(self, db: plyvel.DB) -> None:
@@ -59,6 +173,9 @@ class KeyValueDatabase(object):
         :param db: plyvel db instance
         """
         self._db = db
+        # Snapshot of the latest states which is shared by readers
+        self._snapshot: Optional['Snapshot'] = None
+        self._snapshot_lock = Lock()
 
     def get(self, key: bytes) -> bytes:
         """Get the value for the specified key.
@@ -68,6 +185,16 @@ class KeyValueDatabase(object):
         """
         return self._db.get(key)
 
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, bytes]:
+        """Get the values for the specified keys at once.
+
+        It is faster than get() for each key when the keys are close to each other like the items of ArrayDB
+
+        :param keys: keys to retrieve
+        :return: the values of the keys which are found
+        """
+        return _get_many(self._db, keys)
+
     def put(self, key: bytes, value: bytes) -> None:
         """Set a value for the specified key.
 
@@ -75,6 +202,7 @@ class KeyValueDatabase(object):
         :param value: (bytes): data to be stored
         """
         self._db.put(key, value)
+        self._invalidate_snapshot()
 
     def delete(self, key: bytes) -> None:
         """Delete the key/value pair for the specified key.
@@ -82,14 +210,46 @@ class KeyValueDatabase(object):
         :param key: key to delete
         """
         self._db.delete(key)
+        self._invalidate_snapshot()
 
     def close(self) -> None:
         """Close the database.
         """
+        self._invalidate_snapshot()
+
         if self._db:
             self._db.close()
             self._db = None
 
+    def acquire_snapshot(self) -> 'Snapshot':
+        """Returns the snapshot of the latest states written to this database
+
+        The same snapshot is returned until a new state is written.
+        The caller MUST call Snapshot.release() when it is no longer used.
+
+        :return: snapshot
+        """
+        with self._snapshot_lock:
+            if self._snapshot is None:
+                self._snapshot = Snapshot(self, self._db.snapshot())
+
+            snapshot: 'Snapshot' = self._snapshot
+            snapshot.acquire()
+
+        return snapshot
+
+    def _invalidate_snapshot(self):
+        """Make the next reader take a new snapshot including the states written just before
+
+        The readers which are using the current snapshot are not affected.
+        """
+        with self._snapshot_lock:
+            snapshot: Optional['Snapshot'] = self._snapshot
+            self._snapshot = None
+
+        if snapshot is not None:
+            snapshot.release()
+
     def get_sub_db(self, prefix: bytes) -> 'KeyValueDatabase':
         """Return a new prefixed database.
 
@@ -100,12 +260,14 @@ class KeyValueDatabase(object):
     def iterator(self) -> iter:
         return self._db.iterator()
 
-    def write_batch(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
+    def write_batch(self, it: Iterable[Tuple[bytes, Optional[bytes]]], sync: bool = False) -> int:
         """Write a batch to the database for the specified states dict.
 
         :param it: iterable which return tuple(key, value)
             key: bytes
             value: optional bytes
+        :param sync: if True, wait until the batch is flushed to the disk
+            No need in most cases because the states of a block are recovered from its WAL file
         :return: the number of key-value pairs written
         """
         size = 0
@@ -113,7 +275,7 @@ class KeyValueDatabase(object):
         if it is None:
             return size
 
-        with self._db.write_batch() as wb:
+        with self._db.write_batch(sync=sync) as wb:
             for key, value in it:
                 if value:
                     wb.put(key, value)
@@ -122,6 +284,7 @@ class KeyValueDatabase(object):
 
                 size += 1
 
+        self._invalidate_snapshot()
         return size
 
 
@@ -204,11 +367,77 @@ class ContextDatabase(object):
         """
         context_type = context.type
 
-        if context_type in (IconScoreContextType.DIRECT, IconScoreContextType.QUERY):
+        if context_type == IconScoreContextType.DIRECT:
             return self.key_value_db.get(key)
+        elif context_type == IconScoreContextType.QUERY:
+            return self.get_from_db(context, key)
         else:
             return self.get_from_batch(context, key)
 
+    def get_from_db(self, context: 'IconScoreContext', key: bytes) -> Optional[bytes]:
+        """Returns a value for a given key from the snapshot pinned by a given context or StateDB
+
+        Readers with a snapshot are not affected by the states written while they are running
+
+        :param context:
+        :param key:
+        :return: a value for a given key
+        """
+        snapshot: Optional['Snapshot'] = context.snapshot
+        if snapshot is not None and snapshot.db is self.key_value_db:
+            return snapshot.get(key)
+
+        return self.key_value_db.get(key)
+
+    def get_many_from_db(self, context: 'IconScoreContext', keys: Iterable[bytes]) -> Dict[bytes, bytes]:
+        """Returns the values for given keys like get_from_db()
+
+        :param context:
+        :param keys:
+        :return: the values of the keys which are found
+        """
+        snapshot: Optional['Snapshot'] = context.snapshot
+        if snapshot is not None and snapshot.db is self.key_value_db:
+            return snapshot.get_many(keys)
+
+        return self.key_value_db.get_many(keys)
+
+    def iter_values(self, context: 'IconScoreContext', keys: List[bytes]) -> Iterator[Optional[bytes]]:
+        """Yields the value for each of given keys like get()
+
+        The values in StateDB are read at once before the first one is yielded.
+        Batches are still searched for each key when it is yielded,
+        so the values written during the iteration are returned as get() does.
+
+        :param context:
+        :param keys:
+        :return: values in the order of keys
+        """
+        context_type = context.type
+
+        if context_type == IconScoreContextType.DIRECT:
+            # StateDB can be written during the iteration
+            for key in keys:
+                yield self.key_value_db.get(key)
+            return
+
+        db_values: Dict[bytes, bytes] = self.get_many_from_db(context, keys)
+
+        if context_type == IconScoreContextType.QUERY:
+            for key in keys:
+                yield db_values.get(key)
+            return
+
+        for key in keys:
+            batch_value: Optional['BatchValue'] = self.get_batch_value(context, key)
+            if batch_value is not None:
+                yield batch_value.value
+                continue
+
+            value: Optional[bytes] = db_values.get(key)
+            self.set_pre_image(context, key, value)
+            yield value
+
     def get_from_batch(self,
                        context: 'IconScoreContext',
                        key: bytes) -> bytes:
@@ -217,7 +446,7 @@ class ContextDatabase(object):
         Search order
         1. TransactionBatch
         2. Current BlockBatch
-        3. Prev BlockBatch
+        3. BlockBatchOverlay merging all prev uncommitted BlockBatches
         4. StateDB
 
         :param context:
@@ -225,13 +454,60 @@ class ContextDatabase(object):
 
         :return: a value for a given key
         """
-        # Find the value from tx_batch, block_batch and prev_block_batches with a given key
-        for batch in context.get_batches():
-            if key in batch:
-                return batch[key].value
+        batch_value: Optional['BatchValue'] = self.get_batch_value(context, key)
+        if batch_value is not None:
+            return batch_value.value
 
         # get value from state_db
-        return self.key_value_db.get(key)
+        value: Optional[bytes] = self.get_from_db(context, key)
+        self.set_pre_image(context, key, value)
+        return value
+
+    @staticmethod
+    def set_pre_image(context: 'IconScoreContext', key: bytes, value: Optional[bytes]):
+        """Record the value of a key before the block being invoked
+
+        :param context:
+        :param key:
+        :param value: the value which is neither in tx_batch nor in block_batch
+        """
+        if context.type == IconScoreContextType.INVOKE and context.block_batch is not None:
+            context.block_batch.set_pre_image(key, value)
+
+    def _set_pre_image_on_write(self, context: 'IconScoreContext', key: bytes):
+        if context.type != IconScoreContextType.INVOKE:
+            return
+
+        block_batch: Optional['BlockBatch'] = context.block_batch
+        if block_batch is None or block_batch.has_pre_image(key):
+            return
+
+        # The key has not been read from state_db or written in this block yet
+        overlay: Optional['BlockBatchOverlay'] = context.prev_block_overlay
+        batch_value: Optional['BatchValue'] = None if overlay is None else overlay.get(key)
+        if batch_value is None:
+            value: Optional[bytes] = self.key_value_db.get(key)
+        else:
+            value: Optional[bytes] = batch_value.value
+
+        block_batch.set_pre_image(key, value)
+
+    @staticmethod
+    def get_batch_value(context: 'IconScoreContext', key: bytes) -> Optional['BatchValue']:
+        """Returns a BatchValue for a given key from the batches of a given context
+
+        :param context:
+        :param key:
+        :return: None if the key has not been changed by any uncommitted tx or block
+        """
+        # Find the value from tx_batch, block_batch and prev_block_overlay with a given key
+        # Each batch returns None for a missing key, so one lookup per batch is enough
+        for batch in context.get_batches():
+            batch_value = batch.get(key)
+            if batch_value is not None:
+                return batch_value
+
+        return None
 
     @staticmethod
     def _check_tx_batch_value(context: Optional['IconScoreContext'],
@@ -273,6 +549,7 @@ class ContextDatabase(object):
             self.key_value_db.put(key, value)
         else:
             self._check_tx_batch_value(context, key, include_state_root_hash)
+            self._set_pre_image_on_write(context, key)
             tx_index: int = context.tx.index if context.tx is not None else -1
             context.tx_batch[key] = TransactionBatchValue(value, include_state_root_hash, tx_index)
 
@@ -299,6 +576,7 @@ class ContextDatabase(object):
             self.key_value_db.delete(key)
         else:
             self._check_tx_batch_value(context, key, include_state_root_hash)
+            self._set_pre_image_on_write(context, key)
             tx_index: int = context.tx.index if context.tx is not None else -1
             context.tx_batch[key] = TransactionBatchValue(None, include_state_root_hash, tx_index)
 
@@ -380,8 +658,12 @@ class IconScoreDatabase(ContextGetter):
         self._prefix = prefix
         self._context_db = context_db
         self._observer: Optional[DatabaseObserver] = None
+        # Sub dbs of all depths shared by the contexts on every thread: full prefix -> sub db (LRU)
+        self._sub_dbs: OrderedDict = OrderedDict()
+        self._sub_db_lock = Lock()
 
         self._prefix_hash_key: bytes = self._make_prefix_hash_key()
+        self._key_prefix: bytes = self._prefix_hash_key + b'|'
 
     def _make_prefix_hash_key(self) -> bytes:
         data = [self.address.to_bytes()]
@@ -402,6 +684,24 @@ class IconScoreDatabase(ContextGetter):
             self._observer.on_get(self._context, key, value)
         return value
 
+    def iter_values(self, keys: List[bytes]) -> Iterator[Optional[bytes]]:
+        """
+        Yields the value for each of the specified keys as get() returns
+
+        Steps are applied to each value when it is yielded
+
+        :param keys: keys to retrieve
+        :return: values in the order of keys
+        """
+        context = self._context
+        hashed_keys: List[bytes] = [self._hash_key(key) for key in keys]
+
+        for key, value in zip(keys, self._context_db.iter_values(context, hashed_keys)):
+            if self._observer:
+                self._observer.on_get(context, key, value)
+
+            yield value
+
     def put(self, key: bytes, value: bytes):
         """
         Sets a value for the specified key.
@@ -432,10 +732,33 @@ class IconScoreDatabase(ContextGetter):
                 'Invalid params: '
                 'prefix is None in IconScoreDatabase.get_sub_db()')
 
-        if self._prefix is not None:
-            prefix = b'|'.join((self._prefix, prefix))
+        full_prefix: bytes = prefix if self._prefix is None else b'|'.join((self._prefix, prefix))
+        return self._get_cached_sub_db(full_prefix)
+
+    def _get_cached_sub_db(self, prefix: bytes) -> 'IconScoreSubDatabase':
+        """Returns the sub db with a full prefix from the cache or creates and caches a new one
+
+        Sub dbs have no state except for their prefixes,
+        so they are shared by all contexts which access this SCORE.
+        Keys of nested containers can be unbounded like addresses of token holders,
+        so the least recently used one is dropped when the cache is full.
+
+        :param prefix: the prefixes of all depths joined with '|'
+        :return: sub db
+        """
+        sub_dbs: OrderedDict = self._sub_dbs
 
-        return IconScoreSubDatabase(self.address, self, prefix)
+        with self._sub_db_lock:
+            sub_db: Optional['IconScoreSubDatabase'] = sub_dbs.get(prefix)
+            if sub_db is None:
+                sub_db = IconScoreSubDatabase(self.address, self, prefix)
+                sub_dbs[prefix] = sub_db
+                if len(sub_dbs) > _MAX_SUB_DB_CACHE_SIZE:
+                    sub_dbs.popitem(last=False)
+            else:
+                sub_dbs.move_to_end(prefix)
+
+        return sub_db
 
     def delete(self, key: bytes):
         """
@@ -466,7 +789,7 @@ class IconScoreDatabase(ContextGetter):
         :return: key bytes
         """
 
-        return b'|'.join((self._prefix_hash_key, key))
+        return self._key_prefix + key
 
     def _validate_ownership(self):
         """Prevent a SCORE from accessing the database of another SCORE
@@ -492,6 +815,7 @@ class IconScoreSubDatabase(object):
         self._score_db = score_db
 
         self._prefix_hash_key: bytes = self._make_prefix_hash_key()
+        self._key_prefix: bytes = self._prefix_hash_key + b'|'
 
     def _make_prefix_hash_key(self) -> bytes:
         data = []
@@ -509,6 +833,15 @@ class IconScoreSubDatabase(object):
         hashed_key = self._hash_key(key)
         return self._score_db.get(hashed_key)
 
+    def iter_values(self, keys: List[bytes]) -> Iterator[Optional[bytes]]:
+        """
+        Yields the value for each of the specified keys as get() returns
+
+        :param keys: keys to retrieve
+        :return: values in the order of keys
+        """
+        return self._score_db.iter_values([self._hash_key(key) for key in keys])
+
     def put(self, key: bytes, value: bytes):
         """
         Sets a value for the specified key.
@@ -529,10 +862,7 @@ class IconScoreSubDatabase(object):
         if prefix is None:
             raise InvalidParamsException("Invalid prefix")
 
-        if self._prefix is not None:
-            prefix = b'|'.join((self._prefix, prefix))
-
-        return IconScoreSubDatabase(self.address, self._score_db, prefix)
+        return self._score_db._get_cached_sub_db(b'|'.join((self._prefix, prefix)))
 
     def delete(self, key: bytes):
         """
@@ -554,4 +884,4 @@ class IconScoreSubDatabase(object):
         :return: key bytes
         """
 
-        return b'|'.join((self._prefix_hash_key, key))
+        return self._key_prefix + key
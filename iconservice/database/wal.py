@@ -24,7 +24,9 @@ __all__ = (
     "WriteAheadLogWriter", "WriteAheadLogReader", "WALogable", "StateWAL", "IissWAL", "WALState", "WALDBType"
 )
 
+import mmap
 import struct
+import zlib
 from abc import ABCMeta
 from typing import Optional, Tuple, Iterable, List
 import os
@@ -42,7 +44,9 @@ from ..database.batch import BlockBatch, TransactionBatchValue
 
 TAG = "WAL"
 _MAGIC_KEY = b"IWAL"
-_FILE_VERSION = 1
+_FILE_VERSION = 2
+# Version 1 is still readable to use the backup files written before
+_SUPPORTED_FILE_VERSIONS = (1, _FILE_VERSION)
 _HEADER_SIZE = 52
 _HEADER_STRUCT_FORMAT = ">4sIII32sI"
 
@@ -55,6 +59,12 @@ _OFFSET_INSTANT_BLOCK_HASH = _OFFSET_STATE + 4
 _OFFSET_LOG_COUNT = _OFFSET_INSTANT_BLOCK_HASH + 32
 _OFFSET_LOG_START_OFFSETS = _OFFSET_LOG_COUNT + 4
 
+# RECORD (version 2): | key size(4) | value size(4) | key | value | crc32(4) |
+_RECORD_HEADER = struct.Struct(">II")
+_RECORD_CRC = struct.Struct(">I")
+# The value size of a record whose value is None
+_NONE_VALUE_SIZE = 0xFFFFFFFF
+
 
 class WALDBType(Enum):
     RC = 0
@@ -62,6 +72,15 @@ class WALDBType(Enum):
 
 
 class WALState(Flag):
+    """The steps done on commit, which are added to the WAL file in the order below
+
+    Without ConfigKey.ASYNC_COMMIT: WRITE_RC_DB, WRITE_STATE_DB, SEND_COMMIT_BLOCK, SEND_CALCULATE
+    With ConfigKey.ASYNC_COMMIT: WRITE_RC_DB, SEND_COMMIT_BLOCK, SEND_CALCULATE, WRITE_STATE_DB
+
+    On restart, rc_db and state_db are recovered with the WAL file unless their flags are on
+    and COMMIT_BLOCK is sent to the reward calculator unless SEND_COMMIT_BLOCK is on.
+    Each step is checked on its own, so a process stopped between any two steps is recovered in either order.
+    """
     CALC_PERIOD_START_BLOCK = auto()
     # Write WAL to rc_db
     WRITE_RC_DB = auto()
@@ -162,9 +181,11 @@ class WriteAheadLogWriter(object):
 
     | magic_key(4) | version(4) | revision(4) | state(4) | instant_block_hash(32) |
     | data count(4) | log start address_0 (4) | log start address_1 (4) | ...
-    | block data size(4) | block data | size(4) | data | size(4) | data | ...
+    | block data size(4) | block data | size(4) | records | size(4) | records | ...
 
     Every number is written in big endian format
+    Each record has its own crc32 to detect a torn write (See _RECORD_HEADER)
+    Records are only appended to the end of file. The header is the only part to be overwritten
     """
 
     def __init__(self, revision: int, max_log_count: int, block: 'Block', instant_block_hash: bytes):
@@ -237,32 +258,42 @@ class WriteAheadLogWriter(object):
         return ret
 
     def write_walogable(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> int:
-        self._fp.seek(0, 2)
-        start_offset: int = self._fp.tell()
-
-        size = 0
-        self._write_uint32(size)
+        # Reserve the room for the data size
+        buf = bytearray(4)
 
         for key, value in it:
-            size += self._write_key_value(key, value)
+            self._append_record(buf, key, value)
 
-        # Return to the WALogable start offset, writing its data size
-        self._fp.seek(-size - 4, 1)
-        self._write_uint32(size)
+        size: int = len(buf) - 4
+        buf[:4] = _uint32_to_bytes(size)
+
+        # Write a WALogable at once
+        self._fp.seek(0, 2)
+        start_offset: int = self._fp.tell()
+        ret: int = self._fp.write(buf)
+        assert ret == len(buf)
 
         self._write_log_start_offset(self._log_count, start_offset)
         self._write_log_count()
 
         return size
 
-    def _write_key_value(self, key: bytes, value: bytes) -> int:
+    @staticmethod
+    def _append_record(buf: bytearray, key: bytes, value: Optional[bytes]):
         assert isinstance(key, bytes)
 
-        data: bytes = msgpack.packb([key, value])
-        size = self._fp.write(data)
-        assert size == len(data)
+        value_size: int = _NONE_VALUE_SIZE if value is None else len(value)
+        header: bytes = _RECORD_HEADER.pack(len(key), value_size)
 
-        return size
+        crc: int = zlib.crc32(key, zlib.crc32(header))
+        buf += header
+        buf += key
+
+        if value is not None:
+            crc = zlib.crc32(value, crc)
+            buf += value
+
+        buf += _RECORD_CRC.pack(crc)
 
     def write_state(self, state: int, add: bool = False):
         offset = _OFFSET_STATE
@@ -312,6 +343,8 @@ class WriteAheadLogReader(object):
         self._block: Optional['Block'] = None
 
         self._fp = None
+        # Used to read records in version 2
+        self._mm: Optional[mmap.mmap] = None
 
     @property
     def magic_key(self) -> Optional[bytes]:
@@ -349,11 +382,30 @@ class WriteAheadLogReader(object):
                f"block={self._block}"
 
     def open(self, path: str):
+        """Open a WAL file
+
+        All records are verified with their crc32 on version 2
+        IllegalFormatException is raised if the file is incomplete or broken
+
+        :param path: the path of WAL file
+        """
         self._fp = open(path, "rb")
-        self._read_header()
-        self._read_block()
+        try:
+            self._read_header()
+            self._read_block()
+
+            if self._version >= 2:
+                self._mm = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+                self._verify_records()
+        except:
+            self.close()
+            raise
 
     def close(self):
+        if self._mm:
+            self._mm.close()
+            self._mm = None
+
         if self._fp:
             self._fp.close()
             self._fp = None
@@ -368,9 +420,9 @@ class WriteAheadLogReader(object):
         if magic_key != _MAGIC_KEY:
             raise IllegalFormatException(f"Invalid magic key: {bytes_to_hex(data)}")
 
-        if version != _FILE_VERSION:
+        if version not in _SUPPORTED_FILE_VERSIONS:
             raise IllegalFormatException(
-                f"Invalid version: Actual({version}) != Expected({_FILE_VERSION})")
+                f"Invalid version: Actual({version}) not in Expected({_SUPPORTED_FILE_VERSIONS})")
 
         self._magic_key = magic_key
         self._version = version
@@ -398,7 +450,81 @@ class WriteAheadLogReader(object):
 
         return _bytes_to_uint32(data)
 
+    def _get_log_range(self, index: int) -> Tuple[int, int]:
+        """Returns the range of records in a WALogable on version 2
+
+        :param index: WALogable index
+        :return: (start offset, end offset)
+        """
+        offset: int = self._log_start_offsets[index]
+        start: int = offset + 4
+        if start > len(self._mm):
+            raise IllegalFormatException(f"Out of data: offset={offset}")
+
+        size: int = _bytes_to_uint32(self._mm[offset:start])
+        end: int = start + size
+        if end > len(self._mm):
+            raise IllegalFormatException(f"Out of data: size={size} file_size={len(self._mm)}")
+
+        return start, end
+
+    def _verify_records(self):
+        mm = self._mm
+
+        with memoryview(mm) as view:
+            for index in range(self._log_count):
+                offset, end = self._get_log_range(index)
+
+                while offset < end:
+                    if offset + _RECORD_HEADER.size > end:
+                        raise IllegalFormatException(f"Broken record header: offset={offset}")
+
+                    key_size, value_size = _RECORD_HEADER.unpack_from(mm, offset)
+                    if value_size == _NONE_VALUE_SIZE:
+                        value_size = 0
+
+                    crc_offset: int = offset + _RECORD_HEADER.size + key_size + value_size
+                    if crc_offset + _RECORD_CRC.size > end:
+                        raise IllegalFormatException(f"Broken record: offset={offset}")
+
+                    crc: int = _RECORD_CRC.unpack_from(mm, crc_offset)[0]
+                    if crc != zlib.crc32(view[offset:crc_offset]):
+                        raise IllegalFormatException(f"CRC mismatch: offset={offset}")
+
+                    offset = crc_offset + _RECORD_CRC.size
+
     def get_iterator(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
+        if self._version >= 2:
+            return self._get_record_iterator(index)
+        else:
+            return self._get_msgpack_iterator(index)
+
+    def _get_record_iterator(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
+        """Records have already been verified on open()
+        A key and a value are copied from the mapped file only when they are handed over
+
+        :param index: WALogable index
+        """
+        mm = self._mm
+        offset, end = self._get_log_range(index)
+
+        while offset < end:
+            key_size, value_size = _RECORD_HEADER.unpack_from(mm, offset)
+            offset += _RECORD_HEADER.size
+
+            key: bytes = mm[offset:offset + key_size]
+            offset += key_size
+
+            if value_size == _NONE_VALUE_SIZE:
+                value = None
+            else:
+                value: bytes = mm[offset:offset + value_size]
+                offset += value_size
+
+            offset += _RECORD_CRC.size
+            yield key, value
+
+    def _get_msgpack_iterator(self, index: int) -> Iterable[Tuple[bytes, Optional[bytes]]]:
         self._seek_to_log_start_offset(index)
         size: int = self._read_uint32()
 
@@ -22,7 +22,8 @@ from .icon_constant import (
     ConfigKey, TERM_PERIOD, IISS_DAY_BLOCK, PREP_MAIN_PREPS,
     PREP_MAIN_AND_SUB_PREPS, PENALTY_GRACE_PERIOD, LOW_PRODUCTIVITY_PENALTY_THRESHOLD,
     BLOCK_VALIDATION_PENALTY_THRESHOLD, BACKUP_FILES, BLOCK_INVOKE_TIMEOUT_S,
-    IISS_INITIAL_IREP, PREP_REGISTRATION_FEE, UNSTAKE_SLOT_MAX)
+    IISS_INITIAL_IREP, PREP_REGISTRATION_FEE, UNSTAKE_SLOT_MAX, ACCOUNT_PART_CACHE_SIZE, SCORE_WARM_UP_COUNT,
+    DB_LRU_CACHE_SIZE, DB_BLOOM_FILTER_BITS, DB_WRITE_BUFFER_SIZE, DB_MAX_OPEN_FILES, DB_BLOCK_SIZE, DB_COMPRESSION)
 
 _TAG = "CFG"
 ConfigValue = Union[bool, dict, float, int, str]
@@ -77,6 +78,23 @@ default_icon_config = {
     ConfigKey.BLOCK_INVOKE_TIMEOUT: BLOCK_INVOKE_TIMEOUT_S,
     ConfigKey.TBEARS_MODE: False,
     ConfigKey.UNSTAKE_SLOT_MAX: UNSTAKE_SLOT_MAX,
+    ConfigKey.ACCOUNT_PART_CACHE_SIZE: ACCOUNT_PART_CACHE_SIZE,
+    ConfigKey.ASYNC_COMMIT: False,
+    ConfigKey.SCORE_WARM_UP_COUNT: SCORE_WARM_UP_COUNT,
+    ConfigKey.THREAD_POOL_SIZE: {
+        ConfigKey.THREAD_POOL_SIZE_QUERY: 1,
+        ConfigKey.THREAD_POOL_SIZE_STATUS: 1,
+        ConfigKey.THREAD_POOL_SIZE_ESTIMATE: 1,
+        ConfigKey.THREAD_POOL_SIZE_VALIDATE: 1,
+    },
+    ConfigKey.DB_OPTIONS: {
+        ConfigKey.DB_LRU_CACHE_SIZE: DB_LRU_CACHE_SIZE,
+        ConfigKey.DB_BLOOM_FILTER_BITS: DB_BLOOM_FILTER_BITS,
+        ConfigKey.DB_WRITE_BUFFER_SIZE: DB_WRITE_BUFFER_SIZE,
+        ConfigKey.DB_MAX_OPEN_FILES: DB_MAX_OPEN_FILES,
+        ConfigKey.DB_BLOCK_SIZE: DB_BLOCK_SIZE,
+        ConfigKey.DB_COMPRESSION: DB_COMPRESSION,
+    },
 }
 
 
@@ -139,7 +139,9 @@ class Revision(Enum):
 
     FIX_BALANCE_BUG = 11
 
-    LATEST = 11
+    SEPARATE_PREP_BLOCK_STATISTICS = 12
+
+    LATEST = 12
 
 
 RC_DB_VERSION_0 = 0
@@ -224,6 +226,32 @@ class ConfigKey:
 
     UNSTAKE_SLOT_MAX = "unstakeSlotMax"
 
+    # The maximum number of accounts whose committed parts are cached on invoke
+    ACCOUNT_PART_CACHE_SIZE = "accountPartCacheSize"
+
+    # Write states to state_db on a committer thread once the WAL of a block is durable
+    ASYNC_COMMIT = "asyncCommit"
+
+    # The maximum number of SCOREs used recently to load on a worker thread on startup
+    SCORE_WARM_UP_COUNT = "scoreWarmUpCount"
+
+    # The number of threads handling each kind of readonly request
+    THREAD_POOL_SIZE = "threadPoolSize"
+    THREAD_POOL_SIZE_QUERY = "query"
+    THREAD_POOL_SIZE_STATUS = "status"
+    THREAD_POOL_SIZE_ESTIMATE = "estimate"
+    THREAD_POOL_SIZE_VALIDATE = "validate"
+
+    # LevelDB options for state_db and iiss dbs
+    DB_OPTIONS = "dbOptions"
+    DB_LRU_CACHE_SIZE = "lruCacheSize"
+    DB_BLOOM_FILTER_BITS = "bloomFilterBits"
+    DB_WRITE_BUFFER_SIZE = "writeBufferSize"
+    DB_MAX_OPEN_FILES = "maxOpenFiles"
+    DB_BLOCK_SIZE = "blockSize"
+    # "snappy" or "none"
+    DB_COMPRESSION = "compression"
+
     # The list of items(address, unstake, unstake_block_height)
     # containing invalid expired unstakes to remove
     INVALID_EXPIRED_UNSTAKES_PATH = "invalidExpiredUnstakesPath"
@@ -357,6 +385,21 @@ BACKUP_FILES = 10
 
 BLOCK_INVOKE_TIMEOUT_S = 15
 
+ACCOUNT_PART_CACHE_SIZE = 100_000
+
+SCORE_WARM_UP_COUNT = 1_000
+
+# The maximum number of key-value pairs in a write batch on rollback
+ROLLBACK_WRITE_BATCH_SIZE = 10_000
+
+# LevelDB options: the defaults of LevelDB except for the bloom filter
+DB_LRU_CACHE_SIZE = 8 * 1024 * 1024
+DB_BLOOM_FILTER_BITS = 10
+DB_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+DB_MAX_OPEN_FILES = 1000
+DB_BLOCK_SIZE = 4 * 1024
+DB_COMPRESSION = "snappy"
+
 
 class RCStatus(IntEnum):
     NOT_READY = 0
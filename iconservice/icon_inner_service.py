@@ -26,7 +26,7 @@ from iconservice.base.exception import ExceptionCode, IconServiceBaseException,
     FatalException, ServiceNotReadyException
 from iconservice.base.type_converter import TypeConverter, ParamType
 from iconservice.base.type_converter_templates import ConstantKeys
-from iconservice.icon_constant import EnableThreadFlag, ENABLE_THREAD_FLAG, RPCMethod
+from iconservice.icon_constant import EnableThreadFlag, ENABLE_THREAD_FLAG, RPCMethod, ConfigKey
 from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.utils import check_error_response, to_camel_case, BytesToHexJSONEncoder, bytes_to_hex
 
@@ -49,6 +49,14 @@ QUERY_THREAD_MAPPER = {
     RPCMethod.DEBUG_GET_ACCOUNT: THREAD_QUERY,
 }
 
+# The config keys of the number of threads for readonly requests
+_THREAD_POOL_SIZE_KEYS = {
+    THREAD_STATUS: ConfigKey.THREAD_POOL_SIZE_STATUS,
+    THREAD_QUERY: ConfigKey.THREAD_POOL_SIZE_QUERY,
+    THREAD_ESTIMATE: ConfigKey.THREAD_POOL_SIZE_ESTIMATE,
+    THREAD_VALIDATE: ConfigKey.THREAD_POOL_SIZE_VALIDATE,
+}
+
 _TAG = "MQ"
 
 
@@ -60,13 +68,31 @@ class IconScoreInnerTask(object):
         self._icon_service_engine = IconServiceEngine()
         self._open()
 
-        self._thread_pool = {
-            THREAD_INVOKE: ThreadPoolExecutor(1),
-            THREAD_STATUS: ThreadPoolExecutor(1),
-            THREAD_QUERY: ThreadPoolExecutor(1),
-            THREAD_ESTIMATE: ThreadPoolExecutor(1),
-            THREAD_VALIDATE: ThreadPoolExecutor(1)
-        }
+        self._thread_pool = self._create_thread_pool(conf.get(ConfigKey.THREAD_POOL_SIZE, {}))
+
+    @staticmethod
+    def _create_thread_pool(pool_size: dict) -> dict:
+        """Create a thread pool executor for each kind of request
+
+        Invoke, commit and rollback are processed in order on a single thread.
+        Readonly requests can be processed on several threads
+        because each of them pins the states of the last committed block.
+
+        :param pool_size: the number of threads for each kind of readonly request
+        :return: thread pool executors by thread name
+        """
+        thread_pool = {THREAD_INVOKE: ThreadPoolExecutor(1, thread_name_prefix=THREAD_INVOKE)}
+
+        for thread_name, config_key in _THREAD_POOL_SIZE_KEYS.items():
+            size: int = pool_size.get(config_key, 1)
+            if size < 1:
+                Logger.warning(tag=_TAG, msg=f"Invalid thread pool size: {thread_name}={size}")
+                size = 1
+
+            Logger.info(tag=_TAG, msg=f"Thread pool size: {thread_name}={size}")
+            thread_pool[thread_name] = ThreadPoolExecutor(size, thread_name_prefix=thread_name)
+
+        return thread_pool
 
     def _open(self):
         Logger.info(tag=_TAG, msg="_open() start")
@@ -15,9 +15,11 @@
 
 import os
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from enum import IntEnum
-from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Union, Any
+from threading import Lock
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Union, Any, Iterable
 
 from iconcommons.logger import Logger
 
@@ -27,13 +29,14 @@ from iconservice.rollback.backup_manager import BackupManager
 from iconservice.rollback.rollback_manager import RollbackManager
 from iconservice.score_loader.icon_builtin_score_loader import IconBuiltinScoreLoader
 from iconservice.score_loader.icon_score_class_loader import IconScoreClassLoader
+from iconservice.score_loader.icon_score_warmer import IconScoreWarmer
 from .base.address import Address
 from .base.address import GOVERNANCE_SCORE_ADDRESS
 from .base.address import SYSTEM_SCORE_ADDRESS
 from .base.block import Block
 from .base.exception import (
     ExceptionCode, IconServiceBaseException, IconScoreException, InvalidBaseTransactionException,
-    InternalServiceErrorException, DatabaseException)
+    InternalServiceErrorException, DatabaseException, FatalException)
 from .base.message import Message
 from .base.transaction import Transaction
 from .base.type_converter_templates import ConstantKeys
@@ -83,12 +86,13 @@ from .rollback.metadata import Metadata as RollbackMetadata
 from .utils import print_log_with_level
 from .utils import sha3_256, int_to_bytes, ContextEngine, ContextStorage
 from .utils import to_camel_case, bytes_to_hex
-from .utils.bloom import BloomFilter
+from .utils.bloom import BloomFilter, BloomBuilder
 from .utils.timer import Timer
 
 if TYPE_CHECKING:
     from .iconscore.icon_score_event_log import EventLog
     from .prep.data import Term
+    from .database.db import Snapshot
 
 _TAG = "ISE"
 
@@ -119,6 +123,14 @@ class IconServiceEngine(ContextContainer):
         self._conf: Optional[Dict[str, Union[str, int]]] = None
         self._block_invoke_timeout_s: int = BLOCK_INVOKE_TIMEOUT_S
         self._log_dir: str = "."
+        # Writes the states of a committed block to state_db after its WAL is durable
+        self._committer: Optional[ThreadPoolExecutor] = None
+        self._commit_future: Optional[Future] = None
+        # Readonly contexts are created while no committed states are being applied to engines
+        # so that they pin the engine states and the state_db snapshot of the same block
+        self._commit_lock = Lock()
+        # Loads the SCOREs used recently on a worker thread on startup
+        self._score_warmer: Optional[IconScoreWarmer] = None
 
         # JSON-RPC handlers
         self._handlers = {
@@ -156,6 +168,9 @@ class IconServiceEngine(ContextContainer):
         os.makedirs(rc_data_path, exist_ok=True)
         os.makedirs(backup_root_path, exist_ok=True)
 
+        # Applied to state_db and iiss dbs
+        KeyValueDatabase.set_default_options(self._make_db_options(conf[ConfigKey.DB_OPTIONS]))
+
         # Share one context db with all SCORE
         ContextDatabaseFactory.open(state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
         self._state_db_root_path = state_db_root_path
@@ -213,7 +228,8 @@ class IconServiceEngine(ContextContainer):
                                      conf[ConfigKey.BLOCK_VALIDATION_PENALTY_THRESHOLD],
                                      conf[ConfigKey.IPC_TIMEOUT],
                                      conf[ConfigKey.ICON_RC_DIR_PATH],
-                                     conf[ConfigKey.ICON_RC_MONITOR])
+                                     conf[ConfigKey.ICON_RC_MONITOR],
+                                     conf[ConfigKey.ACCOUNT_PART_CACHE_SIZE])
 
         self._load_builtin_scores(context,
                                   Address.from_string(conf[ConfigKey.BUILTIN_SCORE_OWNER]))
@@ -222,6 +238,12 @@ class IconServiceEngine(ContextContainer):
 
         self._set_block_invoke_timeout(conf)
 
+        if conf[ConfigKey.ASYNC_COMMIT]:
+            self._committer = ThreadPoolExecutor(1, thread_name_prefix="committer")
+
+        self._score_warmer = IconScoreWarmer(score_root_path, conf[ConfigKey.SCORE_WARM_UP_COUNT])
+        self._score_warmer.start()
+
         # DO NOT change the values in conf
         self._conf = conf
         self._precommit_data_writer = PrecommitDataWriter(log_dir)
@@ -270,11 +292,12 @@ class IconServiceEngine(ContextContainer):
                                 block_validation_penalty_threshold: int,
                                 ipc_timeout: int,
                                 icon_rc_path: str,
-                                icon_rc_monitor: bool):
+                                icon_rc_monitor: bool,
+                                account_part_cache_size: int):
         # storages MUST be prepared prior to engines because engines use them on open()
         IconScoreContext.storage.deploy.open(context)
         IconScoreContext.storage.fee.open(context)
-        IconScoreContext.storage.icx.open(context)
+        IconScoreContext.storage.icx.open(context, account_part_cache_size)
         IconScoreContext.storage.iiss.open(context, iiss_meta_data, calc_period)
         IconScoreContext.storage.prep.open(context, prep_reg_fee)
         IconScoreContext.storage.issue.open(context)
@@ -339,6 +362,39 @@ class IconServiceEngine(ContextContainer):
                 make_flag |= flag
         return make_flag
 
+    @staticmethod
+    def _make_db_options(conf: dict) -> dict:
+        """Convert LevelDB options in conf to keyword arguments of plyvel.DB
+
+        :param conf: conf[ConfigKey.DB_OPTIONS]
+        :return: plyvel.DB options
+        """
+        names = {
+            ConfigKey.DB_LRU_CACHE_SIZE: "lru_cache_size",
+            ConfigKey.DB_BLOOM_FILTER_BITS: "bloom_filter_bits",
+            ConfigKey.DB_WRITE_BUFFER_SIZE: "write_buffer_size",
+            ConfigKey.DB_MAX_OPEN_FILES: "max_open_files",
+            ConfigKey.DB_BLOCK_SIZE: "block_size",
+            ConfigKey.DB_COMPRESSION: "compression",
+        }
+
+        options = {}
+        for key, value in conf.items():
+            if key not in names:
+                Logger.warning(tag=_TAG, msg=f"Unknown db option: {key}={value}")
+                continue
+
+            if key == ConfigKey.DB_COMPRESSION and value.lower() == "none":
+                value = None
+            elif key == ConfigKey.DB_BLOOM_FILTER_BITS and value == 0:
+                # The bloom filter is disabled
+                continue
+
+            options[names[key]] = value
+
+        Logger.info(tag=_TAG, msg=f"db options: {options}")
+        return options
+
     def _load_builtin_scores(self, context: 'IconScoreContext', builtin_score_owner: 'Address'):
         context.icon_score_mapper.clear()
 
@@ -357,6 +413,19 @@ class IconServiceEngine(ContextContainer):
         """Free all resources occupied by IconServiceEngine
         including db, memory and so on
         """
+        try:
+            self._wait_for_commit()
+        except BaseException as e:
+            Logger.error(tag=_TAG, msg=f"Failed to write states on commit: {e}")
+
+        if self._committer is not None:
+            self._committer.shutdown()
+            self._committer = None
+
+        if self._score_warmer is not None:
+            self._score_warmer.close()
+            self._score_warmer = None
+
         context = IconScoreContext(IconScoreContextType.DIRECT)
         context.block = self._precommit_data_manager.last_block
         try:
@@ -417,7 +486,8 @@ class IconServiceEngine(ContextContainer):
         context: 'IconScoreContext' = self._context_factory.create(
             IconScoreContextType.INVOKE,
             block=block,
-            prev_block_batches=self._precommit_data_manager.get_block_batches(block.prev_hash))
+            prev_block_overlay=self._precommit_data_manager.get_block_batch_overlay(block.prev_hash))
+        context.bloom_builder = BloomBuilder()
 
         # TODO: prev_block_votes must be support to low version about prev_block_validators by using meta storage.
         prev_block_votes: Optional[List[Tuple['Address', int]]] = \
@@ -520,7 +590,8 @@ class IconServiceEngine(ContextContainer):
                                        rc_state_hash,
                                        added_transactions,
                                        next_preps,
-                                       context.prep_address_converter)
+                                       context.prep_address_converter,
+                                       context.bloom_builder.aggregated_bloom)
         if context.precommitdata_log_flag:
             Logger.info(tag=_TAG,
                         msg=f"Created precommit_data: \n{precommit_data}")
@@ -657,6 +728,8 @@ class IconServiceEngine(ContextContainer):
 
         self._update_productivity(context, prev_block_generator, prev_block_votes)
         self._update_last_generate_block_height(context, prev_block_generator)
+        # Apply the P-Reps updated above at once so that each of them is written once per block
+        context.update_dirty_prep_batch()
 
         context.prep_address_converter.reset_prev_node_address()
 
@@ -767,8 +840,6 @@ class IconServiceEngine(ContextContainer):
             dirty_prep.update_block_statistics(is_validator)
             context.put_dirty_prep(dirty_prep)
 
-        context.update_dirty_prep_batch()
-
     @classmethod
     def _update_last_generate_block_height(cls,
                                            context: 'IconScoreContext',
@@ -788,8 +859,6 @@ class IconServiceEngine(ContextContainer):
         dirty_prep.last_generate_block_height = context.block.height - 1
         context.put_dirty_prep(dirty_prep)
 
-        context.update_dirty_prep_batch()
-
     @staticmethod
     def _check_end_block_height_of_calc(context: 'IconScoreContext') -> bool:
         if context.revision < Revision.IISS.value:
@@ -864,7 +933,7 @@ class IconServiceEngine(ContextContainer):
         tx_result.status = TransactionResult.SUCCESS
         tx_result.event_logs = context.event_logs
         if context.revision >= Revision.ADD_LOGS_BLOOM_ON_BASE_TX.value:
-            tx_result.logs_bloom = self._generate_logs_bloom(context.event_logs)
+            tx_result.logs_bloom = self._generate_logs_bloom(context.event_logs, context.bloom_builder)
         tx_result.traces = context.traces
 
         return tx_result
@@ -1017,19 +1086,22 @@ class IconServiceEngine(ContextContainer):
 
         :return: The amount of step
         """
-        context = self._context_factory.create(IconScoreContextType.ESTIMATION, block=self._get_last_block())
-        context.set_step_counter()
-
         params: dict = request['params']
         data_type: str = params.get('dataType')
         to: Address = params['to']
 
-        if data_type == "deploy" or not to.is_contract:
-            # Calculates simply and estimates step with request data.
-            return self._estimate_step_by_request(request, context)
-        else:
-            # Processes the transaction and estimates step.
-            return self._estimate_step_by_execution(request, context)
+        context = self._create_readonly_context(IconScoreContextType.ESTIMATION)
+        try:
+            context.set_step_counter()
+
+            if data_type == "deploy" or not to.is_contract:
+                # Calculates simply and estimates step with request data.
+                return self._estimate_step_by_request(request, context)
+            else:
+                # Processes the transaction and estimates step.
+                return self._estimate_step_by_execution(request, context)
+        finally:
+            self._release_snapshot(context)
 
     def query(self, method: str, params: dict) -> Any:
         """Process a query message call from outside
@@ -1044,22 +1116,25 @@ class IconServiceEngine(ContextContainer):
         :param params:
         :return: the result of query
         """
-        context: 'IconScoreContext' = self._context_factory.create(
-            IconScoreContextType.QUERY,
-            block=self._get_last_block()
-        )
-
         if params:
             from_: 'Address' = params.get('from', None)
-            context.msg = Message(sender=from_)
             step_limit: Optional[int] = params.get('stepLimit')
         else:
+            from_ = None
             step_limit = None
 
-        context.traces = []
-        context.set_step_counter(step_limit=step_limit)
+        context: 'IconScoreContext' = self._create_readonly_context(IconScoreContextType.QUERY)
+        try:
+            if params:
+                context.msg = Message(sender=from_)
+
+            context.traces = []
+            context.set_step_counter(step_limit=step_limit)
+
+            ret = self._call(context, method, params)
+        finally:
+            self._release_snapshot(context)
 
-        ret = self._call(context, method, params)
         return ret
 
     def validate_transaction(self, request: dict) -> None:
@@ -1084,11 +1159,11 @@ class IconServiceEngine(ContextContainer):
         params: dict = request['params']
         to: 'Address' = params.get('to')
 
-        context = self._context_factory.create(IconScoreContextType.QUERY, self._get_last_block())
-        context.set_step_counter()
+        context = self._create_readonly_context(IconScoreContextType.QUERY)
 
         try:
             self._push_context(context)
+            context.set_step_counter()
 
             step_price: int = context.step_counter.step_price
             minimum_step: int = context.inv_container.step_costs.get(StepType.DEFAULT, 0)
@@ -1107,6 +1182,32 @@ class IconServiceEngine(ContextContainer):
                 IconScoreContextUtil.validate_score_blacklist(context, to)
         finally:
             self._pop_context()
+            self._release_snapshot(context)
+
+    def _create_readonly_context(self, context_type: 'IconScoreContextType') -> 'IconScoreContext':
+        """Create a context pinning the states of the last committed block
+
+        The context is not affected by the blocks committed while it is in use,
+        so readonly requests can run on several threads at the same time.
+        The caller MUST call _release_snapshot() with the context when it is no longer used.
+
+        :param context_type: QUERY or ESTIMATION
+        :return: context
+        """
+        with self._commit_lock:
+            self._wait_for_commit()
+
+            context: 'IconScoreContext' = self._context_factory.create(context_type, block=self._get_last_block())
+            context.snapshot = self._icx_context_db.key_value_db.acquire_snapshot()
+
+        return context
+
+    @staticmethod
+    def _release_snapshot(context: 'IconScoreContext'):
+        snapshot: Optional['Snapshot'] = context.snapshot
+        if snapshot is not None:
+            context.snapshot = None
+            snapshot.release()
 
     def _call(self,
               context: 'IconScoreContext',
@@ -1228,7 +1329,7 @@ class IconServiceEngine(ContextContainer):
             # Finalize tx_result
             tx_result.step_price = final_step_price
             tx_result.event_logs = context.event_logs
-            tx_result.logs_bloom = self._generate_logs_bloom(context.event_logs)
+            tx_result.logs_bloom = self._generate_logs_bloom(context.event_logs, context.bloom_builder)
             tx_result.traces = context.traces
             final_step_used = self._append_step_results(tx_result, context, step_used_details)
 
@@ -1453,21 +1554,25 @@ class IconServiceEngine(ContextContainer):
         )
 
     @staticmethod
-    def _generate_logs_bloom(event_logs: List['EventLog']) -> BloomFilter:
+    def _generate_logs_bloom(event_logs: List['EventLog'],
+                             bloom_builder: Optional['BloomBuilder'] = None) -> BloomFilter:
         """
         Generates the bloom data from the event logs
         :param event_logs: The event logs
+        :param bloom_builder: BloomBuilder shared by the transactions in a block
         :return: Bloom data
         """
-        logs_bloom = BloomFilter()
+        if bloom_builder is None:
+            bloom_builder = BloomBuilder()
+
+        return bloom_builder.build(IconServiceEngine._get_logs_bloom_items(event_logs))
 
+    @staticmethod
+    def _get_logs_bloom_items(event_logs: List['EventLog']) -> Iterable[bytes]:
         for event_log in event_logs:
-            logs_bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+            yield EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address)
             for i, indexed_item in enumerate(event_log.indexed):
-                indexed_bytes = EventLogEmitter.get_ordered_bytes(i, indexed_item)
-                logs_bloom.add(indexed_bytes)
-
-        return logs_bloom
+                yield EventLogEmitter.get_ordered_bytes(i, indexed_item)
 
     @classmethod
     def _handle_icx_get_score_api(cls,
@@ -1520,6 +1625,9 @@ class IconServiceEngine(ContextContainer):
         :param instant_block_hash: instant hash of block being committed
         :param block_hash: hash of block being committed
         """
+        # The WAL file of the previous block is still in use until its states are written
+        self._wait_for_commit()
+
         if instant_block_hash != block_hash:
             # Only a leader node replaces the instant_block_hash with an official block_hash
             self._precommit_data_manager.change_block_hash(
@@ -1541,12 +1649,22 @@ class IconServiceEngine(ContextContainer):
 
     def _commit_before_iiss(self, context: 'IconScoreContext', precommit_data: 'PrecommitData'):
         state_wal: 'StateWAL' = StateWAL(precommit_data.block_batch)
-        self._process_state_commit(context, precommit_data, state_wal)
+        with self._commit_lock:
+            self._process_state_commit(context, precommit_data, state_wal)
 
     def _commit_after_iiss(self,
                            context: 'IconScoreContext',
                            precommit_data: 'PrecommitData',
                            instant_block_hash: bytes):
+        """Write the states of a committed block to rc_db and state_db
+
+        The WAL file and the backup file are written before any db is updated.
+        If ConfigKey.ASYNC_COMMIT is on, only writing state_db and removing the WAL file
+        are done on the committer thread. IPC messages for this block are sent to the reward calculator
+        before this method returns, so they precede the ones sent while invoking the next block.
+        If the process stops before state_db is written, state_db is recovered with the WAL file
+        on restart and COMMIT_BLOCK is not sent again as WALState.SEND_COMMIT_BLOCK is on.
+        """
         # Check if this block is the start block of a calculation period
         start_calc_block_height: int = context.engine.iiss.get_start_block_of_calc(context)
         is_calc_period_start_block: bool = context.block.height == start_calc_block_height
@@ -1570,18 +1688,52 @@ class IconServiceEngine(ContextContainer):
         self._backup_cleaner.run_on_commit(context.block.height)
 
         # Write iiss_wal to rc_db
+        # rc_db should be up-to-date before invoking the next block
         standby_db_info: Optional['RewardCalcDBInfo'] = \
             self._process_iiss_commit(context, precommit_data, iiss_wal, is_calc_period_start_block)
         wal_writer.write_state(WALState.WRITE_RC_DB.value, add=True)
         wal_writer.flush()
 
-        # Write state_wal to state_db
-        self._process_state_commit(context, precommit_data, state_wal)
+        if self._committer is None:
+            with self._commit_lock:
+                self._write_state_db(context, precommit_data, wal_writer, state_wal)
+                context.engine.prep.commit(context, precommit_data)
+                self._apply_state_commit(context, precommit_data)
+
+            # send IPC
+            self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
+            self._close_write_ahead_log(wal_writer)
+            return
+
+        # send IPC before the committer thread uses wal_writer
+        self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
+
+        def flush_state_db():
+            self._write_state_db(context, precommit_data, wal_writer, state_wal)
+            self._close_write_ahead_log(wal_writer)
+
+        with self._commit_lock:
+            # The states of this block are read from its block batch until they are written to state_db
+            context.engine.prep.commit(context, precommit_data)
+            self._apply_state_commit(context, precommit_data, flushed=False)
+            # Readonly contexts wait for this future before pinning the states of this block
+            self._commit_future = self._committer.submit(flush_state_db)
+
+    def _write_state_db(self,
+                        context: 'IconScoreContext',
+                        precommit_data: 'PrecommitData',
+                        wal_writer: 'WriteAheadLogWriter',
+                        state_wal: 'StateWAL'):
+        """Write the states of a committed block to state_db
+
+        It runs on the committer thread if ConfigKey.ASYNC_COMMIT is on
+        """
+        self._icx_context_db.write_batch(context, state_wal)
         wal_writer.write_state(WALState.WRITE_STATE_DB.value, add=True)
         wal_writer.flush()
+        self._precommit_data_manager.release_root_overlay(precommit_data.block)
 
-        # send IPC
-        self._process_ipc(context, wal_writer, precommit_data, standby_db_info, instant_block_hash)
+    def _close_write_ahead_log(self, wal_writer: 'WriteAheadLogWriter'):
         wal_writer.close()
 
         try:
@@ -1589,6 +1741,21 @@ class IconServiceEngine(ContextContainer):
         except BaseException as e:
             Logger.error(tag=_TAG, msg=str(e))
 
+    def _wait_for_commit(self):
+        """Wait until the states of the last committed block are written to state_db
+
+        If the committer thread failed to write them, FatalException is raised on every call
+        so that no more blocks are committed and the service is closed.
+        The WAL file of the block is left to recover state_db on restart.
+        """
+        future: Optional[Future] = self._commit_future
+        if future is None:
+            return
+
+        e: Optional[BaseException] = future.exception()
+        if e is not None:
+            raise FatalException(f"Failed to write states on commit: {e}")
+
     def _process_wal(self, context: 'IconScoreContext',
                      precommit_data: 'PrecommitData',
                      is_calc_period_start_block: bool,
@@ -1633,14 +1800,25 @@ class IconServiceEngine(ContextContainer):
                               context: 'IconScoreContext',
                               precommit_data: 'PrecommitData',
                               state_wal: 'StateWAL'):
+        self._icx_context_db.write_batch(context, state_wal)
+        self._apply_state_commit(context, precommit_data)
+
+    def _apply_state_commit(self,
+                            context: 'IconScoreContext',
+                            precommit_data: 'PrecommitData',
+                            flushed: bool = True):
+        """Apply the states of a committed block to the in-memory objects
+
+        :param flushed: False if the states have not been written to state_db yet
+        """
         new_icon_score_mapper = precommit_data.score_mapper
         if new_icon_score_mapper:
             IconScoreContext.icon_score_mapper.update(new_icon_score_mapper)
 
-        self._icx_context_db.write_batch(context, state_wal)
         context.storage.icx.set_last_block(precommit_data.block_batch.block)
+        context.storage.icx.commit(context, precommit_data)
         context.engine.inv.commit(context, precommit_data)
-        self._precommit_data_manager.commit(precommit_data.block_batch.block)
+        self._precommit_data_manager.commit(precommit_data.block_batch.block, flushed)
 
     @staticmethod
     def _process_iiss_commit(context: 'IconScoreContext',
@@ -1664,7 +1842,6 @@ class IconServiceEngine(ContextContainer):
             calc_end_block_height: int = context.block.height - 1
             standby_db_info: 'RewardCalcDBInfo' = context.storage.rc.replace_db(calc_end_block_height)
 
-        context.engine.prep.commit(context, precommit_data)
         context.storage.rc.commit(iiss_wal)
 
         if is_calc_period_start_block:
@@ -1706,6 +1883,8 @@ class IconServiceEngine(ContextContainer):
         Logger.info(tag=ROLLBACK_LOG_TAG,
                     msg=f"rollback() start: height={block_height} hash={bytes_to_hex(block_hash)}")
 
+        self._wait_for_commit()
+
         last_block: 'Block' = self._get_last_block()
         Logger.info(tag=_TAG, msg=f"last_block={last_block}")
 
@@ -1724,7 +1903,8 @@ class IconServiceEngine(ContextContainer):
 
                 # Do rollback
                 context = self._context_factory.create(IconScoreContextType.DIRECT, block=last_block)
-                self._rollback(context, block_height, block_hash, term_start_block_height)
+                with self._commit_lock:
+                    self._rollback(context, block_height, block_hash, term_start_block_height)
 
                 self._remove_rollback_metadata()
 
@@ -1831,11 +2011,12 @@ class IconServiceEngine(ContextContainer):
         return self._precommit_data_manager.last_block
 
     def inner_call(self, request: dict):
-        context: 'IconScoreContext' = self._context_factory.create(
-            IconScoreContextType.QUERY, block=self._get_last_block()
-        )
+        context: 'IconScoreContext' = self._create_readonly_context(IconScoreContextType.QUERY)
 
-        return inner_call(context, request)
+        try:
+            return inner_call(context, request)
+        finally:
+            self._release_snapshot(context)
 
     def _recover_dbs(self, rc_data_path: str):
         """
@@ -1982,6 +2163,9 @@ class IconServiceEngine(ContextContainer):
             Logger.info(tag=WAL_LOG_TAG, msg="state_db has already been up-to-date")
             return
 
+        # With ConfigKey.ASYNC_COMMIT, IPC messages can have been sent before state_db is written.
+        # They are not sent again in _finish_to_recover_commit()
+
         ret: int = self._icx_context_db.key_value_db.write_batch(reader.get_iterator(WALDBType.STATE.value))
         Logger.info(tag=WAL_LOG_TAG, msg=f"state_db has been updated with wal file: count={ret}")
 
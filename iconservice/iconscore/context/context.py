@@ -26,6 +26,20 @@ if TYPE_CHECKING:
 _thread_local_data = threading.local()
 
 
+class _RecordingContextStack(list):
+    """Context stack which counts how many times the current context is got from it
+    """
+
+    def __init__(self, prev_context_stack: List['IconScoreContext']):
+        super().__init__(prev_context_stack)
+        self.prev_context_stack = prev_context_stack
+        self.access_count = 0
+
+    def __getitem__(self, index):
+        self.access_count += 1
+        return super().__getitem__(index)
+
+
 class ContextContainer(object):
     """ContextContainer mixin
 
@@ -67,6 +81,35 @@ class ContextContainer(object):
     def _clear_context() -> None:
         setattr(_thread_local_data, 'context_stack', None)
 
+    @staticmethod
+    def _start_recording_access() -> '_RecordingContextStack':
+        """Count the accesses to the current context on the current thread
+        until _stop_recording_access() is called
+
+        :return: the recording which is passed to _stop_recording_access()
+        """
+        context_stack: Optional[List['IconScoreContext']] = getattr(_thread_local_data, 'context_stack', None)
+        recording_stack = _RecordingContextStack([] if context_stack is None else context_stack)
+        setattr(_thread_local_data, 'context_stack', recording_stack)
+        return recording_stack
+
+    @staticmethod
+    def _stop_recording_access(recording_stack: '_RecordingContextStack') -> int:
+        """Restore the context stack replaced by _start_recording_access()
+
+        :param recording_stack: the value returned by _start_recording_access()
+        :return: the number of accesses to the current context
+        """
+        prev_context_stack: List['IconScoreContext'] = recording_stack.prev_context_stack
+        if getattr(_thread_local_data, 'context_stack', None) is recording_stack:
+            prev_context_stack[:] = recording_stack
+            setattr(_thread_local_data, 'context_stack', prev_context_stack)
+
+        if isinstance(prev_context_stack, _RecordingContextStack):
+            prev_context_stack.access_count += recording_stack.access_count
+
+        return recording_stack.access_count
+
     @staticmethod
     def _get_context_stack_size() -> int:
         context_stack: List['IconScoreContext'] = getattr(_thread_local_data, 'context_stack', None)
@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TypeVar, Optional, Any, Union, TYPE_CHECKING
+from typing import TypeVar, Optional, Any, Union, TYPE_CHECKING, Callable, Dict, Iterable, List
 
 from iconservice.icon_constant import IconScoreContextType, Revision
 from .context.context import ContextContainer
@@ -32,11 +32,61 @@ ARRAY_DB_ID = b'\x00'
 DICT_DB_ID = b'\x01'
 VAR_DB_ID = b'\x02'
 
+# The number of ArrayDB items read from db at once during iteration
+ARRAY_DB_READ_CHUNK_SIZE = 128
+
 
 def get_encoded_key(key: V) -> bytes:
     return ContainerUtil.encode_key(key)
 
 
+def _encode_str(value: str) -> bytes:
+    return value.encode('utf-8')
+
+
+def _encode_address(value: 'Address') -> bytes:
+    return value.to_bytes()
+
+
+def _encode_bytes(value: bytes) -> bytes:
+    return value
+
+
+def _decode_str(value: bytes) -> str:
+    return value.decode()
+
+
+def _decode_bool(value: bytes) -> bool:
+    return bool(bytes_to_int(value))
+
+
+def _decode_bytes(value: bytes) -> bytes:
+    return value
+
+
+# Encoders for the exact types of keys and values
+# Objects of the other types including subclasses are encoded through isinstance() checks
+_ENCODERS: Dict[type, Callable[[Any], bytes]] = {
+    int: int_to_bytes,
+    bool: int_to_bytes,
+    str: _encode_str,
+    Address: _encode_address,
+    bytes: _encode_bytes,
+}
+
+_DECODERS: Dict[type, Callable[[bytes], Any]] = {
+    int: bytes_to_int,
+    str: _decode_str,
+    Address: Address.from_bytes,
+    bool: _decode_bool,
+    bytes: _decode_bytes,
+}
+
+# Encoders and decoders which ContainerUtil has resolved from value types
+_value_encoders: Dict[type, Callable[[V], bytes]] = {}
+_value_decoders: Dict[type, Callable[[Optional[bytes]], Optional[V]]] = {}
+
+
 class ContainerUtil(object):
 
     @classmethod
@@ -65,6 +115,10 @@ class ContainerUtil(object):
         :param key:
         :return:
         """
+        encode = _ENCODERS.get(type(key))
+        if encode is not None:
+            return encode(key)
+
         if key is None:
             raise InvalidParamsException('key is None')
 
@@ -82,6 +136,10 @@ class ContainerUtil(object):
 
     @classmethod
     def encode_value(cls, value: V) -> bytes:
+        encode = _ENCODERS.get(type(value))
+        if encode is not None:
+            return encode(value)
+
         if isinstance(value, int):
             byte_value = int_to_bytes(value)
         elif isinstance(value, str):
@@ -98,21 +156,74 @@ class ContainerUtil(object):
 
     @classmethod
     def decode_object(cls, value: bytes, value_type: type) -> Optional[Union[K, V]]:
-        if value is None:
-            return get_default_value(value_type)
-
-        obj_value = None
-        if value_type == int:
-            obj_value = bytes_to_int(value)
-        elif value_type == str:
-            obj_value = value.decode()
-        elif value_type == Address:
-            obj_value = Address.from_bytes(value)
-        if value_type == bool:
-            obj_value = bool(bytes_to_int(value))
-        elif value_type == bytes:
-            obj_value = value
-        return obj_value
+        return cls.get_decoder(value_type)(value)
+
+    @classmethod
+    def decode_objects(cls, values: Iterable[Optional[bytes]], value_type: type) -> List[Optional[V]]:
+        """Decode values of the same type in one pass
+
+        :param values: values read from db
+        :param value_type: the type of values
+        :return: decoded values
+        """
+        decode = cls.get_decoder(value_type)
+        return [decode(value) for value in values]
+
+    @classmethod
+    def get_encoder(cls, value_type: type) -> Callable[[V], bytes]:
+        """Returns the function which encodes values of value_type like encode_value()
+
+        Containers resolve it once on construction instead of checking the type of each value
+
+        :param value_type: the type of values
+        :return: encoder
+        """
+        encoder = _value_encoders.get(value_type)
+        if encoder is None:
+            encoder = _value_encoders[value_type] = cls._make_encoder(value_type)
+        return encoder
+
+    @classmethod
+    def get_decoder(cls, value_type: type) -> Callable[[Optional[bytes]], Optional[V]]:
+        """Returns the function which decodes values read from db like decode_object()
+
+        :param value_type: the type of values
+        :return: decoder which returns the default value of value_type for None
+        """
+        decoder = _value_decoders.get(value_type)
+        if decoder is None:
+            decoder = _value_decoders[value_type] = cls._make_decoder(value_type)
+        return decoder
+
+    @classmethod
+    def _make_encoder(cls, value_type: type) -> Callable[[V], bytes]:
+        encode = _ENCODERS.get(value_type)
+        if encode is None:
+            return cls.encode_value
+
+        encode_value = cls.encode_value
+
+        def _encoder(value: V) -> bytes:
+            # A value is encoded according to its own type which can differ from value_type
+            if type(value) is value_type:
+                return encode(value)
+            return encode_value(value)
+
+        return _encoder
+
+    @classmethod
+    def _make_decoder(cls, value_type: type) -> Callable[[Optional[bytes]], Optional[V]]:
+        decode = _DECODERS.get(value_type)
+        default_value = get_default_value(value_type)
+
+        if decode is None:
+            def _decoder(value: Optional[bytes]) -> None:
+                return default_value if value is None else None
+        else:
+            def _decoder(value: Optional[bytes]) -> Optional[V]:
+                return default_value if value is None else decode(value)
+
+        return _decoder
 
     @classmethod
     def remove_prefix_from_iters(cls, iter_items: iter) -> iter:
@@ -138,8 +249,6 @@ class ContainerUtil(object):
             sub_db = sub_db.get_sub_db(cls.encode_key(arg))
 
         byte_key = sub_db.get(cls.encode_key(last_arg))
-        if byte_key is None:
-            return get_default_value(value_type)
         return cls.decode_object(byte_key, value_type)
 
     @classmethod
@@ -177,6 +286,8 @@ class DictDB(object):
 
         self.__value_type = value_type
         self.__depth = depth
+        self.__encode_value = ContainerUtil.get_encoder(value_type)
+        self.__decode_object = ContainerUtil.get_decoder(value_type)
 
     def remove(self, key: K) -> None:
         """
@@ -191,17 +302,30 @@ class DictDB(object):
             raise InvalidContainerAccessException('DictDB depth mismatch')
 
         encoded_key: bytes = get_encoded_key(key)
-        encoded_value: bytes = ContainerUtil.encode_value(value)
+        encoded_value: bytes = self.__encode_value(value)
 
         self._db.put(encoded_key, encoded_value)
 
     def __getitem__(self, key: K) -> Any:
         if self.__depth == 1:
             encoded_key: bytes = get_encoded_key(key)
-            return ContainerUtil.decode_object(self._db.get(encoded_key), self.__value_type)
+            return self.__decode_object(self._db.get(encoded_key))
         else:
             return DictDB(key, self._db, self.__value_type, self.__depth - 1)
 
+    def get_values(self, keys: Iterable[K]) -> List[V]:
+        """
+        Gets the values of given keys in order
+
+        :param keys: keys
+        :return: values of the keys
+        """
+        if self.__depth != 1:
+            raise InvalidContainerAccessException('DictDB depth mismatch')
+
+        db = self._db
+        return [self.__decode_object(db.get(get_encoded_key(key))) for key in keys]
+
     def __delitem__(self, key: K):
         self.__remove(key)
 
@@ -235,6 +359,7 @@ class ArrayDB(object):
         prefix: bytes = ContainerUtil.create_db_prefix(type(self), var_key)
         self._db = db.get_sub_db(prefix)
         self.__value_type = value_type
+        self.__encode_value = ContainerUtil.get_encoder(value_type)
         self.__legacy_size = self.__get_size_from_db()
 
     def put(self, value: V) -> None:
@@ -259,7 +384,7 @@ class ArrayDB(object):
 
         index = size - 1
         last_val = self[index]
-        self._db.delete(get_encoded_key(index))
+        self._db.delete(int_to_bytes(index))
         self.__set_size(index)
         return last_val
 
@@ -279,16 +404,17 @@ class ArrayDB(object):
             return self.__get_size_from_db()
 
     def __get_size_from_db(self) -> int:
-        return ContainerUtil.decode_object(self._db.get(self.__SIZE_BYTE_KEY), int)
+        byte_value: Optional[bytes] = self._db.get(self.__SIZE_BYTE_KEY)
+        return 0 if byte_value is None else bytes_to_int(byte_value)
 
     def __set_size(self, size: int) -> None:
         self.__legacy_size = size
-        byte_value = ContainerUtil.encode_value(size)
+        byte_value = int_to_bytes(size)
         self._db.put(self.__SIZE_BYTE_KEY, byte_value)
 
     def __put(self, index: int, value: V) -> None:
-        byte_value = ContainerUtil.encode_value(value)
-        self._db.put(get_encoded_key(index), byte_value)
+        byte_value = self.__encode_value(value)
+        self._db.put(int_to_bytes(index), byte_value)
 
     def __iter__(self):
         return self._get_generator(self._db, self.__get_size(), self.__value_type)
@@ -336,15 +462,20 @@ class ArrayDB(object):
             index += size
 
         if 0 <= index < size:
-            key: bytes = get_encoded_key(index)
+            key: bytes = int_to_bytes(index)
             return ContainerUtil.decode_object(db.get(key), value_type)
 
         raise InvalidParamsException('ArrayDB out of index')
 
     @classmethod
     def _get_generator(cls, db: Union['IconScoreDatabase', 'IconScoreSubDatabase'], size: int, value_type: type):
-        for index in range(size):
-            yield cls._get(db, size, index, value_type)
+        decode = ContainerUtil.get_decoder(value_type)
+
+        # Items are read by chunk not to read all of them when the iteration stops in the middle
+        for start in range(0, size, ARRAY_DB_READ_CHUNK_SIZE):
+            keys = [int_to_bytes(index) for index in range(start, min(start + ARRAY_DB_READ_CHUNK_SIZE, size))]
+            for value in db.iter_values(keys):
+                yield decode(value)
 
 
 class VarDB(object):
@@ -361,6 +492,8 @@ class VarDB(object):
         self._db = db.get_sub_db(VAR_DB_ID)
         self.__var_byte_key = get_encoded_key(var_key)
         self.__value_type = value_type
+        self.__encode_value = ContainerUtil.get_encoder(value_type)
+        self.__decode_object = ContainerUtil.get_decoder(value_type)
 
     def set(self, value: V) -> None:
         """
@@ -368,7 +501,7 @@ class VarDB(object):
 
         :param value: a value to be set
         """
-        byte_value = ContainerUtil.encode_value(value)
+        byte_value = self.__encode_value(value)
         self._db.put(self.__var_byte_key, byte_value)
 
     def get(self) -> Optional[V]:
@@ -377,7 +510,7 @@ class VarDB(object):
 
         :return: value of the var db
         """
-        return ContainerUtil.decode_object(self._db.get(self.__var_byte_key), self.__value_type)
+        return self.__decode_object(self._db.get(self.__var_byte_key))
 
     def remove(self) -> None:
         """
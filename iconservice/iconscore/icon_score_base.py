@@ -18,7 +18,7 @@ import warnings
 from abc import abstractmethod, ABC, ABCMeta
 from functools import partial, wraps
 from inspect import isfunction, signature, Parameter
-from typing import TYPE_CHECKING, Callable, Any, List, Tuple, Mapping
+from typing import TYPE_CHECKING, Callable, Any, List, Tuple, Mapping, Optional
 
 from .context.context import ContextGetter, ContextContainer
 from .icon_score_base2 import InterfaceScore, revert, Block
@@ -387,7 +387,6 @@ class IconScoreBase(IconScoreObject, ContextGetter,
         self.__db = db
         self.__address = db.address
         self.__owner = IconScoreContextUtil.get_owner(self._context, self.__address)
-        self.__icx = None
 
         elements: ScoreElementMetadataContainer = self.__get_score_element_metadatas()
         if elements.externals == 0:
@@ -618,13 +617,15 @@ class IconScoreBase(IconScoreObject, ContextGetter,
 
         :return: :class:`.Icx` instance of icx
         """
-        if self.__icx is None:
-            self.__icx = Icx(self._context, self.__address)
-        else:
-            # Should update a new context in icx for every tx
-            self.__icx._context = self._context
+        # A SCORE instance is shared by the invoke and query threads
+        # so an Icx instance is cached in the context of the current thread
+        context: 'IconScoreContext' = self._context
+        icx: Optional['Icx'] = context.icx_objects.get(self.__address)
+        if icx is None:
+            icx = Icx(context, self.__address)
+            context.icx_objects[self.__address] = icx
 
-        return self.__icx
+        return icx
 
     @property
     def block_height(self) -> int:
@@ -17,7 +17,7 @@
 import warnings
 from abc import ABC
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Optional, List, Iterable
+from typing import TYPE_CHECKING, Optional, List, Iterable, Dict
 
 from iconcommons.logger import Logger
 
@@ -38,13 +38,16 @@ from ..icx.issue.regulator import Regulator
 if TYPE_CHECKING:
     from .icon_score_base import IconScoreBase
     from .icon_score_event_log import EventLog
+    from .icx import Icx
 
     from ..base.address import Address
     from ..prep.data import PRep, PRepContainer, Term
     from ..utils import ContextEngine, ContextStorage
     from ..prep.prep_address_converter import PRepAddressConverter
     from ..inv.container import Container as INVContainer
-    from ..database.batch import Batch
+    from ..database.batch import Batch, BlockBatchOverlay
+    from ..database.db import Snapshot
+    from ..utils.bloom import BloomBuilder
 
 
 class IconScoreContext(ABC):
@@ -88,16 +91,21 @@ class IconScoreContext(ABC):
         self.block_batch: Optional['BlockBatch'] = None
         self.tx_batch: Optional['TransactionBatch'] = None
         # For 2-depth block invocation
-        self._prev_block_batches: Optional[List['BlockBatch']] = \
-            [] if context_type == IconScoreContextType.INVOKE else None
+        self._prev_block_overlay: Optional['BlockBatchOverlay'] = None
+        # Readonly contexts read the states of the last committed block from this snapshot
+        self.snapshot: Optional['Snapshot'] = None
         self.rc_block_batch: list = []
         self.rc_tx_batch: list = []
         self.new_icon_score_mapper: Optional['IconScoreMapper'] = None
         self.cumulative_step_used: int = 0
         self.event_logs: Optional[List['EventLog']] = None
         self.traces: Optional[List['Trace']] = None
+        # Builds the logs blooms of the transactions in a block on invoke
+        self.bloom_builder: Optional['BloomBuilder'] = None
         self.fee_sharing_proportion = 0  # The proportion of fee by SCORE in percent (0-100)
         self.step_counter: Optional['IconScoreStepCounter'] = None
+        # SCORE address -> Icx bound to this context
+        self.icx_objects: Dict['Address', 'Icx'] = {}
 
         self.msg_stack = []
         self.event_log_stack = []
@@ -160,19 +168,22 @@ class IconScoreContext(ABC):
 
         return old.revision_code != new.revision_code and new.revision_code == target_rev
 
+    @property
+    def prev_block_overlay(self) -> Optional['BlockBatchOverlay']:
+        return self._prev_block_overlay
+
     def get_batches(self) -> Iterable['Batch']:
         """Used to support 2-depth block invocation
         It is called in ContextDatabase.get_from_batch() on estimation or invoke
 
-        Searching order: tx_batch -> block_batch -> prev_block_batch -> state_db
+        Searching order: tx_batch -> block_batch -> prev_block_overlay -> state_db
         """
         yield self.tx_batch
         yield self.block_batch
 
-        # If contex.type is not INVOKE, self._prev_block_batches is None
-        if self._prev_block_batches:
-            for prev_block_batch in self._prev_block_batches:
-                yield prev_block_batch
+        # If contex.type is not INVOKE, self._prev_block_overlay is None
+        if self._prev_block_overlay is not None:
+            yield self._prev_block_overlay
 
     def is_decentralized(self) -> bool:
         return self._term is not None
@@ -371,7 +382,7 @@ class IconScoreContextFactory(object):
     def create(self,
                context_type: 'IconScoreContextType',
                block: 'Block',
-               prev_block_batches: Iterable['Batch'] = None):
+               prev_block_overlay: Optional['BlockBatchOverlay'] = None):
         context: 'IconScoreContext' = self._create_context(context_type)
         context.block = block
 
@@ -379,8 +390,8 @@ class IconScoreContextFactory(object):
             return context
 
         # For 2-depth block invocation
-        if prev_block_batches:
-            context._prev_block_batches = [batch for batch in prev_block_batches]
+        if context_type == IconScoreContextType.INVOKE:
+            context._prev_block_overlay = prev_block_overlay
         self._set_context_attributes_for_processing_tx(context)
         return context
 
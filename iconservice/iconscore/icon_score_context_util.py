@@ -14,12 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import warnings
 from typing import TYPE_CHECKING, Optional, Tuple
 
 from iconservice.score_loader.icon_score_class_loader import IconScoreClassLoader
 from .icon_score_mapper_object import IconScoreInfo
-from .score_package_validator import ScorePackageValidator
+from .score_package_validator import ScorePackageValidator, VALIDATION_CACHE_DIR
 from .utils import get_package_name_by_address_and_tx_hash, get_score_deploy_path
 from ..base.address import Address
 from ..base.address import SYSTEM_SCORE_ADDRESS
@@ -89,10 +90,31 @@ class IconScoreContextUtil(object):
         if score_info is None:
             return None
 
-        # Create a SCORE instance every time
+        # Create a SCORE instance every time or reuse one whose members have never been changed
         # to prevent consensus failure by using wrong member variables in SCORE
         return score_info.get_score(context.revision)
 
+    @staticmethod
+    def release_icon_score(context: 'IconScoreContext', score: 'IconScoreBase'):
+        """Return a SCORE instance got from get_icon_score() to be reused
+
+        :param context:
+        :param score: SCORE instance which is no longer used
+        """
+        address: 'Address' = score.address
+        score_info: Optional['IconScoreInfo'] = None
+
+        if context.type == IconScoreContextType.INVOKE and context.new_icon_score_mapper is not None:
+            score_info = context.new_icon_score_mapper.get(address)
+
+        if score_info is None:
+            if context.icon_score_mapper is None:
+                return
+            score_info = context.icon_score_mapper.get(address)
+
+        if score_info is not None:
+            score_info.release_score(score)
+
     @staticmethod
     def get_score_info(context: 'IconScoreContext', address: 'Address') -> Optional['IconScoreInfo']:
         """Returns the score_info associated with the currently active score
@@ -159,7 +181,8 @@ class IconScoreContextUtil(object):
         if is_builtin_score(str(address)):
             import_whitelist.update(BUILTIN_SCORE_IMPORT_WHITE_LIST)
 
-        ScorePackageValidator.execute(import_whitelist, score_deploy_path, score_package_name)
+        cache_path: str = os.path.join(context.score_root_path, VALIDATION_CACHE_DIR)
+        ScorePackageValidator.execute(import_whitelist, score_deploy_path, score_package_name, cache_path)
 
     @staticmethod
     def validate_score_blacklist(context: 'IconScoreContext', score_address: 'Address') -> None:
@@ -16,24 +16,66 @@
 """IconScoreEngine module
 """
 
+from collections import OrderedDict
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Dict
 
 from .icon_score_constant import STR_FALLBACK, ATTR_SCORE_GET_API, ATTR_SCORE_CALL
 from .icon_score_context import IconScoreContext
 from .icon_score_context_util import IconScoreContextUtil
-from .typing.conversion import convert_score_parameters, ConvertOption
+from .typing.conversion import ConvertOption
 from .typing.element import (
     ScoreElementMetadata,
     get_score_element_metadata,
 )
-from ..base.address import Address, SYSTEM_SCORE_ADDRESS
+from ..base.address import Address, MalformedAddress, SYSTEM_SCORE_ADDRESS
 from ..base.exception import ScoreNotFoundException, InvalidParamsException
 from ..icon_constant import Revision
 
 if TYPE_CHECKING:
     from ..iconscore.icon_score_base import IconScoreBase
 
+# Objects of these types in a result are shared with its copy as they cannot be changed
+_IMMUTABLE_RESULT_TYPES = frozenset((int, bool, str, bytes, float, type(None), Address, MalformedAddress))
+
+
+def copy_result(value: Any) -> Any:
+    """Returns a copy of the return value of a SCORE method as deepcopy() does
+
+    Only dicts and lists are copied, and immutable objects are shared with the copy.
+    The other objects are copied with deepcopy().
+    The same object in the value is copied once like deepcopy().
+
+    :param value: the return value of a SCORE method
+    :return: the copy which the SCORE cannot change
+    """
+    return _copy_result(value, {})
+
+
+def _copy_result(value: Any, memo: Dict[int, Any]) -> Any:
+    value_type = type(value)
+
+    if value_type in _IMMUTABLE_RESULT_TYPES:
+        return value
+
+    if value_type is list:
+        ret = memo.get(id(value))
+        if ret is None:
+            ret = memo[id(value)] = []
+            ret.extend(_copy_result(item, memo) for item in value)
+        return ret
+
+    if value_type is dict or value_type is OrderedDict:
+        ret = memo.get(id(value))
+        if ret is None:
+            ret = memo[id(value)] = value_type()
+            for k, v in value.items():
+                ret[_copy_result(k, memo)] = _copy_result(v, memo)
+        return ret
+
+    # memo is shared so that the containers already copied are not copied again
+    return deepcopy(value, memo)
+
 
 class IconScoreEngine(object):
     """Calls external functions provided by each IconScore
@@ -70,7 +112,8 @@ class IconScoreEngine(object):
         IconScoreEngine._validate_score_blacklist(context, icon_score_address)
 
         if data_type == 'call':
-            return IconScoreEngine._call(context, icon_score_address, data)
+            ret = IconScoreEngine._call(context, icon_score_address, data)
+            return copy_result(ret)
         else:
             raise InvalidParamsException(f'Invalid dataType: ({data_type})')
 
@@ -84,8 +127,11 @@ class IconScoreEngine(object):
         IconScoreEngine._validate_score_blacklist(context, icon_score_address)
 
         icon_score = IconScoreEngine._get_icon_score(context, icon_score_address)
-        get_api = getattr(icon_score, ATTR_SCORE_GET_API)
-        return get_api()
+        try:
+            get_api = getattr(icon_score, ATTR_SCORE_GET_API)
+            return get_api()
+        finally:
+            IconScoreContextUtil.release_icon_score(context, icon_score)
 
     @staticmethod
     def _validate_score_blacklist(context: 'IconScoreContext', icon_score_address: 'Address'):
@@ -109,16 +155,18 @@ class IconScoreEngine(object):
 
         icon_score = cls._get_icon_score(context, icon_score_address)
 
-        converted_params = cls._convert_score_params_by_annotations(
-            context, icon_score, func_name, kw_params)
-        context.set_func_type_by_icon_score(icon_score, func_name)
-        context.current_address = icon_score_address
+        try:
+            converted_params = cls._convert_score_params_by_annotations(
+                context, icon_score, func_name, kw_params)
+            context.set_func_type_by_icon_score(icon_score, func_name)
+            context.current_address = icon_score_address
 
-        score_func = getattr(icon_score, ATTR_SCORE_CALL)
-        ret = score_func(func_name=func_name, kw_params=converted_params)
+            score_func = getattr(icon_score, ATTR_SCORE_CALL)
+            ret = score_func(func_name=func_name, kw_params=converted_params)
+        finally:
+            IconScoreContextUtil.release_icon_score(context, icon_score)
 
-        # No problem even though ret is None
-        return deepcopy(ret)
+        return ret
 
     @classmethod
     def _convert_score_params_by_annotations(
@@ -136,7 +184,7 @@ class IconScoreEngine(object):
             options = ConvertOption.IGNORE_UNKNOWN_PARAMS
 
         element_metadata: ScoreElementMetadata = get_score_element_metadata(icon_score, func_name)
-        params = convert_score_parameters(kw_params, element_metadata.signature, options)
+        params = element_metadata.params_converter.convert(kw_params, options)
 
         return params
 
@@ -150,8 +198,11 @@ class IconScoreEngine(object):
         """
         icon_score = IconScoreEngine._get_icon_score(context, score_address)
 
-        score_func = getattr(icon_score, ATTR_SCORE_CALL)
-        score_func(STR_FALLBACK)
+        try:
+            score_func = getattr(icon_score, ATTR_SCORE_CALL)
+            score_func(STR_FALLBACK)
+        finally:
+            IconScoreContextUtil.release_icon_score(context, icon_score)
 
     @staticmethod
     def _get_icon_score(context: 'IconScoreContext', icon_score_address: 'Address'):
@@ -92,6 +92,28 @@ class IconScoreMapper(object):
             with self._lock:
                 self._score_mapper.clear()
 
+    def get_score_pool_stats(self) -> dict:
+        """Returns the number of SCORE instances created and reused since Revision.THREE
+
+        :return: the counts summed up for all SCOREs
+        """
+        if self._lock is None:
+            score_infos = list(self._score_mapper.values())
+        else:
+            with self._lock:
+                score_infos = list(self._score_mapper.values())
+
+        create_count = 0
+        reuse_count = 0
+        for score_info in score_infos:
+            create_count += score_info.create_count
+            reuse_count += score_info.reuse_count
+
+        return {
+            "createCount": create_count,
+            "reuseCount": reuse_count,
+        }
+
     def close(self):
         for _, score_info in self._score_mapper.items():
             score_info.score_db.close()
@@ -14,8 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING
+from threading import Lock
+from typing import TYPE_CHECKING, Optional, List
+from weakref import WeakKeyDictionary
 
+from .context.context import ContextContainer
+from .icon_container_db import DictDB, VarDB
 from ..base.address import Address
 from ..base.exception import InvalidParamsException
 from ..icon_constant import Revision
@@ -25,6 +29,15 @@ if TYPE_CHECKING:
     from .icon_score_base import IconScoreBase
     from ..database.db import IconScoreDatabase
 
+# The members set in IconScoreBase.__init__(), which are not changed afterward
+_SCORE_BASE_MEMBERS = ("_IconScoreBase__db", "_IconScoreBase__address", "_IconScoreBase__owner")
+
+# The number of accesses to the context in IconScoreBase.__init__() to read the owner of SCORE
+_SCORE_BASE_CONTEXT_ACCESS_COUNT = 1
+
+# The maximum number of idle instances kept for a SCORE
+_MAX_IDLE_SCORES = 4
+
 
 class IconScoreInfo(object):
     """Contains information on one icon score
@@ -44,6 +57,17 @@ class IconScoreInfo(object):
         self._score_db = score_db
         self._score = None
 
+        # Pool of SCORE instances reused since Revision.THREE
+        self._lock = Lock()
+        # None: not checked yet, False: SCORE instances are not reused
+        # because they have Python member states or their constructor accesses the context
+        self._reusable: Optional[bool] = None
+        self._idle_scores: List['IconScoreBase'] = []
+        # SCORE instance -> its members right after construction
+        self._score_members: WeakKeyDictionary = WeakKeyDictionary()
+        self.create_count = 0
+        self.reuse_count = 0
+
     @property
     def tx_hash(self) -> bytes:
         return self._tx_hash
@@ -63,7 +87,9 @@ class IconScoreInfo(object):
     def get_score(self, revision: int) -> 'IconScoreBase':
         """Provide a score instance according to the revision.
         1. revision <= 2: Returns a cached score instance
-        2. revision > 2: Returns a newly created score instance
+        2. revision > 2: Returns an idle score instance in the pool or a newly created one
+
+        Call release_score() with the instance got from here when it is no longer used
 
         :param revision:
         :return:
@@ -74,11 +100,103 @@ class IconScoreInfo(object):
 
             return self._score
 
-        return self.create_score()
+        return self._acquire_score()
 
     def create_score(self) -> 'IconScoreBase':
         return self._score_class(self._score_db)
 
+    def _acquire_score(self) -> 'IconScoreBase':
+        """Returns a SCORE instance which is the same as a newly created one
+
+        A SCORE instance is reused only if its members are not changed by any call
+        and all of its members are DictDBs or VarDBs which have no state in themselves.
+        Its constructor must not access the context at all
+        so that it does the same thing regardless of block, transaction, states and steps.
+        """
+        with self._lock:
+            score: Optional['IconScoreBase'] = self._idle_scores.pop() if self._idle_scores else None
+            if score is not None:
+                self.reuse_count += 1
+                return score
+
+            self.create_count += 1
+            reusable: Optional[bool] = self._reusable
+
+        if reusable is False:
+            return self.create_score()
+
+        recording_stack = ContextContainer._start_recording_access()
+        try:
+            score = self.create_score()
+        finally:
+            access_count: int = ContextContainer._stop_recording_access(recording_stack)
+
+        with self._lock:
+            if self._reusable is not False:
+                if access_count == _SCORE_BASE_CONTEXT_ACCESS_COUNT and self._check_reusable(score):
+                    self._reusable = True
+                    self._score_members[score] = dict(vars(score))
+                else:
+                    self._disable_reuse()
+
+        return score
+
+    @staticmethod
+    def _check_reusable(score: 'IconScoreBase') -> bool:
+        """Check if a newly created SCORE instance is reusable
+
+        :param score: SCORE instance
+        :return: True if all of its members are DictDBs or VarDBs
+        """
+        for name, value in vars(score).items():
+            if name not in _SCORE_BASE_MEMBERS and not isinstance(value, (DictDB, VarDB)):
+                return False
+
+        return True
+
+    def _disable_reuse(self):
+        self._reusable = False
+        self._idle_scores.clear()
+        self._score_members.clear()
+
+    def release_score(self, score: 'IconScoreBase'):
+        """Return a SCORE instance got from get_score() to the pool
+
+        If its members are changed, SCORE instances are not reused anymore
+
+        :param score: SCORE instance
+        """
+        with self._lock:
+            members: Optional[dict] = self._score_members.get(score)
+            if members is None:
+                return
+
+            if not self._has_same_members(score, members):
+                self._disable_reuse()
+            elif len(self._idle_scores) < _MAX_IDLE_SCORES:
+                self._idle_scores.append(score)
+            else:
+                del self._score_members[score]
+
+    @staticmethod
+    def _has_same_members(score: 'IconScoreBase', members: dict) -> bool:
+        current: dict = vars(score)
+        if len(current) != len(members):
+            return False
+
+        for name, value in members.items():
+            if current.get(name, members) is not value:
+                return False
+
+        return True
+
+    def to_dict(self) -> dict:
+        return {
+            "reusable": self._reusable,
+            "createCount": self.create_count,
+            "reuseCount": self.reuse_count,
+        }
+
 
 class IconScoreMapperObject(dict):
     def __getitem__(self, key: 'Address') -> 'IconScoreInfo':
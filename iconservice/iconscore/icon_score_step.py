@@ -129,6 +129,12 @@ class StepType(AutoValueEnum):
     API_CALL = auto()
 
 
+# Index of each step type in the step cost table of IconScoreStepCounter, in definition order
+for _index, _step_type in enumerate(StepType):
+    _step_type.index = _index
+del _index, _step_type
+
+
 class OutOfStepException(IconServiceBaseException):
     """ An Exception which is thrown when steps are exhausted.
     """
@@ -247,7 +253,9 @@ class IconScoreStepCounter(object):
         """
 
         self._step_price = step_price
-        self._step_costs: dict = step_costs
+        # Step costs indexed by StepType.index, which are fixed while the transaction runs
+        self._step_cost_table: List[int] = [step_costs.get(step_type, 0) for step_type in StepType]
+        self._default_step: int = self._step_cost_table[StepType.DEFAULT.index]
         self._step_limit: int = step_limit
         self._step_used: int = 0
         self._external_call_count: int = 0
@@ -276,8 +284,7 @@ class IconScoreStepCounter(object):
         Returns used steps in the transaction
         :return: used steps in the transaction
         """
-        return max(self._step_used,
-                   self._step_costs.get(StepType.DEFAULT, 0))
+        return max(self._step_used, self._default_step)
 
     @property
     def max_step_used(self) -> int:
@@ -295,36 +302,50 @@ class IconScoreStepCounter(object):
         """ Increases steps for given step cost
         """
 
-        if step_type == StepType.CONTRACT_CALL:
+        if step_type is StepType.CONTRACT_CALL:
             self._external_call_count += 1
             if self._external_call_count > MAX_EXTERNAL_CALL_COUNT:
                 raise InvalidRequestException('Too many external calls')
 
-        step: int = self._step_costs.get(step_type, 0) * count
+        step: int = self._step_cost_table[step_type.index] * count
+
+        # Same as consume_step() which is not called to save a function call for every db access
+        step_used: int = self._step_used + step
+
+        if step_used > self._max_step_used:
+            self._max_step_used = step_used
+
+        if step_used > self._step_limit:
+            self._raise_out_of_step(step_type, step)
+
+        self._step_used = step_used
 
-        return self.consume_step(step_type, step)
+        if self._step_tracer is not None:
+            self._step_tracer.add(step_type, step, step_used)
+
+        return step_used
 
     def consume_step(self, step_type: StepType, step: int) -> int:
         step_used: int = self._step_used + step
 
-        self._max_step_used = max(self._max_step_used, step_used)
+        if step_used > self._max_step_used:
+            self._max_step_used = step_used
 
         if step_used > self._step_limit:
-            step_used = self._step_used
-            self._step_used = self._step_limit
-            raise OutOfStepException(
-                self._step_limit, step_used, step, step_type)
+            self._raise_out_of_step(step_type, step)
 
         self._step_used = step_used
 
         # Save the step info to StepTracer to trace step cost
-        self._trace_step(step_type, step)
+        if self._step_tracer is not None:
+            self._step_tracer.add(step_type, step, step_used)
 
         return step_used
 
-    def _trace_step(self, step_type: StepType, step: int):
-        if self._step_tracer is not None:
-            self._step_tracer.add(step_type, step, self._step_used)
+    def _raise_out_of_step(self, step_type: StepType, step: int):
+        step_used: int = self._step_used
+        self._step_used = self._step_limit
+        raise OutOfStepException(self._step_limit, step_used, step, step_type)
 
     def get_step_cost(self, step_type: StepType) -> int:
-        return self._step_costs.get(step_type, 0)
+        return self._step_cost_table[step_type.index]
@@ -32,6 +32,7 @@ from ..base.message import Message
 from ..icon_constant import ICX_TRANSFER_EVENT_LOG, MAX_CALL_STACK_SIZE, IconScoreContextType, Revision
 
 if TYPE_CHECKING:
+    from .icon_score_base import IconScoreBase
     from .icon_score_context import IconScoreContext
 
 
@@ -147,6 +148,8 @@ class InternalCall(object):
         context.current_address = addr_to
         context.msg = Message(sender=addr_from, value=amount)
 
+        icon_score: Optional['IconScoreBase'] = None
+
         try:
             icon_score = IconScoreContextUtil.get_icon_score(context, addr_to)
             context.set_func_type_by_icon_score(icon_score, func_name)
@@ -158,6 +161,8 @@ class InternalCall(object):
 
             return score_func(func_name=func_name, arg_params=arg_params, kw_params=kw_params)
         finally:
+            if icon_score is not None:
+                IconScoreContextUtil.release_icon_score(context, icon_score)
             context.func_type = prev_func_type
             context.current_address = addr_from
             context.msg = context.msg_stack.pop()
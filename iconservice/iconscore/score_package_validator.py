@@ -14,10 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import importlib.util
+import json
 import os
+from typing import Optional
+
+from iconcommons import Logger
 
 from ..base.exception import IllegalFormatException
+from ..icon_constant import ICON_DEPLOY_LOG_TAG
+from ..utils import sha3_256
 
 CODE_ATTR = 'co_code'
 CODE_NAMES_ATTR = 'co_names'
@@ -38,6 +45,10 @@ BASE_PACKAGE = 'iconservice'
 # ...
 OPCODE_HEADER_END_INDEX = 4
 
+# Increase it whenever the validation rules are changed to ignore the cached results
+VALIDATOR_VERSION = 1
+VALIDATION_CACHE_DIR = '.validation_cache'
+
 
 class ScorePackageValidator(object):
     WHITELIST_IMPORT = {}
@@ -81,12 +92,28 @@ class ScorePackageValidator(object):
     def execute(cls,
                 whitelist_table: dict,
                 pkg_root_path: str,
-                pkg_root_package: str) -> callable:
+                pkg_root_package: str,
+                cache_path: Optional[str] = None) -> callable:
+        """Validates the imports of all modules in a SCORE package
+
+        :param whitelist_table: import whitelist
+        :param pkg_root_path: path of the SCORE package
+        :param pkg_root_package: name of the SCORE package
+        :param cache_path: directory keeping the packages which passed the validation
+            Validation is skipped for the package which has the same contents with the one passed before
+        """
 
         cls.WHITELIST_IMPORT = whitelist_table
         cls.CUSTOM_IMPORT_LIST = cls._make_custom_import_list(pkg_root_path)
         cls._init_iconservice_whitelist()
 
+        cache_file_path: Optional[str] = None
+        if cache_path is not None:
+            cache_key: str = cls._make_cache_key(whitelist_table, pkg_root_path)
+            cache_file_path = os.path.join(cache_path, cache_key)
+            if os.path.exists(cache_file_path):
+                return
+
         # in order for the new module to be noticed by the import system
         importlib.invalidate_caches()
 
@@ -100,6 +127,52 @@ class ScorePackageValidator(object):
             cls._validate_import_from_const(code.co_consts)
             cls._validate_blacklist_keyword_from_names(code.co_names)
 
+        if cache_file_path is not None:
+            cls._save_cache(cache_file_path)
+
+    @classmethod
+    def _make_cache_key(cls, whitelist_table: dict, pkg_root_path: str) -> str:
+        """Returns the hash of all inputs which the validation result depends on
+
+        The location of a package is not included
+        so that the packages with the same contents share the validation result.
+        """
+        h = hashlib.sha3_256()
+
+        rules = {
+            "version": VALIDATOR_VERSION,
+            "magic": importlib.util.MAGIC_NUMBER.hex(),
+            "whitelist": {k: sorted(v) for k, v in whitelist_table.items()},
+            "iconserviceWhitelist": sorted(cls.ICONSERVICE_WHITELIST),
+            "blacklist": BLACKLIST_RESERVED_KEYWORD
+        }
+        h.update(json.dumps(rules, sort_keys=True).encode())
+
+        for dirpath, dirnames, filenames in os.walk(pkg_root_path):
+            dirnames.sort()
+            for file in sorted(filenames):
+                if os.path.splitext(file)[1] != '.py':
+                    continue
+
+                path: str = os.path.join(dirpath, file)
+                with open(path, 'rb') as f:
+                    content: bytes = f.read()
+
+                h.update(os.path.relpath(path, pkg_root_path).encode() + b'\0')
+                h.update(sha3_256(content))
+
+        return h.hexdigest()
+
+    @classmethod
+    def _save_cache(cls, cache_file_path: str):
+        try:
+            os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+            with open(cache_file_path, 'wb'):
+                pass
+        except OSError as e:
+            # Failure to save the cache does not affect the validation result
+            Logger.warning(f'Failed to save a validation cache: {e}', ICON_DEPLOY_LOG_TAG)
+
     @classmethod
     def _make_custom_import_list(cls,
                                  pkg_root_path: str) -> list:
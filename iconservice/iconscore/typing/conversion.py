@@ -16,7 +16,7 @@
 from collections import OrderedDict
 from enum import Flag, auto
 from inspect import Signature, Parameter
-from typing import Optional, Dict, Union, Any, List
+from typing import Optional, Dict, Union, Any, List, Callable
 
 from . import (
     BaseObject,
@@ -227,3 +227,185 @@ def str_to_object_in_dict(value: Dict[str, Any], type_hint: type) -> Dict[str, A
 def str_to_object_in_union(value: Union[Any], type_hint: type) -> Optional[Any]:
     args = get_args(type_hint)
     return None if value is None else str_to_object(value, args[0])
+
+
+Converter = Callable[[Any], Any]
+
+_VALUE_TYPES = (dict, list, str, type(None))
+
+
+def _str_to_bool(value: str) -> bool:
+    return bool(str_to_int(value))
+
+
+def _str_to_str(value: str) -> str:
+    return value
+
+
+_BASE_OBJECT_CONVERTERS: Dict[type, Converter] = {
+    bool: _str_to_bool,
+    bytes: hex_to_bytes,
+    int: str_to_int,
+    str: _str_to_str,
+    Address: Address.from_string,
+}
+
+
+def create_converter(type_hint: type) -> Converter:
+    """Compile str_to_object() for a given type hint into a function
+
+    The returned function converts a value in the same way as str_to_object(value, type_hint)
+    without inspecting type_hint on every call
+
+    :param type_hint:
+    :return: converter
+    """
+    origin = get_origin(type_hint)
+
+    if is_base_type(origin):
+        convert = _create_base_object_converter(origin)
+    elif is_struct(origin):
+        convert = _create_struct_converter(type_hint)
+    elif origin is list:
+        convert = _create_list_converter(type_hint)
+    elif origin is dict:
+        convert = _create_dict_converter(type_hint)
+    elif origin is Union:
+        convert = _create_union_converter(type_hint)
+    else:
+        convert = None
+
+    if convert is None:
+        # Rare type hints are converted as they are
+        def converter(value: Any) -> Any:
+            return str_to_object(value, type_hint)
+    else:
+        def converter(value: Any) -> Any:
+            if not isinstance(value, _VALUE_TYPES):
+                raise InvalidParamsException(f"Invalid value type: {value}")
+            return convert(value)
+
+    return converter
+
+
+def _create_base_object_converter(type_hint: type) -> Converter:
+    convert = _BASE_OBJECT_CONVERTERS[type_hint]
+
+    def converter(value: str) -> BaseObject:
+        if not isinstance(value, str):
+            raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
+        return convert(value)
+
+    return converter
+
+
+def _create_struct_converter(type_hint: type) -> Optional[Converter]:
+    annotations = get_annotations(type_hint, None)
+    if not isinstance(annotations, dict):
+        return None
+
+    # Field converters are created on the first call not to follow nested structs in advance
+    # Only a complete dict of them is published to the other threads
+    cache: List[Dict[str, Converter]] = []
+
+    def converter(value: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
+
+        if len(cache) == 0:
+            cache.append({k: create_converter(field_type_hint) for k, field_type_hint in annotations.items()})
+        field_converters: Dict[str, Converter] = cache[0]
+
+        ret = OrderedDict()
+
+        for k, v in value.items():
+            if k not in field_converters:
+                raise InvalidParamsException(f"Unknown field in struct: key={k}")
+
+            ret[k] = field_converters[k](v)
+
+        if len(ret) != len(annotations):
+            raise InvalidParamsException(f"Missing field in struct")
+
+        return ret
+
+    return converter
+
+
+def _create_list_converter(type_hint: type) -> Optional[Converter]:
+    args = get_args(type_hint)
+    if len(args) < 1:
+        return None
+
+    convert = create_converter(args[0])
+
+    def converter(value: List[Any]) -> List[Any]:
+        if not isinstance(value, list):
+            raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
+        return [convert(i) for i in value]
+
+    return converter
+
+
+def _create_dict_converter(type_hint: type) -> Optional[Converter]:
+    args = get_args(type_hint)
+    if len(args) < 2:
+        return None
+
+    convert = create_converter(args[1])
+
+    def converter(value: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(value, dict):
+            raise InvalidParamsException(f"Type mismatch: value={value} type_hint={type_hint}")
+        return OrderedDict((k, convert(v)) for k, v in value.items())
+
+    return converter
+
+
+def _create_union_converter(type_hint: type) -> Optional[Converter]:
+    args = get_args(type_hint)
+    if len(args) < 1:
+        return None
+
+    convert = create_converter(args[0])
+
+    def converter(value: Union[Any]) -> Optional[Any]:
+        return None if value is None else convert(value)
+
+    return converter
+
+
+class ParamsConverter(object):
+    """Converts score parameters with the converters compiled from a signature
+
+    It works in the same way as convert_score_parameters() with the signature
+    """
+
+    def __init__(self, sig: Signature):
+        self._parameters = sig.parameters
+        self._converters: Dict[str, Converter] = {
+            k: create_converter(parameter.annotation) for k, parameter in self._parameters.items()
+        }
+        self._defaults: List[tuple] = [(k, parameter.default) for k, parameter in self._parameters.items()]
+
+    def convert(self, params: Dict[str, Any], options: ConvertOption = ConvertOption.NONE) -> Dict[str, Any]:
+        for k, default in self._defaults:
+            if params.get(k, default) is Parameter.empty:
+                raise InvalidParamsException(f"Argument not found: {k}")
+
+        converted_params = {}
+        converters = self._converters
+
+        for k, v in params.items():
+            if not isinstance(k, str):
+                raise InvalidParamsException(f"Invalid key type: key={k}")
+
+            try:
+                converted_params[k] = converters[k](v)
+            except KeyError:
+                if not (options & ConvertOption.IGNORE_UNKNOWN_PARAMS):
+                    raise InvalidParamsException(f"Unknown param: key={k} value={v}")
+
+        set_default_value_to_params(params, self._parameters)
+
+        return converted_params
@@ -22,7 +22,7 @@ from inspect import (
     Signature,
     Parameter,
 )
-from typing import Union, Mapping, List, Any, Set
+from typing import Union, Mapping, List, Any, Set, Optional
 
 from . import (
     is_base_type,
@@ -33,6 +33,7 @@ from . import (
     name_to_type,
 )
 from . import isinstance_ex
+from .conversion import ParamsConverter
 from ..icon_score_constant import (
     CONST_SCORE_FLAG,
     ScoreFlag,
@@ -244,6 +245,7 @@ class ScoreElementMetadata(object):
     def __init__(self, element: callable):
         self._signature: Signature = normalize_signature(element)
         self._element = element
+        self._params_converter: Optional[ParamsConverter] = None
 
     @property
     def element(self) -> callable:
@@ -261,6 +263,16 @@ class ScoreElementMetadata(object):
     def signature(self) -> Signature:
         return self._signature
 
+    @property
+    def params_converter(self) -> ParamsConverter:
+        """Converter compiled from the signature on the first use
+
+        Type hints of a SCORE are not changed after it is loaded
+        """
+        if self._params_converter is None:
+            self._params_converter = ParamsConverter(self._signature)
+        return self._params_converter
+
 
 class FunctionMetadata(ScoreElementMetadata):
     """Represents metadata of an exposed function in a SCORE
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 from enum import Flag
 
 from ..utils import set_flag
@@ -46,3 +47,8 @@ class BasePart(object):
 
     def is_set(self, states: 'BasePartState') -> bool:
         return self._states & states == states
+
+    def copy(self) -> 'BasePart':
+        """Returns an independent copy which can be modified without affecting this part
+        """
+        return copy.copy(self)
@@ -136,6 +136,12 @@ class DelegationPart(BasePart):
 
         return MsgPackForDB.dumps(data)
 
+    def copy(self) -> 'DelegationPart':
+        part = super().copy()
+        part._delegations = list(self._delegations)
+
+        return part
+
     def __eq__(self, other) -> bool:
         """operator == overriding
 
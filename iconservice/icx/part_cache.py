@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Union, Dict
+
+from iconcommons import Logger
+
+from .coin_part import CoinPart
+from .delegation_part import DelegationPart
+from .stake_part import StakePart
+from ..icon_constant import ICX_LOG_TAG, ACCOUNT_PART_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from ..database.batch import BatchValue
+    from ..database.db import ContextDatabase
+    from ..iconscore.icon_score_context import IconScoreContext
+
+PartClass = Union[type(CoinPart), type(StakePart), type(DelegationPart)]
+Part = Union['CoinPart', 'StakePart', 'DelegationPart']
+
+
+class AccountPartCache(object):
+    """Caches account parts read on the invoke thread
+
+    It consists of two LRU caches
+    - committed values: part key -> bytes in the state db (None if absent)
+        It skips LevelDB reads. Only updated on commit, so it never contains uncommitted states.
+    - decoded parts: (part class, bytes) -> decoded part
+        It skips deserialization. It is addressed by value, so it is valid
+        for the states in tx/block batches as well as those in the state db.
+
+    Decoded parts are never handed out directly. A copy is returned instead
+    because Account modifies its parts in place.
+    """
+
+    def __init__(self, db: 'ContextDatabase', max_size: int = ACCOUNT_PART_CACHE_SIZE):
+        self._db = db
+        self._max_size: int = max_size
+        self._values: OrderedDict[bytes, Optional[bytes]] = OrderedDict()
+        self._parts: OrderedDict[tuple, Part] = OrderedDict()
+
+        self.value_hits = 0
+        self.value_misses = 0
+        self.part_hits = 0
+        self.part_misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, context: 'IconScoreContext', part_class: PartClass, key: bytes) -> Optional[Part]:
+        """Returns a copy of the part indicated by key
+
+        :param context: invoke context
+        :param part_class: CoinPart, StakePart or DelegationPart
+        :param key: part key made by part_class.make_key(address)
+        :return: None if no part is found
+        """
+        batch_value: Optional['BatchValue'] = self._db.get_batch_value(context, key)
+        if batch_value is None:
+            value: Optional[bytes] = self._get_committed_value(key)
+            self._db.set_pre_image(context, key, value)
+        else:
+            value: Optional[bytes] = batch_value.value
+
+        if not value:
+            return None
+
+        return self._get_part(part_class, value).copy()
+
+    def _get_committed_value(self, key: bytes) -> Optional[bytes]:
+        values = self._values
+
+        if key in values:
+            self.value_hits += 1
+            values.move_to_end(key)
+            return values[key]
+
+        self.value_misses += 1
+        value: Optional[bytes] = self._db.key_value_db.get(key)
+        if self._max_size > 0:
+            values[key] = value
+            if len(values) > self._max_size:
+                values.popitem(last=False)
+
+        return value
+
+    def _get_part(self, part_class: PartClass, value: bytes) -> Part:
+        parts = self._parts
+        part_key = (part_class, value)
+
+        part: Optional[Part] = parts.get(part_key)
+        if part is None:
+            self.part_misses += 1
+            part = part_class.from_bytes(value)
+            if self._max_size > 0:
+                parts[part_key] = part
+                if len(parts) > self._max_size:
+                    parts.popitem(last=False)
+        else:
+            self.part_hits += 1
+            parts.move_to_end(part_key)
+
+        return part
+
+    def commit(self, block_batch: Dict[bytes, 'BatchValue']):
+        """Apply the states of a committed block to the cached committed values
+
+        :param block_batch: the states written to the state db
+        """
+        values = self._values
+
+        for key, batch_value in block_batch.items():
+            if key in values:
+                values[key] = batch_value.value
+
+        Logger.debug(tag=ICX_LOG_TAG, msg=f"AccountPartCache: {self}")
+
+    def clear(self):
+        self._values.clear()
+        self._parts.clear()
+
+    def to_dict(self) -> dict:
+        return {
+            "size": len(self._values),
+            "maxSize": self._max_size,
+            "valueHits": self.value_hits,
+            "valueMisses": self.value_misses,
+            "partHits": self.part_hits,
+            "partMisses": self.part_misses,
+        }
+
+    def __str__(self) -> str:
+        return f"size={len(self._values)} max_size={self._max_size} " \
+               f"value_hits={self.value_hits} value_misses={self.value_misses} " \
+               f"part_hits={self.part_hits} part_misses={self.part_misses}"
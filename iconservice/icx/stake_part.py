@@ -241,6 +241,12 @@ class StakePart(BasePart):
 
         return MsgPackForDB.dumps(data)
 
+    def copy(self) -> 'StakePart':
+        part = super().copy()
+        part._unstakes_info = [list(unstake_info) for unstake_info in self._unstakes_info]
+
+        return part
+
     def __eq__(self, other) -> bool:
         """operator == overriding
 
@@ -16,23 +16,28 @@
 
 import json
 from enum import IntEnum, IntFlag
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Union
 
 from iconcommons import Logger
 
 from .coin_part import CoinPart, CoinPartFlag, CoinPartType
 from .delegation_part import DelegationPart
 from .icx_account import Account
+from .part_cache import AccountPartCache
 from .stake_part import StakePart
 from ..base.ComponentBase import StorageBase
 from ..base.address import Address
 from ..base.block import Block, NULL_BLOCK
-from ..icon_constant import DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER, ICX_LOG_TAG, ROLLBACK_LOG_TAG, Revision
+from ..icon_constant import (
+    DEFAULT_BYTE_SIZE, DATA_BYTE_ORDER, ICX_LOG_TAG, ROLLBACK_LOG_TAG, Revision, IconScoreContextType,
+    ACCOUNT_PART_CACHE_SIZE
+)
 from ..utils import bytes_to_hex
 
 if TYPE_CHECKING:
     from ..database.db import ContextDatabase
     from ..iconscore.icon_score_context import IconScoreContext
+    from ..precommit_data_manager import PrecommitData
 
 
 class AccountPartFlag(IntFlag):
@@ -72,15 +77,27 @@ class Storage(StorageBase):
         self._last_block = NULL_BLOCK
         self._genesis: Optional['Address'] = None
         self._fee_treasury: Optional['Address'] = None
+        # Only used on the invoke thread
+        self._part_cache: Optional['AccountPartCache'] = None
+
+    def open(self, context: 'IconScoreContext', part_cache_size: int = ACCOUNT_PART_CACHE_SIZE):
+        # part_cache_size 0 disables the account part cache
+        if part_cache_size > 0:
+            self._part_cache = AccountPartCache(self._db, part_cache_size)
 
-    def open(self, context: 'IconScoreContext'):
         self._load_special_address(context, self._GENESIS_DB_KEY)
         self._load_special_address(context, self._TREASURY_DB_KEY)
 
+    def commit(self, _context: 'IconScoreContext', precommit_data: 'PrecommitData'):
+        if self._part_cache is not None:
+            self._part_cache.commit(precommit_data.block_batch)
+
     def rollback(self, context: 'IconScoreContext', block_height: int, block_hash: bytes):
         Logger.info(tag=ROLLBACK_LOG_TAG,
                     msg=f"rollback() start: block_height={block_height} block_hash={bytes_to_hex(block_hash)}")
 
+        if self._part_cache is not None:
+            self._part_cache.clear()
         self._load_special_address(context, self._GENESIS_DB_KEY)
         self._load_special_address(context, self._TREASURY_DB_KEY)
         self.load_last_block_info(context)
@@ -91,6 +108,10 @@ class Storage(StorageBase):
     def last_block(self) -> 'Block':
         return self._last_block
 
+    @property
+    def part_cache(self) -> Optional['AccountPartCache']:
+        return self._part_cache
+
     @property
     def genesis(self) -> 'Address':
         return self._genesis
@@ -316,6 +337,14 @@ class Storage(StorageBase):
             part_class: Union[type(CoinPart), type(StakePart), type(DelegationPart)],
             address: 'Address') -> Union['CoinPart', 'StakePart', 'DelegationPart']:
         key: bytes = part_class.make_key(address)
+
+        if self._part_cache is not None and context.type == IconScoreContextType.INVOKE:
+            part = self._part_cache.get(context, part_class, key)
+            if part is None and part_class is CoinPart:
+                Logger.info(tag="PV", msg=f"No CoinPart: {address} {context.block}")
+
+            return part if part else part_class()
+
         value: bytes = self._db.get(context, key)
 
         if value is None and part_class is CoinPart:
@@ -411,6 +440,34 @@ class Storage(StorageBase):
         part.set_complete(True)
         return part
 
+    def get_parts(
+            self,
+            context: 'IconScoreContext',
+            part_class: Union[type(CoinPart), type(StakePart), type(DelegationPart)],
+            addresses: Iterable['Address']
+    ) -> Dict['Address', Union['CoinPart', 'StakePart', 'DelegationPart']]:
+        """Returns the parts of given addresses read from StateDB at once
+
+        The keys are read in order with one iterator instead of a lookup for each address.
+        Neither batches nor the part cache are searched, so it is only for the states committed already.
+
+        :param context:
+        :param part_class: CoinPart, StakePart or DelegationPart
+        :param addresses: account addresses
+        :return: the part of each address. An empty part is returned for the address without it
+        """
+        keys: Dict[bytes, 'Address'] = {part_class.make_key(address): address for address in addresses}
+        values: Dict[bytes, bytes] = self._db.get_many_from_db(context, keys)
+
+        parts: Dict['Address', Union['CoinPart', 'StakePart', 'DelegationPart']] = {}
+        for key, address in keys.items():
+            value: Optional[bytes] = values.get(key)
+            part = part_class.from_bytes(value) if value else part_class()
+            part.set_complete(True)
+            parts[address] = part
+
+        return parts
+
     def put_stake_part(self, context: 'IconScoreContext', address: 'Address', part: 'StakePart'):
         if not (isinstance(part, StakePart) and part.is_dirty()):
             return
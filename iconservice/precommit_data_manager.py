@@ -21,7 +21,7 @@ from iconcommons import Logger
 
 from .base.block import Block, NULL_BLOCK
 from .base.exception import InvalidParamsException, InternalServiceErrorException
-from .database.batch import BlockBatch
+from .database.batch import BlockBatch, BlockBatchOverlay
 from .icon_constant import Revision
 from .iconscore.icon_score_mapper import IconScoreMapper
 from .iiss.reward_calc.msg_data import TxData
@@ -33,6 +33,7 @@ from . import __version__
 if TYPE_CHECKING:
     from .base.address import Address
     from .prep.data import PRepContainer, Term
+    from .utils.bloom import BloomFilter
 
 _TAG = "PRECOMMIT"
 
@@ -135,12 +136,14 @@ class PrecommitData(object):
                  rc_state_root_hash: Optional[bytes],
                  added_transactions: dict,
                  next_preps: Optional[dict],
-                 prep_address_converter: 'PRepAddressConverter'):
+                 prep_address_converter: 'PRepAddressConverter',
+                 logs_bloom: Optional['BloomFilter'] = None):
         """
 
         :param block_batch: changed states for a block
         :param block_result: tx_results made from transactions in a block
         :param score_mapper: newly deployed scores in a block
+        :param logs_bloom: union of the logs blooms of tx_results in a block
 
         """
         # Todo: check if remove the revision
@@ -166,6 +169,7 @@ class PrecommitData(object):
         self.next_preps: Optional[dict] = next_preps
 
         self.prep_address_converter: 'PRepAddressConverter' = prep_address_converter
+        self.logs_bloom: Optional['BloomFilter'] = logs_bloom
 
         # To prevent redundant precommit data logging
         self.already_exists = False
@@ -224,6 +228,9 @@ class PrecommitDataManager(object):
             self._data = data
             self._parent = parent
             self._children: Dict[bytes, 'PrecommitDataManager.Node'] = {}
+            # Merged view of the block batches from this node up to the root
+            # The root has its own one only while its states are being written to state_db
+            self._overlay: Optional['BlockBatchOverlay'] = None
 
         @property
         def precommit_data(self) -> 'PrecommitData':
@@ -254,6 +261,30 @@ class PrecommitDataManager(object):
         def is_root(self) -> bool:
             return self._parent is None
 
+        @property
+        def overlay(self) -> Optional['BlockBatchOverlay']:
+            """Lazily build the overlay used to invoke the child blocks of this node
+
+            It refers to the overlay of the parent node instead of copying it,
+            so it is built only once per node, not once per state read
+            """
+            if self.is_root():
+                return self._overlay
+
+            if self._overlay is None:
+                self._overlay = BlockBatchOverlay(self.precommit_data.block_batch, self._parent.overlay)
+
+            return self._overlay
+
+        def release_overlay(self):
+            self._overlay = None
+
+        def detach_overlay_from_parent(self):
+            """Stop reading the states of the parent nodes which have been written to state_db
+            """
+            if self._overlay is not None:
+                self._overlay.detach_parent()
+
         def is_leaf(self) -> bool:
             return len(self._children) == 0
 
@@ -311,7 +342,14 @@ class PrecommitDataManager(object):
         node = self._precommit_data_mapper.get(block_hash)
         return node.precommit_data if node else None
 
-    def commit(self, block: 'Block'):
+    def commit(self, block: 'Block', flushed: bool = True):
+        """Make a given block the root
+
+        :param block: the block to commit
+        :param flushed: False if the states of the block have not been written to state_db yet
+            The block batch of the new root is still used to invoke its child blocks
+            until release_root_overlay() is called
+        """
         node = self._precommit_data_mapper.get(block.hash)
         if node is None:
             Logger.warning(
@@ -324,8 +362,26 @@ class PrecommitDataManager(object):
 
         self._remove_sibling_precommit_data(block)
         del self._precommit_data_mapper[self._root.block.hash]
+
+        if not flushed:
+            # Build the overlay before the node becomes the root
+            _ = node.overlay
+
+        # The overlays of the child nodes keep referring to this one
+        node.detach_overlay_from_parent()
+        if flushed:
+            node.release_overlay()
         self._set_root(node)
 
+    def release_root_overlay(self, block: 'Block'):
+        """Called when the states of the root block have been written to state_db
+
+        :param block: the committed block whose states have been written to state_db
+        """
+        root = self._root
+        if root.block.hash == block.hash:
+            root.release_overlay()
+
     def _remove_sibling_precommit_data(self, block_to_commit: 'Block'):
         """Remove the sibling blocks whose height is the same as that of the block to commit
 
@@ -406,15 +462,17 @@ class PrecommitDataManager(object):
         node.parent = None
         self._root = node
 
-    def get_block_batches(self, block_hash: bytes) -> Iterable['BlockBatch']:
+    def get_block_batch_overlay(self, block_hash: bytes) -> Optional['BlockBatchOverlay']:
+        """Returns the merged view of uncommitted block batches from a given block up to the root
+
+        :param block_hash: the hash of the previous block of the block to invoke
+        :return: None if the given block has already been committed or does not exist
+        """
         node = self._precommit_data_mapper.get(block_hash)
         if not node:
-            return
+            return None
 
-        while not node.is_root():
-            yield node.precommit_data.block_batch
-            # parent means previous block node
-            node = node.parent
+        return node.overlay
 
     def change_block_hash(self, block_height: int, src: bytes, dst: bytes):
         node: 'PrecommitDataManager.Node' = self._precommit_data_mapper.get(src)
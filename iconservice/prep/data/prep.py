@@ -20,7 +20,7 @@ from typing import TYPE_CHECKING, Tuple, Any, Optional
 import iso3166
 
 from .sorted_list import Sortable
-from ...base.exception import AccessDeniedException
+from ...base.exception import AccessDeniedException, InvalidParamsException
 from ...base.type_converter_templates import ConstantKeys
 from ...icon_constant import PRepGrade, PRepStatus, PenaltyReason, Revision, PRepFlag
 from ...utils.msgpack_for_db import MsgPackForDB
@@ -36,6 +36,7 @@ class PRepDictType(Enum):
 
 class PRep(Sortable):
     PREFIX: bytes = b"prep"
+    BLOCK_STATISTICS_PREFIX: bytes = PREFIX + b"stats"
     _VERSION: int = 2
     _UNKNOWN_COUNTRY = iso3166.Country(u"Unknown", "ZZ", "ZZZ", "000", u"Unknown")
 
@@ -413,6 +414,10 @@ class PRep(Sortable):
     def make_key(cls, address: 'Address') -> bytes:
         return cls.PREFIX + address.to_bytes_including_prefix()
 
+    @classmethod
+    def make_block_statistics_key(cls, address: 'Address') -> bytes:
+        return cls.BLOCK_STATISTICS_PREFIX + address.to_bytes_including_prefix()
+
     def is_frozen(self) -> bool:
         return self._is_frozen
 
@@ -527,8 +532,29 @@ class PRep(Sortable):
 
         return MsgPackForDB.dumps(data)
 
+    def block_statistics_to_bytes(self) -> bytes:
+        """Returns block validation statistics and the height of the last block which this P-Rep generated
+        They are updated on every block and stored apart from the other P-Rep data
+        since Revision.SEPARATE_PREP_BLOCK_STATISTICS
+
+        :return:
+        """
+        version: int = 0
+        return MsgPackForDB.dumps([
+            version,
+            self._total_blocks,
+            self._validated_blocks,
+            self._unvalidated_sequence_blocks,
+            self._last_generate_block_height
+        ])
+
     @classmethod
-    def from_bytes(cls, data: bytes) -> 'PRep':
+    def from_bytes(cls, data: bytes, block_statistics: Optional[bytes] = None) -> 'PRep':
+        """
+        :param data: P-Rep data serialized with to_bytes()
+        :param block_statistics: the latest block validation statistics serialized with block_statistics_to_bytes()
+        :return:
+        """
         items: list = MsgPackForDB.loads(data)
         version: int = items[cls.Index.VERSION]
 
@@ -538,6 +564,15 @@ class PRep(Sortable):
         if version < 2:
             items.append(items[cls.Index.ADDRESS])
 
+        if block_statistics is not None:
+            statistics: list = MsgPackForDB.loads(block_statistics)
+            if statistics[0] != 0:
+                raise InvalidParamsException(f"Invalid P-Rep block statistics version: {statistics[0]}")
+            items[cls.Index.TOTAL_BLOCKS] = statistics[1]
+            items[cls.Index.VALIDATED_BLOCKS] = statistics[2]
+            items[cls.Index.UNVALIDATED_SEQUENCE_BLOCKS] = statistics[3]
+            items[cls.Index.LAST_GENERATE_BLOCK_HEIGHT] = statistics[4]
+
         return PRep(
             # version 0
             address=items[cls.Index.ADDRESS],
@@ -14,7 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set
 
 from iconcommons import Logger
 from .prep import PRep, PRepStatus
@@ -40,7 +40,11 @@ class PRepContainer(object):
         # Active P-Rep list ordered by delegated amount
         self._active_prep_list = SortedList()
         self._prep_dict = {}
+        # Addresses of active P-Reps suspended by block validation penalty
+        self._suspended_preps: Set['Address'] = set()
         self._flags: 'PRepContainerFlag' = PRepContainerFlag.NONE
+        # True if P-Rep collections are shared with other PRepContainers
+        self._is_shared: bool = False
 
     def is_frozen(self) -> bool:
         return self._is_frozen
@@ -92,12 +96,42 @@ class PRepContainer(object):
         self._add(prep)
         self._flags |= PRepContainerFlag.DIRTY
 
+    def add_all(self, preps: Iterable['PRep']):
+        """Adds P-Reps like add() for each of them but sorts active P-Reps only once
+
+        :param preps: P-Reps to add
+        """
+        self._check_access_permission()
+        self._copy_on_write()
+
+        active_preps: List['PRep'] = []
+
+        for prep in preps:
+            if prep.address in self._prep_dict:
+                raise InvalidParamsException("P-Rep already exists")
+
+            self._prep_dict[prep.address] = prep
+
+            if prep.status == PRepStatus.ACTIVE:
+                active_preps.append(prep)
+                if prep.is_suspended():
+                    self._suspended_preps.add(prep.address)
+
+                self._total_prep_delegated += prep.delegated
+                assert self._total_prep_delegated >= 0
+
+        self._active_prep_list.add_all(active_preps)
+        self._flags |= PRepContainerFlag.DIRTY
+
     def _add(self, prep: 'PRep'):
+        self._copy_on_write()
 
         self._prep_dict[prep.address] = prep
 
         if prep.status == PRepStatus.ACTIVE:
             self._active_prep_list.add(prep)
+            if prep.is_suspended():
+                self._suspended_preps.add(prep.address)
 
             # Update self._total_prep_delegated
             self._total_prep_delegated += prep.delegated
@@ -120,8 +154,11 @@ class PRepContainer(object):
     def _remove(self, address: 'Address') -> Optional['PRep']:
         prep: Optional['PRep'] = self._prep_dict.get(address)
         if prep is not None:
+            self._copy_on_write()
+
             if prep.status == PRepStatus.ACTIVE:
                 self._active_prep_list.remove(prep)
+                self._suspended_preps.discard(address)
                 self._total_prep_delegated -= prep.delegated
 
             del self._prep_dict[address]
@@ -191,6 +228,15 @@ class PRepContainer(object):
         """
         return self._active_prep_list[start_index:start_index + size]
 
+    def get_suspended_preps(self) -> List['PRep']:
+        """Returns active P-Reps suspended by block validation penalty in the same order as active P-Reps
+
+        :return: suspended P-Rep list
+        """
+        preps: List['PRep'] = [self._prep_dict[address] for address in self._suspended_preps]
+        preps.sort(key=self._active_prep_list.index)
+        return preps
+
     def get_inactive_preps(self) -> List['PRep']:
         """Returns inactive P-Reps which is unregistered or receiving prep disqualification or low productivity penalty.
         This method does not care about the order of P-Rep list
@@ -223,16 +269,31 @@ class PRepContainer(object):
     def copy(self, mutable: bool) -> 'PRepContainer':
         """Copy PRepContainer without changing PRep objects
 
+        The copied PRepContainer shares P-Rep collections with this one
+        until either of them adds or removes a P-Rep first
+
         :param mutable:
         :return:
         """
         preps = PRepContainer(is_frozen=not mutable, total_prep_delegated=self._total_prep_delegated)
 
-        preps._prep_dict.update(self._prep_dict)
-        preps._active_prep_list.extend(self._active_prep_list)
+        preps._prep_dict = self._prep_dict
+        preps._active_prep_list = self._active_prep_list
+        preps._suspended_preps = self._suspended_preps
+        preps._is_shared = True
+        self._is_shared = True
 
         return preps
 
+    def _copy_on_write(self):
+        """Copy the P-Rep collections shared with other PRepContainers before changing them
+        """
+        if self._is_shared:
+            self._prep_dict = dict(self._prep_dict)
+            self._active_prep_list = self._active_prep_list.copy()
+            self._suspended_preps = set(self._suspended_preps)
+            self._is_shared = False
+
     def _check_access_permission(self):
         if self.is_frozen():
             raise AccessDeniedException("PRepContainer access denied")
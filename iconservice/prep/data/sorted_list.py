@@ -14,6 +14,7 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
+from bisect import bisect_left, bisect_right
 from typing import Union, Iterable, List, Optional
 
 
@@ -23,26 +24,47 @@ class Sortable(metaclass=ABCMeta):
         pass
 
 
+class _OrderView(object):
+    """Read-only sequence of the orders of sorted items
+
+    It makes bisect functions search the items by order()
+    without keeping a separate list of orders in sync with the items
+    """
+
+    def __init__(self, items: List['Sortable']):
+        self._items = items
+
+    def __getitem__(self, index: int):
+        return self._items[index].order()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 class SortedList(object):
     def __init__(self, sorted_list: 'SortedList' = ()):
         self._items = list(sorted_list)
+        self._orders = _OrderView(self._items)
 
     def add(self, new_item: 'Sortable'):
-        """
+        """Insert an item after the items which have the same order in O(log n) comparisons
 
         :param new_item:
         :return:
         """
-        index = 0
-        order = new_item.order()
+        index: int = bisect_right(self._orders, new_item.order())
+        self._items.insert(index, new_item)
 
-        for item in self._items:
-            if order < item.order():
-                break
+    def add_all(self, new_items: Iterable['Sortable']):
+        """Adds items with one sort instead of an insertion for each item
 
-            index += 1
+        The items with the same order are placed in the same way as add() does
+        """
+        self._items.extend(new_items)
+        self._items.sort(key=lambda item: item.order())
 
-        self._items.insert(index, new_item)
+    def copy(self) -> 'SortedList':
+        return SortedList(self._items)
 
     def get(self, index: int) -> Optional['Sortable']:
         try:
@@ -59,46 +81,17 @@ class SortedList(object):
 
     def index(self, item: 'Sortable') -> int:
         order = item.order()
+        size: int = len(self._items)
 
-        left: int = 0
-        right: int = len(self._items)
-
-        while left < right:
-            i = (left + right) // 2
+        # Look for the same item among the items which have the same order
+        for i in range(bisect_left(self._orders, order), size):
             item_in_list: 'Sortable' = self._items[i]
 
-            if order == item_in_list.order():
-                return self._precise_index(i, item)
-
-            if order < item_in_list.order():
-                right = i
-            else:
-                left = i + 1
-
-        return -1
-
-    def _precise_index(self, base_index: int, target_item: 'Sortable') -> int:
-        if id(target_item) == id(self._items[base_index]):
-            return base_index
-
-        # Check the previous items
-        for i in range(base_index - 1, -1, -1):
-            item: 'Sortable' = self._items[i]
-            if target_item.order() != item.order():
-                break
-
-            if id(target_item) == id(item):
+            if id(item) == id(item_in_list):
                 return i
-
-        # Check the next items
-        for i in range(base_index + 1, len(self._items)):
-            item: 'Sortable' = self._items[i]
-            if target_item.order() != item.order():
+            if order != item_in_list.order():
                 break
 
-            if id(target_item) == id(item):
-                return i
-
         return -1
 
     def remove(self, item: 'Sortable') -> 'Sortable':
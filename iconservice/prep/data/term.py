@@ -16,7 +16,8 @@
 __all__ = ("Term", "PRepSnapshot")
 
 import copy
-from typing import TYPE_CHECKING, List, Iterable, Optional, Dict
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Iterable, Optional, Dict, Tuple
 
 from iconcommons.logger import Logger
 from ... import utils
@@ -30,6 +31,16 @@ if TYPE_CHECKING:
     from .prep import PRep
 
 
+@lru_cache(maxsize=4)
+def _generate_root_hash(main_prep_addresses: Tuple['Address', ...]) -> Optional[bytes]:
+    """Returns the merkle root hash of main P-Rep addresses
+
+    Main P-Reps rarely change across terms, so the root hash of the same main P-Reps is cached
+    """
+    values = (address.to_bytes_including_prefix() for address in main_prep_addresses)
+    return RootHashGenerator.generate_root_hash(values=values, do_hash=True)
+
+
 class PRepSnapshot(object):
     """Contains P-Rep address and the delegated amount when this term started
     """
@@ -387,12 +398,8 @@ class Term(object):
         return -1
 
     def _generate_root_hash(self):
-        def _gen(snapshots: Iterable['PRepSnapshot']) -> bytes:
-            for snapshot in snapshots:
-                yield snapshot.address.to_bytes_including_prefix()
-
         self._merkle_root_hash: bytes = \
-            RootHashGenerator.generate_root_hash(values=_gen(self._main_preps), do_hash=True)
+            _generate_root_hash(tuple(snapshot.address for snapshot in self._main_preps))
 
     @classmethod
     def from_list(cls, data: List,
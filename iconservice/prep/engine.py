@@ -35,11 +35,14 @@ from ..icon_constant import Revision, IISS_MIN_IREP, PREP_PENALTY_SIGNATURE, \
 from ..iconscore.icon_score_context import IconScoreContext
 from ..iconscore.icon_score_event_log import EventLogEmitter
 from ..iconscore.icon_score_step import StepType
+from ..icx.delegation_part import DelegationPart
 from ..icx.icx_account import Account
+from ..icx.stake_part import StakePart
 from ..icx.storage import Intent
 from ..iiss.listener import EngineListener as IISSEngineListener
 from ..iiss.reward_calc import RewardCalcDataCreator
 from ..prep.prep_address_converter import PRepAddressConverter
+from ..utils.timer import Timer
 
 if TYPE_CHECKING:
     from ..iiss.reward_calc.msg_data import PRepRegisterTx, PRepUnregisterTx, TxData
@@ -161,24 +164,35 @@ class Engine(EngineBase, IISSEngineListener):
     def _load_preps(self, context: 'IconScoreContext') -> 'PRepContainer':
         """Load preps from state db
 
+        Stake and delegated amount of all P-Reps are read at once in key order after P-Rep records
+
         :return: new prep container instance
         """
+        timer = Timer()
+        timer.start()
+
         icx_storage: 'IcxStorage' = context.storage.icx
-        preps = PRepContainer()
+        prep_list: List['PRep'] = list(context.storage.prep.get_prep_iterator())
 
-        for prep in context.storage.prep.get_prep_iterator():
+        addresses: List['Address'] = [prep.address for prep in prep_list]
+        stake_parts: Dict['Address', 'StakePart'] = icx_storage.get_parts(context, StakePart, addresses)
+        delegation_parts: Dict['Address', 'DelegationPart'] = \
+            icx_storage.get_parts(context, DelegationPart, addresses)
 
+        for prep in prep_list:
             if prep.status == PRepStatus.ACTIVE:
                 self.prep_address_converter.add_node_address(node=prep.node_address, prep=prep.address)
 
-            account: 'Account' = icx_storage.get_account(context, prep.address, Intent.ALL)
-
-            prep.stake = account.stake
-            prep.delegated = account.delegated_amount
-
-            preps.add(prep)
+            prep.stake = stake_parts[prep.address].stake
+            prep.delegated = delegation_parts[prep.address].delegated_amount
 
+        preps = PRepContainer()
+        preps.add_all(prep_list)
         preps.freeze()
+
+        Logger.info(tag=_TAG,
+                    msg=f"P-Reps loaded: preps={preps.size()} active_preps={preps.size(active_prep_only=True)} "
+                        f"elapsed={timer.duration:.3f}s")
         return preps
 
     @classmethod
@@ -447,11 +461,10 @@ class Engine(EngineBase, IISSEngineListener):
         :return:
         """
 
-        for prep in context.preps:
-            if prep.penalty == PenaltyReason.BLOCK_VALIDATION and prep.status == PRepStatus.ACTIVE:
-                dirty_prep = context.get_prep(prep.address, mutable=True)
-                dirty_prep.reset_block_validation_penalty()
-                context.put_dirty_prep(dirty_prep)
+        for prep in context.preps.get_suspended_preps():
+            dirty_prep = context.get_prep(prep.address, mutable=True)
+            dirty_prep.reset_block_validation_penalty()
+            context.put_dirty_prep(dirty_prep)
 
         context.update_dirty_prep_batch()
 
@@ -944,14 +957,8 @@ class Engine(EngineBase, IISSEngineListener):
             preps_data.append(prep.to_dict(PRepDictType.FULL))
 
         # Collect P-Reps which got penalized for consecutive 660 block validation failure
-        def _func(node: 'PRep') -> bool:
-            return node.penalty == PenaltyReason.BLOCK_VALIDATION and node.status == PRepStatus.ACTIVE
-
-        # Sort preps in descending order by delegated
-        preps_on_block_validation_penalty = \
-            sorted(filter(_func, self.preps), key=lambda x: x.order())
-
-        for prep in preps_on_block_validation_penalty:
+        # in descending order by delegated
+        for prep in self.preps.get_suspended_preps():
             preps_data.append(prep.to_dict(PRepDictType.FULL))
 
         return {
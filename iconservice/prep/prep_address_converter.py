@@ -47,6 +47,9 @@ class PRepAddressConverter:
         else:
             self._node_address_mapper: dict = {}
 
+        # True if the mappers are shared with other PRepAddressConverters
+        self._is_shared: bool = False
+
     def __str__(self):
         return f"prev_node_address_mapper={self._prev_node_address_mapper} \n" \
                f"node_address_mapper={self._node_address_mapper}"
@@ -69,6 +72,7 @@ class PRepAddressConverter:
     def add_node_address(self, node: 'Address', prep: 'Address'):
         if node in self._node_address_mapper:
             raise InvalidParamsException(f"nodeAddress already in use: {node}")
+        self._copy_on_write()
         self._node_address_mapper[node] = prep
 
     def delete_node_address(self, node: 'Address', prep: 'Address'):
@@ -77,10 +81,12 @@ class PRepAddressConverter:
 
     def _delete_node_address(self, node: 'Address'):
         if node in self._node_address_mapper:
+            self._copy_on_write()
             del self._node_address_mapper[node]
 
     def _add_prev_node_address(self, node: 'Address', prep: 'Address'):
         if prep not in self._prev_node_address_mapper.values():
+            self._copy_on_write()
             self._prev_node_address_mapper[node] = prep
 
     def replace_node_address(self, node: 'Address', prep: 'Address', prev_node: 'Address'):
@@ -89,10 +95,27 @@ class PRepAddressConverter:
         self.add_node_address(node=node, prep=prep)
 
     def copy(self) -> 'PRepAddressConverter':
-        return PRepAddressConverter(prev_node_address_mapper=copy.copy(self._prev_node_address_mapper),
-                                    node_address_mapper=copy.copy(self._node_address_mapper))
+        """The copied PRepAddressConverter shares the mappers with this one until either of them changes them first
+        """
+        converter = PRepAddressConverter()
+        converter._prev_node_address_mapper = self._prev_node_address_mapper
+        converter._node_address_mapper = self._node_address_mapper
+        converter._is_shared = True
+        self._is_shared = True
+
+        return converter
+
+    def _copy_on_write(self):
+        if self._is_shared:
+            self._prev_node_address_mapper = copy.copy(self._prev_node_address_mapper)
+            self._node_address_mapper = copy.copy(self._node_address_mapper)
+            self._is_shared = False
 
     def reset_prev_node_address(self):
+        if not self._prev_node_address_mapper:
+            return
+
+        self._copy_on_write()
         self._prev_node_address_mapper.clear()
 
     def validate_node_address(self,
@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Optional, Iterable
+from typing import TYPE_CHECKING, Optional, Iterable, Dict
 
 from .data import Term
 from .data.prep import PRep
 from ..base.ComponentBase import StorageBase
 from ..base.exception import InvalidParamsException
+from ..icon_constant import PRepFlag, Revision
 from ..utils.msgpack_for_db import MsgPackForDB
 
 if TYPE_CHECKING:
@@ -25,6 +26,9 @@ if TYPE_CHECKING:
     from ..iconscore.icon_score_context import IconScoreContext
     from ..database.db import ContextDatabase
 
+# P-Rep data updated on every block, which are stored apart from the other P-Rep data
+_BLOCK_STATISTICS_FLAGS = PRepFlag.BLOCK_STATISTICS | PRepFlag.LAST_GENERATE_BLOCK_HEIGHT
+
 
 class Storage(StorageBase):
     PREFIX: bytes = b'prep'
@@ -69,12 +73,25 @@ class Storage(StorageBase):
         if value is None:
             raise InvalidParamsException(f"P-Rep not found: {str(address)}")
 
-        prep = PRep.from_bytes(value)
+        block_statistics: Optional[bytes] = None
+        if context.revision >= Revision.SEPARATE_PREP_BLOCK_STATISTICS.value:
+            block_statistics = self._db.get(context, PRep.make_block_statistics_key(address))
+
+        prep = PRep.from_bytes(value, block_statistics)
         assert address == prep.address
 
         return prep
 
     def put_prep(self, context: 'IconScoreContext', prep: 'PRep'):
+        if context.revision >= Revision.SEPARATE_PREP_BLOCK_STATISTICS.value \
+                and prep.flags & _BLOCK_STATISTICS_FLAGS:
+            key: bytes = PRep.make_block_statistics_key(prep.address)
+            self._db.put(context, key, prep.block_statistics_to_bytes())
+
+            if prep.flags | _BLOCK_STATISTICS_FLAGS == _BLOCK_STATISTICS_FLAGS:
+                # No need to write the other P-Rep data which have not been changed
+                return
+
         key: bytes = PRep.make_key(prep.address)
         value: bytes = prep.to_bytes(context.revision)
         self._db.put(context, key, value)
@@ -83,11 +100,20 @@ class Storage(StorageBase):
         key: bytes = PRep.make_key(address)
         self._db.delete(context, key)
 
+        if context.revision >= Revision.SEPARATE_PREP_BLOCK_STATISTICS.value:
+            self._db.delete(context, PRep.make_block_statistics_key(address))
+
     def get_prep_iterator(self) -> Iterable['PRep']:
+        block_statistics: Dict[bytes, bytes] = {}
+        with self._db.key_value_db.get_sub_db(PRep.BLOCK_STATISTICS_PREFIX).iterator() as it:
+            for key, value in it:
+                if key[0] == 0x00 and len(key) == 21:
+                    block_statistics[key] = value
+
         with self._db.key_value_db.get_sub_db(PRep.PREFIX).iterator() as it:
             for key, value in it:
                 if key[0] == 0x00 and len(key) == 21:
-                    yield PRep.from_bytes(value)
+                    yield PRep.from_bytes(value, block_statistics.get(key))
 
     def put_term(self, context: 'IconScoreContext', term: 'Term'):
         value: bytes = MsgPackForDB.dumps(term.to_list())
@@ -18,6 +18,7 @@ from enum import Flag
 from typing import TYPE_CHECKING, Optional
 
 from iconcommons import Logger
+from iconservice.database.batch import BlockBatch
 from iconservice.database.db import KeyValueDatabase
 from iconservice.database.wal import WriteAheadLogWriter
 from iconservice.icon_constant import ROLLBACK_LOG_TAG
@@ -26,7 +27,6 @@ from iconservice.rollback import get_backup_filename
 if TYPE_CHECKING:
     from iconservice.database.wal import IissWAL
     from iconservice.base.block import Block
-    from iconservice.database.batch import BlockBatch
 
 TAG = ROLLBACK_LOG_TAG
 
@@ -117,9 +117,15 @@ class BackupManager(object):
         if block_batch is None:
             block_batch = {}
 
+        # The previous values recorded on invoke save reading them from state_db
+        pre_images = block_batch.pre_images if isinstance(block_batch, BlockBatch) else {}
+
         def get_state_db_generator():
             for key in block_batch:
-                value: Optional[bytes] = db.get(key)
+                if key in pre_images:
+                    value: Optional[bytes] = pre_images[key]
+                else:
+                    value: Optional[bytes] = db.get(key)
                 yield key, value
 
         writer.write_walogable(get_state_db_generator())
@@ -15,14 +15,15 @@
 
 import os
 import shutil
-from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+import time
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple, List, Set
 
 from iconcommons.logger import Logger
 from .backup_manager import get_backup_filename
 from ..base.exception import InvalidParamsException, InternalServiceErrorException
 from ..database.db import KeyValueDatabase
 from ..database.wal import WriteAheadLogReader, WALDBType
-from ..icon_constant import ROLLBACK_LOG_TAG
+from ..icon_constant import ROLLBACK_LOG_TAG, ROLLBACK_WRITE_BATCH_SIZE
 from ..iiss.reward_calc import RewardCalcStorage
 from ..iiss.reward_calc.msg_data import make_block_produce_info_key
 
@@ -33,17 +34,77 @@ if TYPE_CHECKING:
 TAG = ROLLBACK_LOG_TAG
 
 
+class _BatchWriter(object):
+    """Write key-value pairs to db with write batches of bounded size
+
+    Only the first value of each key is written
+    """
+
+    def __init__(self, db: 'KeyValueDatabase', max_size: int):
+        self._db = db
+        self._max_size = max_size
+        self._batch: List[Tuple[bytes, Optional[bytes]]] = []
+        self._keys: Set[bytes] = set()
+        self.count = 0
+
+    def write(self, it: Iterable[Tuple[bytes, Optional[bytes]]]):
+        keys = self._keys
+        batch = self._batch
+
+        for key, value in it:
+            if key in keys:
+                continue
+
+            keys.add(key)
+            batch.append((key, value))
+            if len(batch) >= self._max_size:
+                self.flush()
+
+    def flush(self, sync: bool = False):
+        if len(self._batch) > 0 or sync:
+            self.count += self._db.write_batch(self._batch, sync=sync)
+            self._batch.clear()
+
+
+class _Progress(object):
+    def __init__(self, total: int):
+        self._total = total
+        self._done = 0
+        self._count = 0
+        self._start_time: float = time.monotonic()
+
+    def update(self, block_height: int, count: int):
+        self._done += 1
+        self._count = count
+        Logger.info(tag=TAG, msg=f"block_height={block_height} {self}")
+
+    def __str__(self) -> str:
+        elapsed: float = max(time.monotonic() - self._start_time, 1e-6)
+        return f"files={self._done}/{self._total} " \
+               f"entries={self._count} " \
+               f"elapsed={elapsed:.3f}s " \
+               f"throughput={self._count / elapsed:.1f}entries/s"
+
+
 class RollbackManager(object):
     """Rollback the current state to the one block previous one with a backup file
 
+    Backup files are streamed into databases with bounded size write batches
+    So memory usage depends on the number of keys, not on the size of values
+
     Assume that the rollback of Reward Calculator has been already done
     Related databases: state_db, iiss_db
     """
 
-    def __init__(self, backup_root_path: str, rc_data_path: str, state_db: 'KeyValueDatabase'):
+    def __init__(self,
+                 backup_root_path: str,
+                 rc_data_path: str,
+                 state_db: 'KeyValueDatabase',
+                 write_batch_size: int = ROLLBACK_WRITE_BATCH_SIZE):
         self._backup_root_path = backup_root_path
         self._rc_data_path = rc_data_path
         self._state_db = state_db
+        self._write_batch_size = write_batch_size
 
     def run(self, last_block_height: int, rollback_block_height: int, term_start_block_height: int):
         """Rollback to the previous block state
@@ -62,39 +123,50 @@ class RollbackManager(object):
         term_change_exists = \
             self._term_change_exists(last_block_height, rollback_block_height, term_start_block_height)
         calc_end_block_height = term_start_block_height - 1
-        reader = WriteAheadLogReader()
-        state_db_batch = {}
-        iiss_db_batch = {}
 
-        for block_height in range(last_block_height - 1, rollback_block_height - 1, -1):
-            # Make backup file with a given block_height
+        # Check if all backup files exist before changing any db
+        paths = []
+        for block_height in range(rollback_block_height, last_block_height):
             path: str = self._get_backup_file_path(block_height)
             if not os.path.isfile(path):
                 raise InternalServiceErrorException(f"Backup file not found: {path}")
-
-            reader.open(path)
-
-            # Merge backup data into state_db_batch
-            self._write_batch(reader.get_iterator(WALDBType.STATE.value), state_db_batch)
-
-            # Merge backup data into iiss_db_batch
-            if not (term_change_exists and block_height > calc_end_block_height):
-                self._write_batch(reader.get_iterator(WALDBType.RC.value), iiss_db_batch)
-
-            reader.close()
+            paths.append((block_height, path))
 
         # If a term change is detected during rollback, handle the exceptions below
         if term_change_exists:
-            self._remove_block_produce_info(iiss_db_batch, calc_end_block_height)
             self._rename_iiss_db_to_current_db(calc_end_block_height)
 
-        # Commit write_batch to db
-        self._commit_batch(state_db_batch, self._state_db)
         iiss_db = RewardCalcStorage.create_current_db(self._rc_data_path)
-        self._commit_batch(iiss_db_batch, iiss_db)
-        iiss_db.close()
+        state_db_writer = _BatchWriter(self._state_db, self._write_batch_size)
+        iiss_db_writer = _BatchWriter(iiss_db, self._write_batch_size)
+        progress = _Progress(len(paths))
 
-        Logger.info(tag=TAG, msg="run() end")
+        try:
+            if term_change_exists:
+                self._remove_block_produce_info(iiss_db_writer, calc_end_block_height)
+
+            # The backup file of the block to rollback to has the highest priority.
+            # So the key which has already been written is skipped in the newer backup files.
+            reader = WriteAheadLogReader()
+            for block_height, path in paths:
+                reader.open(path)
+                try:
+                    state_db_writer.write(reader.get_iterator(WALDBType.STATE.value))
+                    if not (term_change_exists and block_height > calc_end_block_height):
+                        iiss_db_writer.write(reader.get_iterator(WALDBType.RC.value))
+                finally:
+                    reader.close()
+
+                progress.update(block_height, state_db_writer.count + iiss_db_writer.count)
+
+            # No WAL file covers the states written by rollback
+            # so they should be durable before the rollback metadata is removed
+            state_db_writer.flush(sync=True)
+            iiss_db_writer.flush(sync=True)
+        finally:
+            iiss_db.close()
+
+        Logger.info(tag=TAG, msg=f"run() end: {progress}")
 
     @staticmethod
     def _validate_block_heights(last_block_height: int, rollback_block_height: int, term_start_block_height: int):
@@ -115,15 +187,6 @@ class RollbackManager(object):
     def _term_change_exists(last_block_height: int, rollback_block_height: int, term_start_block_height: int) -> bool:
         return rollback_block_height < term_start_block_height <= last_block_height
 
-    @staticmethod
-    def _write_batch(it: Iterable[Tuple[bytes, Optional[bytes]]], batch: dict):
-        for key, value in it:
-            batch[key] = value
-
-    @staticmethod
-    def _commit_batch(batch: dict, db: 'KeyValueDatabase'):
-        db.write_batch(batch.items())
-
     def _get_backup_file_path(self, block_height: int) -> str:
         """
 
@@ -166,10 +229,10 @@ class RollbackManager(object):
         Logger.debug(tag=TAG, msg="_rename_iiss_db_to_current_db() end")
 
     @classmethod
-    def _remove_block_produce_info(cls, iiss_db_batch: dict, block_height: int):
+    def _remove_block_produce_info(cls, iiss_db_writer: '_BatchWriter', block_height: int):
         """Remove block_produce_info of calc_period_end_block from current_db
 
-        :param iiss_db_batch:
+        :param iiss_db_writer:
         :param block_height: the end block of the previous term
         :return:
         """
@@ -178,6 +241,6 @@ class RollbackManager(object):
 
         # Remove the end calc block from iiss_db
         key: bytes = make_block_produce_info_key(block_height)
-        iiss_db_batch[key] = None
+        iiss_db_writer.write(((key, None),))
 
         Logger.debug(tag=TAG, msg="_remove_block_produce_info() end")
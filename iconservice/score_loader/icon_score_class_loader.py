@@ -18,7 +18,10 @@ import importlib
 import json
 import os
 import sys
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from threading import Lock
+from types import ModuleType
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 import iconservice.iconscore.utils as utils
 from iconservice.base.address import Address
@@ -33,6 +36,15 @@ class IconScoreClassLoader:
     """IconScoreBase subclass Loader
 
     """
+    # SCORE classes loaded in advance by preload(): (score_address, tx_hash) -> class
+    _preloaded_classes: Dict[Tuple['Address', bytes], type] = {}
+    # SCOREs being loaded by preload(). run() removes its SCORE to make preload() discard the loaded class
+    _preloading: Set[Tuple['Address', bytes]] = set()
+    # SCOREs in the order of loading: score_address -> tx_hash
+    _usages: 'OrderedDict[Address, bytes]' = OrderedDict()
+    # Guards the SCOREs preloaded and the usages which are accessed on several threads
+    _usages_lock = Lock()
+
     @classmethod
     def init(cls, score_root_path: str):
         if score_root_path not in sys.path:
@@ -41,6 +53,67 @@ class IconScoreClassLoader:
     @classmethod
     def close(cls, score_root_path: str):
         sys.path.remove(score_root_path)
+        with cls._usages_lock:
+            cls._preloaded_classes.clear()
+            cls._preloading.clear()
+            cls._usages.clear()
+
+    @classmethod
+    def get_usages(cls) -> List[Tuple['Address', bytes]]:
+        """Returns the SCOREs loaded so far from the least recently loaded one
+
+        :return: list of (score_address, tx_hash)
+        """
+        with cls._usages_lock:
+            return list(cls._usages.items())
+
+    @classmethod
+    def add_past_usages(cls, usages: List[Tuple['Address', bytes]]):
+        """Adds the SCOREs loaded before, for example by the previous process
+
+        They are regarded as less recently loaded than the ones loaded so far
+
+        :param usages: list of (score_address, tx_hash) from the least recently loaded one
+        """
+        with cls._usages_lock:
+            past_usages = OrderedDict(usages)
+            past_usages.update(cls._usages)
+            for score_address in cls._usages:
+                past_usages.move_to_end(score_address)
+            cls._usages = past_usages
+
+    @classmethod
+    def _add_usage(cls, score_address: 'Address', tx_hash: bytes):
+        with cls._usages_lock:
+            cls._usages[score_address] = tx_hash
+            cls._usages.move_to_end(score_address)
+
+    @classmethod
+    def preload(cls, score_address: 'Address', tx_hash: bytes, score_root_path: str):
+        """Loads a SCORE class in advance so that run() returns it without importing it
+
+        It can be called on a thread other than the one calling run()
+
+        :param score_address:
+        :param tx_hash:
+        :param score_root_path:
+        """
+        key = (score_address, tx_hash)
+        with cls._usages_lock:
+            if key in cls._preloaded_classes or key in cls._preloading:
+                return
+            cls._preloading.add(key)
+
+        score_class: Optional[type] = None
+        try:
+            score_class = cls._load(score_address, tx_hash, score_root_path)
+        finally:
+            with cls._usages_lock:
+                # The class is not kept if run() has been called for it during loading
+                if key in cls._preloading:
+                    cls._preloading.remove(key)
+                    if score_class is not None:
+                        cls._preloaded_classes[key] = score_class
 
     @classmethod
     def _load_package_json(cls, score_deploy_path: str) -> dict:
@@ -83,14 +156,48 @@ class IconScoreClassLoader:
         :param score_root_path:
         :return: subclass derived from IconScoreBase
         """
+        key = (score_address, tx_hash)
+        with cls._usages_lock:
+            score_class: Optional[type] = cls._preloaded_classes.pop(key, None)
+            cls._preloading.discard(key)
+
+        if score_class is None:
+            score_class = cls._load(score_address, tx_hash, score_root_path)
+
+        cls._add_usage(score_address, tx_hash)
+        return score_class
+
+    @classmethod
+    def _load(cls, score_address: 'Address', tx_hash: bytes, score_root_path: str) -> type:
         score_deploy_path: str = utils.get_score_deploy_path(score_root_path, score_address, tx_hash)
         package_name: str = utils.get_package_name_by_address_and_tx_hash(score_address, tx_hash)
 
         package_json: dict = IconScoreClassLoader._load_package_json(score_deploy_path)
         main_module, main_score = IconScoreClassLoader._get_package_info(package_json)
 
-        # In order for the new module to be noticed by the import system
-        importlib.invalidate_caches()
-        module = importlib.import_module(f".{main_module}", package_name)
+        module = IconScoreClassLoader._import_module(f".{main_module}", package_name)
 
         return getattr(module, main_score)
+
+    @classmethod
+    def _import_module(cls, name: str, package_name: str) -> ModuleType:
+        """Imports a module in a SCORE package
+
+        The caches of the import system are invalidated
+        only when a module in the SCORE package is not found with them.
+        It is not needed to invalidate them for every SCORE on loading deployed SCOREs.
+
+        :param name: module name relative to package_name
+        :param package_name: SCORE package name
+        :return: module
+        """
+        try:
+            return importlib.import_module(name, package_name)
+        except ModuleNotFoundError as e:
+            root_package: str = package_name.split('.', 1)[0]
+            if e.name is None or e.name.split('.', 1)[0] != root_package:
+                raise e
+
+        # In order for the new module to be noticed by the import system
+        importlib.invalidate_caches()
+        return importlib.import_module(name, package_name)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from iconcommons.logger import Logger
+
+from .icon_score_class_loader import IconScoreClassLoader
+from ..base.address import Address
+from ..icon_constant import ICON_DEPLOY_LOG_TAG
+
+SCORE_USAGE_FILE = ".score_usage.json"
+
+
+class IconScoreWarmer(object):
+    """Loads the SCOREs used recently on a worker thread on startup
+
+    The SCOREs loaded by IconScoreClassLoader are saved to the usage file in score_root_path on close
+    and are loaded in advance on the next startup from the most recently used one.
+    The first transaction calling one of them does not have to import it during block invoke.
+    """
+
+    def __init__(self, score_root_path: str, max_count: int):
+        """
+        :param score_root_path: directory containing all deployed SCOREs
+        :param max_count: the maximum number of SCOREs to load in advance. 0 means no warm-up
+        """
+        self._score_root_path = score_root_path
+        self._path = os.path.join(score_root_path, SCORE_USAGE_FILE)
+        self._max_count = max_count
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stopped = False
+
+    def start(self):
+        """Starts to load the SCOREs in the usage file on a worker thread
+        """
+        if self._max_count <= 0:
+            return
+
+        # Skip the SCOREs already loaded like builtin SCOREs
+        loaded = set(score_address for score_address, _ in IconScoreClassLoader.get_usages())
+        usages: List[Tuple['Address', bytes]] = self._load_usages()
+        IconScoreClassLoader.add_past_usages(usages)
+        usages = [usage for usage in usages if usage[0] not in loaded]
+
+        if len(usages) > 0:
+            self._stopped = False
+            self._executor = ThreadPoolExecutor(1, thread_name_prefix="score_warmer")
+            self._executor.submit(self._warm_up, list(reversed(usages)))
+
+    def close(self):
+        """Stops loading SCOREs and saves the SCOREs used so far to the usage file
+        """
+        if self._max_count <= 0:
+            return
+
+        if self._executor is not None:
+            self._stopped = True
+            self._executor.shutdown()
+            self._executor = None
+
+        self._save_usages(IconScoreClassLoader.get_usages())
+
+    def _warm_up(self, usages: List[Tuple['Address', bytes]]):
+        for score_address, tx_hash in usages:
+            if self._stopped:
+                break
+
+            try:
+                IconScoreClassLoader.preload(score_address, tx_hash, self._score_root_path)
+            except BaseException as e:
+                # The SCORE will be loaded again when it is used
+                Logger.warning(f"Failed to warm up a SCORE: {score_address} {e}", ICON_DEPLOY_LOG_TAG)
+
+        Logger.info(f"Warm-up done: {len(usages)} SCOREs", ICON_DEPLOY_LOG_TAG)
+
+    def _load_usages(self) -> List[Tuple['Address', bytes]]:
+        try:
+            with open(self._path, "r") as f:
+                items: list = json.load(f)
+
+            usages = [(Address.from_string(address), bytes.fromhex(tx_hash)) for address, tx_hash in items]
+        except FileNotFoundError:
+            return []
+        except BaseException as e:
+            Logger.warning(f"Invalid SCORE usage file: {self._path} {e}", ICON_DEPLOY_LOG_TAG)
+            return []
+
+        return usages[-self._max_count:]
+
+    def _save_usages(self, usages: List[Tuple['Address', bytes]]):
+        items = [(str(address), tx_hash.hex()) for address, tx_hash in usages[-self._max_count:]]
+        tmp_path = f"{self._path}.tmp"
+
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(items, f)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            Logger.warning(f"Failed to save the SCORE usage file: {self._path} {e}", ICON_DEPLOY_LOG_TAG)
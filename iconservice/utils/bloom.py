@@ -3,12 +3,16 @@
 #
 # changes
 #   hash function : keccak() -> sha3_256()
+#   BloomBuilder : builds many bloom filters sharing the hashes of the same values
 
 from __future__ import absolute_import
 
 import hashlib
 import numbers
 import operator
+from typing import Dict, Iterable, Tuple
+
+BLOOM_BYTE_SIZE = 256
 
 
 def get_chunks_for_bloom(value_hash):
@@ -29,6 +33,17 @@ def get_bloom_bits(value):
         yield bloom_bits
 
 
+def get_bloom_bit_indexes(value: bytes) -> Tuple[int, int, int]:
+    """Returns the indexes of the bits set by get_bloom_bits(value)
+    """
+    value_hash = hashlib.sha3_256(value).digest()
+    return (
+        ((value_hash[0] << 8) + value_hash[1]) & 2047,
+        ((value_hash[2] << 8) + value_hash[3]) & 2047,
+        ((value_hash[4] << 8) + value_hash[5]) & 2047,
+    )
+
+
 class BloomFilter(numbers.Number):
     value = None
 
@@ -91,4 +106,47 @@ class BloomFilter(numbers.Number):
         return self._icombine(other)
 
     def __iadd__(self, other):
-        return self._icombine(other)
\ No newline at end of file
+        return self._icombine(other)
+
+
+class BloomBuilder(object):
+    """Builds the bloom filters of event logs in a block
+
+    The bit indexes of a value are computed once and shared by all bloom filters it builds,
+    as the same values like SCORE addresses and event signatures repeat in a block.
+    The bits are set to a bytearray and converted to an int once for each bloom filter.
+    """
+
+    def __init__(self):
+        self._bit_indexes: Dict[bytes, Tuple[int, int, int]] = {}
+        self._aggregated_value: int = 0
+
+    def build(self, values: Iterable[bytes]) -> BloomFilter:
+        """Returns the bloom filter of values
+
+        :param values: values to add to the bloom filter
+        :return: the same bloom filter as BloomFilter.from_iterable(values)
+        """
+        bits = bytearray(BLOOM_BYTE_SIZE)
+        bit_indexes = self._bit_indexes
+        last = BLOOM_BYTE_SIZE - 1
+
+        for value in values:
+            indexes = bit_indexes.get(value)
+            if indexes is None:
+                if not isinstance(value, bytes):
+                    raise TypeError("Value must be of type `bytes`")
+                indexes = bit_indexes[value] = get_bloom_bit_indexes(value)
+
+            for index in indexes:
+                bits[last - (index >> 3)] |= 1 << (index & 7)
+
+        value = int.from_bytes(bits, "big")
+        self._aggregated_value |= value
+        return BloomFilter(value)
+
+    @property
+    def aggregated_bloom(self) -> BloomFilter:
+        """Returns the union of all bloom filters built so far
+        """
+        return BloomFilter(self._aggregated_value)
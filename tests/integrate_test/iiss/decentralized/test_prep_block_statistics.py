@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Block validation statistics of P-Reps stored apart from the other P-Rep data
+"""
+
+from iconservice.icon_constant import ICX_IN_LOOP, Revision
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.prep.data import PRep
+from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
+
+
+class TestPRepBlockStatistics(TestIISSBase):
+    def setUp(self):
+        super().setUp()
+        self.init_decentralized()
+
+    def _get_prep_data_from_db(self, address) -> bytes:
+        return IconScoreContext.storage.prep._db.key_value_db.get(PRep.make_key(address))
+
+    def test_block_statistics(self):
+        self.set_revision(Revision.SEPARATE_PREP_BLOCK_STATISTICS.value)
+        generator = self._accounts[0]
+        validator = self._accounts[1]
+
+        self.make_blocks(to=self._block_height + 1,
+                         prev_block_generator=generator.address,
+                         prev_block_validators=[validator.address])
+        old_prep: dict = self.get_prep(generator)
+        old_data: bytes = self._get_prep_data_from_db(generator.address)
+
+        block_count: int = 2
+        self.make_blocks(to=self._block_height + block_count,
+                         prev_block_generator=generator.address,
+                         prev_block_validators=[validator.address])
+
+        # Other P-Rep data are not written again while only block statistics change
+        self.assertEqual(old_data, self._get_prep_data_from_db(generator.address))
+
+        expected: dict = self.get_prep(generator)
+        self.assertEqual(old_prep["totalBlocks"] + block_count, expected["totalBlocks"])
+        self.assertEqual(old_prep["validatedBlocks"] + block_count, expected["validatedBlocks"])
+        self.assertEqual(self._block_height - 1, expected["lastGenerateBlockHeight"])
+
+        # Block statistics are loaded with the other P-Rep data on startup
+        preps = {prep.address: prep for prep in IconScoreContext.storage.prep.get_prep_iterator()}
+        prep: 'PRep' = preps[generator.address]
+        self.assertEqual(expected["totalBlocks"], prep.total_blocks)
+        self.assertEqual(expected["validatedBlocks"], prep.validated_blocks)
+        self.assertEqual(expected["lastGenerateBlockHeight"], prep.last_generate_block_height)
+
+        # All P-Rep data are written when the other data are changed
+        self.transfer_icx(from_=self._admin, to_=generator, value=10 * ICX_IN_LOOP)
+        tx: dict = self.create_set_prep_tx(from_=generator, set_data={"name": "new name"})
+        self.process_confirm_block_tx([tx])
+        self.assertNotEqual(old_data, self._get_prep_data_from_db(generator.address))
+
+        prep = PRep.from_bytes(self._get_prep_data_from_db(generator.address))
+        self.assertEqual("new name", prep.name)
+        self.assertEqual(expected["totalBlocks"], prep.total_blocks)
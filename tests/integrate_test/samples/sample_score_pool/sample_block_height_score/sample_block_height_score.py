@@ -0,0 +1,26 @@
+from iconservice import *
+
+
+class SampleBlockHeightScore(IconScoreBase):
+
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        # The member depends on the block where this instance is created
+        if self.block_height % 2 == 0:
+            self._count = VarDB('even', db, value_type=int)
+        else:
+            self._count = VarDB('odd', db, value_type=int)
+
+    def on_install(self) -> None:
+        super().on_install()
+
+    def on_update(self) -> None:
+        super().on_update()
+
+    @external
+    def increase(self):
+        self._count.set(self._count.get() + 1)
+
+    @external(readonly=True)
+    def get_count(self, name: str) -> int:
+        return VarDB(name, self.db, value_type=int).get()
@@ -0,0 +1,24 @@
+from iconservice import *
+
+
+class SampleDictScore(IconScoreBase):
+
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._values = DictDB('values', db, value_type=int)
+        self._total = VarDB('total', db, value_type=int)
+
+    def on_install(self) -> None:
+        super().on_install()
+
+    def on_update(self) -> None:
+        super().on_update()
+
+    @external
+    def add(self, value: int):
+        self._values[self.msg.sender] += value
+        self._total.set(self._total.get() + value)
+
+    @external(readonly=True)
+    def total(self) -> int:
+        return self._total.get()
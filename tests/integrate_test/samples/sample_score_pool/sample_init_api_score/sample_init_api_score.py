@@ -0,0 +1,20 @@
+from iconservice import *
+
+
+class SampleInitApiScore(IconScoreBase):
+
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._values = ArrayDB('values', db, value_type=int)
+        # API_CALL steps are applied in the constructor
+        sha3_256(b'init')
+
+    def on_install(self) -> None:
+        super().on_install()
+
+    def on_update(self) -> None:
+        super().on_update()
+
+    @external
+    def add(self, value: int):
+        self._values.put(value)
@@ -0,0 +1,21 @@
+from iconservice import *
+
+
+class SampleInitWriteScore(IconScoreBase):
+
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._values = ArrayDB('values', db, value_type=int)
+        # A state written in the constructor, which is not allowed but possible
+        self._version = VarDB('version', db, value_type=int)
+        self._version.set(1)
+
+    def on_install(self) -> None:
+        super().on_install()
+
+    def on_update(self) -> None:
+        super().on_update()
+
+    @external
+    def add(self, value: int):
+        self._values.put(value)
@@ -0,0 +1,24 @@
+from iconservice import *
+
+
+class SampleMemberScore(IconScoreBase):
+
+    def __init__(self, db: IconScoreDatabase) -> None:
+        super().__init__(db)
+        self._value = VarDB('value', db, value_type=int)
+
+    def on_install(self) -> None:
+        super().on_install()
+
+    def on_update(self) -> None:
+        super().on_update()
+
+    @external
+    def remember(self, value: int):
+        # A member which is not a container db is kept only in this instance
+        self._cache = value
+        self._value.set(value)
+
+    @external(readonly=True)
+    def get_cache(self) -> int:
+        return getattr(self, "_cache", 0)
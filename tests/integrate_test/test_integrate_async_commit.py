@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Commit on the committer thread
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import patch
+
+from iconservice.base.exception import DatabaseException, FatalException
+from iconservice.icon_constant import ConfigKey, ICX_IN_LOOP, Revision
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.icx.coin_part import CoinPart
+from iconservice.iiss.reward_calc.ipc.reward_calc_proxy import RewardCalcProxy
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+
+class TestIntegrateCommitOrder(TestIntegrateBase):
+    def setUp(self):
+        super().setUp()
+        self.update_governance()
+        self.set_revision(Revision.IISS.value)
+
+    def test_backup_before_writing_rc_db(self):
+        engine = self.icon_service_engine
+        process_iiss_commit = engine._process_iiss_commit
+        backup_paths = []
+
+        def _process_iiss_commit(context, *args, **kwargs):
+            # The backup file of the previous block is written before rc_db is updated
+            path: str = engine._backup_manager._get_backup_file_path(context.block.height - 1)
+            self.assertTrue(os.path.isfile(path))
+            backup_paths.append(path)
+            return process_iiss_commit(context, *args, **kwargs)
+
+        with patch.object(engine, "_process_iiss_commit", side_effect=_process_iiss_commit):
+            self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+
+        self.assertEqual(1, len(backup_paths))
+
+    def test_commit_preps_under_commit_lock(self):
+        engine = self.icon_service_engine
+        prep_engine = IconScoreContext.engine.prep
+        commit = prep_engine.commit
+        locked = []
+
+        def _commit(*args, **kwargs):
+            # Readonly contexts get P-Reps from the same block as the last block and state_db
+            locked.append(engine._commit_lock.locked())
+            return commit(*args, **kwargs)
+
+        with patch.object(prep_engine, "commit", side_effect=_commit):
+            self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+
+        self.assertEqual([True], locked)
+
+    def test_fail_to_write_state_db(self):
+        engine = self.icon_service_engine
+        last_block = engine._get_last_block()
+
+        tx = self.create_transfer_icx_tx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+        block, _ = self.make_and_req_block([tx])
+
+        with patch.object(engine, "_write_state_db", side_effect=DatabaseException("Failed to write")):
+            with self.assertRaises(DatabaseException):
+                engine.commit(block.height, block.hash, block.hash)
+
+        # The states in memory are not changed if state_db is not written
+        self.assertEqual(last_block, engine._get_last_block())
+        self.assertEqual(0, self.get_balance(self._accounts[0]))
+
+
+class TestIntegrateAsyncCommit(TestIntegrateCommitOrder):
+    def _make_init_config(self) -> dict:
+        return {ConfigKey.ASYNC_COMMIT: True}
+
+    def test_transfer_icx(self):
+        value = 1 * ICX_IN_LOOP
+        for i in range(3):
+            self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=value)
+            self.assertEqual(value * (i + 1), self.get_balance(self._accounts[0]))
+
+    def test_invoke_while_writing_states(self):
+        engine = self.icon_service_engine
+        value = 10 * ICX_IN_LOOP
+
+        # Hold the committer thread until the next block is invoked
+        event = Event()
+        engine._committer.submit(event.wait)
+
+        tx = self.create_transfer_icx_tx(from_=self._admin, to_=self._accounts[0], value=value)
+        block, _ = self.make_and_req_block([tx])
+        self._write_precommit_state(block)
+
+        # The states of the committed block have not been written to state_db yet
+        key: bytes = CoinPart.make_key(self._accounts[0].address)
+        self.assertIsNone(self.get_state_db(key))
+        self.assertTrue(os.path.isfile(engine._get_write_ahead_log_path()))
+
+        # The next block is invoked with the states of the committed block
+        tx = self.create_transfer_icx_tx(
+            from_=self._accounts[0], to_=self._accounts[1], value=value // 2, disable_pre_validate=True)
+        block, hash_list = self.make_and_req_block([tx])
+        tx_results = self.get_tx_results(hash_list)
+        self.assertEqual(1, tx_results[0].status)
+
+        event.set()
+        self._write_precommit_state(block)
+
+        self.assertIsNotNone(self.get_state_db(key))
+        self.assertEqual(value // 2, self.get_balance(self._accounts[1]))
+        self.assertFalse(os.path.isfile(engine._get_write_ahead_log_path()))
+
+    def test_send_commit_before_writing_states(self):
+        engine = self.icon_service_engine
+
+        # Hold the committer thread until the block is committed
+        event = Event()
+        engine._committer.submit(event.wait)
+
+        try:
+            tx = self.create_transfer_icx_tx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+            block, _ = self.make_and_req_block([tx])
+            RewardCalcProxy.commit_block.reset_mock()
+            self._write_precommit_state(block)
+
+            # The reward calculator gets the commit of the block before the next block is invoked
+            RewardCalcProxy.commit_block.assert_called_once_with(True, block.height, block.hash)
+            self.assertIsNone(self.get_state_db(CoinPart.make_key(self._accounts[0].address)))
+        finally:
+            event.set()
+
+        engine._wait_for_commit()
+        self.assertEqual(ICX_IN_LOOP, self.get_balance(self._accounts[0]))
+
+    def test_fail_to_write_state_db(self):
+        engine = self.icon_service_engine
+
+        tx = self.create_transfer_icx_tx(from_=self._admin, to_=self._accounts[0], value=ICX_IN_LOOP)
+        block, _ = self.make_and_req_block([tx])
+        RewardCalcProxy.commit_block.reset_mock()
+
+        # The process stops after IPC messages are sent and before state_db is written
+        with patch.object(engine, "_write_state_db", side_effect=DatabaseException("Failed to write")):
+            self._write_precommit_state(block)
+            engine._commit_future.exception()
+
+        RewardCalcProxy.commit_block.assert_called_once_with(True, block.height, block.hash)
+        self.assertTrue(os.path.isfile(engine._get_write_ahead_log_path()))
+
+        # The failure is raised until the engine is closed
+        for _ in range(2):
+            with self.assertRaises(FatalException):
+                engine.commit(block.height + 1, block.hash, block.hash)
+
+        # state_db is recovered with the WAL file on restart without sending COMMIT_BLOCK again
+        engine.close()
+        RewardCalcProxy.commit_block.reset_mock()
+        self.icon_service_engine = IconServiceEngine()
+        self.icon_service_engine.open(self._config)
+        self.icon_service_engine.hello()
+
+        RewardCalcProxy.commit_block.assert_not_called()
+        self.assertEqual(block, self.icon_service_engine._get_last_block())
+        self.assertEqual(ICX_IN_LOOP, self.get_balance(self._accounts[0]))
+        self.assertFalse(os.path.isfile(self.icon_service_engine._get_write_ahead_log_path()))
+
+    def test_query_on_multiple_threads(self):
+        engine = self.icon_service_engine
+        value = 1 * ICX_IN_LOOP
+        stop = Event()
+
+        def query() -> list:
+            balances = []
+            while not stop.is_set():
+                balances.append(self.get_balance(self._accounts[0]))
+            return balances
+
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(query) for _ in range(4)]
+            for i in range(5):
+                self.transfer_icx(from_=self._admin, to_=self._accounts[0], value=value)
+            stop.set()
+            results = [future.result() for future in futures]
+
+        # Each query sees the balance of a committed block
+        for balances in results:
+            self.assertEqual(sorted(balances), balances)
+            for balance in balances:
+                self.assertEqual(0, balance % value)
+
+        self.assertEqual(value * 5, self.get_balance(self._accounts[0]))
+        # No snapshot is held by queries any more
+        snapshot = engine._icx_context_db.key_value_db.acquire_snapshot()
+        self.assertEqual(2, snapshot.ref_count)
+        snapshot.release()
@@ -20,6 +20,8 @@
 from typing import TYPE_CHECKING, List
 
 from iconservice.base.address import SYSTEM_SCORE_ADDRESS
+from iconservice.iconscore.icon_score_event_log import EventLogEmitter
+from iconservice.utils.bloom import BloomFilter
 from tests.integrate_test.test_integrate_base import TestIntegrateBase
 
 if TYPE_CHECKING:
@@ -373,3 +375,38 @@ class TestIntegrateEventLog(TestIntegrateBase):
         event_log = tx_results[0].event_logs
         self.assertEqual(event_log[0].data[0], "A")
         self.assertEqual(event_log[1].data[0], "C")
+
+    def test_logs_bloom(self):
+        tx_results: List['TransactionResult'] = self.deploy_score(score_root="sample_event_log_scores",
+                                                                  score_name="sample_event_log_score",
+                                                                  from_=self._accounts[0],
+                                                                  to_=SYSTEM_SCORE_ADDRESS)
+        score_address = tx_results[0].score_address
+
+        # Transactions in a block emit the same event logs and different ones
+        tx_list = [
+            self.create_score_call_tx(from_=self._accounts[0],
+                                      to_=score_address,
+                                      func_name="call_valid_event_log",
+                                      params={"value1": "test1", "value2": f"test{i % 2}", "value3": "test3"})
+            for i in range(3)
+        ]
+        tx_list.append(self.create_transfer_icx_tx(from_=self._admin, to_=self._accounts[1], value=1))
+
+        block, tx_results, _, _, _ = self.debug_make_and_req_block(tx_list)
+        self._write_precommit_state(block)
+        self.assertEqual(len(tx_list), len(tx_results))
+
+        block_logs_bloom = BloomFilter()
+        for tx_result in tx_results:
+            expected = BloomFilter()
+            for event_log in tx_result.event_logs:
+                expected.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+                for i, indexed_item in enumerate(event_log.indexed):
+                    expected.add(EventLogEmitter.get_ordered_bytes(i, indexed_item))
+
+            self.assertEqual(int(expected), int(tx_result.logs_bloom))
+            block_logs_bloom |= expected
+
+        precommit_data = self.icon_service_engine._precommit_data_manager.get(block.hash)
+        self.assertEqual(int(block_logs_bloom), int(precommit_data.logs_bloom))
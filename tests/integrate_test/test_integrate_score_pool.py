@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reuse SCORE instances since Revision.THREE
+"""
+
+from typing import TYPE_CHECKING, List
+
+from iconservice.base.address import GOVERNANCE_SCORE_ADDRESS
+from iconservice.icon_constant import Revision
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_mapper_object import IconScoreInfo
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateScorePool(TestIntegrateBase):
+    def setUp(self):
+        super().setUp()
+        self.update_governance()
+        self.set_revision(Revision.THREE.value)
+
+    def _deploy(self, score_name: str) -> 'Address':
+        tx_results: List['TransactionResult'] = self.deploy_score(
+            score_root="sample_score_pool",
+            score_name=score_name,
+            from_=self._accounts[0])
+        return tx_results[0].score_address
+
+    @staticmethod
+    def _get_score_info(score_address: 'Address') -> 'IconScoreInfo':
+        return IconScoreContext.icon_score_mapper.get(score_address)
+
+    def test_reuse_score(self):
+        score_address: 'Address' = self._deploy("sample_dict_score")
+
+        self.score_call(from_=self._accounts[0], to_=score_address,
+                        func_name="add", params={"value": hex(1)})
+        score_info: 'IconScoreInfo' = self._get_score_info(score_address)
+
+        # Drop idle instances so that the next call creates a new one
+        score_info._idle_scores.clear()
+        create_count: int = score_info.create_count
+        tx_results = self.score_call(from_=self._accounts[0], to_=score_address,
+                                     func_name="add", params={"value": hex(1)})
+        self.assertEqual(create_count + 1, score_info.create_count)
+        created_step_used: int = tx_results[0].step_used
+
+        reuse_count: int = score_info.reuse_count
+        tx_results = self.score_call(from_=self._accounts[0], to_=score_address,
+                                     func_name="add", params={"value": hex(1)})
+        self.assertEqual(reuse_count + 1, score_info.reuse_count)
+
+        # The reused instance applies the same steps as a newly created one
+        self.assertEqual(created_step_used, tx_results[0].step_used)
+
+        for i in range(3):
+            total = self.query_score(from_=None, to_=score_address, func_name="total")
+            self.assertEqual(3, total)
+
+        self.assertTrue(score_info.to_dict()["reusable"])
+
+        stats: dict = IconScoreContext.icon_score_mapper.get_score_pool_stats()
+        self.assertLessEqual(score_info.reuse_count, stats["reuseCount"])
+
+    def test_do_not_reuse_score_with_member_state(self):
+        score_address: 'Address' = self._deploy("sample_member_score")
+
+        self.score_call(from_=self._accounts[0], to_=score_address,
+                        func_name="remember", params={"value": hex(10)})
+
+        # The member set by the previous call is not seen by a new call
+        for _ in range(2):
+            cache = self.query_score(from_=None, to_=score_address, func_name="get_cache")
+            self.assertEqual(0, cache)
+
+        score_info: 'IconScoreInfo' = self._get_score_info(score_address)
+        self.assertFalse(score_info.to_dict()["reusable"])
+
+    def test_do_not_reuse_score_with_side_effects_in_constructor(self):
+        self.score_call(from_=self._admin,
+                        to_=GOVERNANCE_SCORE_ADDRESS,
+                        func_name="setStepCost",
+                        params={"stepType": "apiCall", "cost": hex(10_000)})
+
+        for score_name in ("sample_array_score", "sample_init_write_score", "sample_init_api_score"):
+            score_address: 'Address' = self._deploy(score_name)
+            score_info: 'IconScoreInfo' = self._get_score_info(score_address)
+
+            step_used_list = []
+            for _ in range(3):
+                tx_results = self.score_call(from_=self._accounts[0], to_=score_address,
+                                             func_name="add", params={"value": hex(1)})
+                step_used_list.append(tx_results[0].step_used)
+
+            # Every call creates a new instance which reads or writes states or applies steps in the constructor
+            self.assertFalse(score_info.to_dict()["reusable"])
+            self.assertEqual(0, score_info.reuse_count)
+            self.assertEqual(step_used_list[1], step_used_list[2])
+
+    def test_do_not_reuse_score_branching_on_block_height(self):
+        score_address: 'Address' = self._deploy("sample_block_height_score")
+        score_info: 'IconScoreInfo' = self._get_score_info(score_address)
+
+        # Each call is invoked in a new block whose height is odd and even in turn
+        for _ in range(4):
+            self.score_call(from_=self._accounts[0], to_=score_address, func_name="increase")
+
+        for name in ("even", "odd"):
+            count = self.query_score(from_=None, to_=score_address,
+                                     func_name="get_count", params={"name": name})
+            self.assertEqual(2, count)
+
+        self.assertFalse(score_info.to_dict()["reusable"])
+        self.assertEqual(0, score_info.reuse_count)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load the SCOREs used recently on a worker thread on startup
+"""
+
+from typing import TYPE_CHECKING, List
+
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.score_loader.icon_score_class_loader import IconScoreClassLoader
+from tests.integrate_test.test_integrate_base import TestIntegrateBase
+
+if TYPE_CHECKING:
+    from iconservice.base.address import Address
+    from iconservice.iconscore.icon_score_result import TransactionResult
+
+
+class TestIntegrateScoreWarmUp(TestIntegrateBase):
+    def _close_and_reopen_iconservice(self):
+        self.icon_service_engine.close()
+        self.icon_service_engine = IconServiceEngine()
+        self.icon_service_engine.open(self._config)
+
+    def test_warm_up(self):
+        tx_results: List['TransactionResult'] = self.deploy_score(
+            score_root="sample_score_pool",
+            score_name="sample_array_score",
+            from_=self._accounts[0])
+        score_address: 'Address' = tx_results[0].score_address
+        self.score_call(from_=self._accounts[0], to_=score_address,
+                        func_name="add", params={"value": hex(1)})
+
+        self._close_and_reopen_iconservice()
+        self.icon_service_engine._score_warmer._executor.shutdown()
+
+        # The SCORE used before closing is loaded on startup
+        preloaded = [address for address, _ in IconScoreClassLoader._preloaded_classes]
+        self.assertIn(score_address, preloaded)
+
+        # The preloaded SCORE class is used on invoke
+        self.score_call(from_=self._accounts[0], to_=score_address,
+                        func_name="add", params={"value": hex(1)})
+        preloaded = [address for address, _ in IconScoreClassLoader._preloaded_classes]
+        self.assertNotIn(score_address, preloaded)
+
+        size = self.query_score(from_=None, to_=score_address, func_name="size")
+        self.assertEqual(2, size)
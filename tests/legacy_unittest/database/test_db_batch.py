@@ -171,6 +171,30 @@ class TestBatch(unittest.TestCase):
         ret = block_batch.digest()
         self.assertEqual(expected, ret)
 
+    def test_digest_with_large_values(self):
+        block_batch = self.block_batch
+
+        tx_batch = TransactionBatch(create_hash_256())
+        data = []
+        for i, size in enumerate((0, 10, 64 * 1024 - 1, 64 * 1024, 200 * 1024, 3, 70 * 1024)):
+            key = create_hash_256()
+            value = bytes([i]) * size
+            tx_batch[key] = TransactionBatchValue(value, True)
+            data.append(key)
+            data.append(value)
+
+            key = create_hash_256()
+            tx_batch[key] = TransactionBatchValue(None, True)
+            data.append(key)
+
+        tx_batch[create_hash_256()] = TransactionBatchValue(b'excluded', False)
+
+        expected = sha3_256(b'|'.join(data))
+        self.assertEqual(expected, tx_batch.digest())
+
+        block_batch.update(tx_batch)
+        self.assertEqual(expected, block_batch.digest())
+
     def test_block_batch_update_tx_index(self):
         block_batch = self.block_batch
 
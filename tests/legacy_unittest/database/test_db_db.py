@@ -16,6 +16,7 @@
 
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 import unittest
 from unittest.mock import patch
 
@@ -67,6 +68,89 @@ class TestKeyValueDatabase(unittest.TestCase):
         self.assertEqual(b'value1', db.get(b'key1'))
         self.assertEqual(b'value0', db.get(b'key0'))
 
+    def test_from_path_with_default_options(self):
+        path = os.path.join(self.state_db_root_path, 'db')
+        options = {"lru_cache_size": 1024 * 1024, "bloom_filter_bits": 10, "compression": None}
+
+        KeyValueDatabase.set_default_options(options)
+        try:
+            with patch("plyvel.DB") as plyvel_db:
+                KeyValueDatabase.from_path(path)
+                plyvel_db.assert_called_with(path, create_if_missing=True, **options)
+
+            db = KeyValueDatabase.from_path(path)
+            db.put(b'key0', b'value0')
+            self.assertEqual(b'value0', db.get(b'key0'))
+            db.close()
+        finally:
+            KeyValueDatabase.set_default_options({})
+
+    def test_write_batch_with_sync(self):
+        db = self.db
+
+        db.write_batch([(b'key0', b'value0')], sync=True)
+        self.assertEqual(b'value0', db.get(b'key0'))
+
+    def test_snapshot(self):
+        db = self.db
+        db.put(b'key0', b'value0')
+
+        # Readers share the snapshot until a new state is written
+        snapshot = db.acquire_snapshot()
+        self.assertIs(snapshot, db.acquire_snapshot())
+        self.assertEqual(3, snapshot.ref_count)
+        snapshot.release()
+
+        db.write_batch([(b'key0', b'value1'), (b'key1', b'value1')])
+        self.assertEqual(1, snapshot.ref_count)
+        self.assertEqual(b'value0', snapshot.get(b'key0'))
+        self.assertIsNone(snapshot.get(b'key1'))
+
+        new_snapshot = db.acquire_snapshot()
+        self.assertIsNot(snapshot, new_snapshot)
+        self.assertEqual(b'value1', new_snapshot.get(b'key0'))
+        self.assertEqual(b'value1', new_snapshot.get(b'key1'))
+        new_snapshot.release()
+
+        snapshot.release()
+        self.assertEqual(0, snapshot.ref_count)
+        with self.assertRaises(DatabaseException):
+            snapshot.acquire()
+
+    def test_get_on_query_context_with_snapshot(self):
+        context_db = ContextDatabase(self.db)
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        self.db.put(b'key0', b'value0')
+
+        context.snapshot = self.db.acquire_snapshot()
+        self.db.put(b'key0', b'value1')
+        self.assertEqual(b'value0', context_db.get(context, b'key0'))
+        context.snapshot.release()
+
+        context.snapshot = None
+        self.assertEqual(b'value1', context_db.get(context, b'key0'))
+
+    def test_get_many(self):
+        db = self.db
+        prefix = b'\x00|array|'
+        for i in range(300):
+            db.put(prefix + i.to_bytes((i.bit_length() + 8) // 8, 'big', signed=True), i.to_bytes(2, 'big'))
+        db.put(prefix + b'size', b'\x01\x2c')
+        db.put(b'\x00|array_other|\x00', b'other')
+
+        for start, stop in ((0, 128), (128, 256), (250, 310)):
+            keys = [prefix + i.to_bytes((i.bit_length() + 8) // 8, 'big', signed=True) for i in range(start, stop)]
+            values = db.get_many(keys)
+            self.assertEqual({key: db.get(key) for key in keys if db.get(key) is not None}, values)
+
+        self.assertEqual({}, db.get_many([]))
+        self.assertEqual({}, db.get_many([b'\x00|array|\x7f\x00', b'\x00|array|\x7f\x01']))
+
+        snapshot = db.acquire_snapshot()
+        db.put(prefix + b'\x00', b'new')
+        self.assertEqual({prefix + b'\x00': b'\x00\x00'}, snapshot.get_many([prefix + b'\x00']))
+        snapshot.release()
+
 
 class TestContextDatabaseOnWriteMode(unittest.TestCase):
     def setUp(self):
@@ -106,6 +190,22 @@ class TestContextDatabaseOnWriteMode(unittest.TestCase):
         value = self.context_db.get(context, address.body)
         self.assertEqual(100, int.from_bytes(value, 'big'))
 
+    def test_iter_values(self):
+        context = self.context
+        key_value_db = self.context_db.key_value_db
+        key_value_db.put(b'key0', b'value0')
+        key_value_db.put(b'key1', b'value1')
+        key_value_db.put(b'key2', b'value2')
+        self.context_db._put(context, b'key1', b'tx_value1', True)
+
+        it = self.context_db.iter_values(context, [b'key0', b'key1', b'key2', b'key3'])
+        self.assertEqual(b'value0', next(it))
+        self.assertTrue(context.block_batch.has_pre_image(b'key0'))
+
+        # The value written during the iteration is returned
+        self.context_db._put(context, b'key2', b'tx_value2', True)
+        self.assertEqual([b'tx_value1', b'tx_value2', None], list(it))
+
     def test_put(self):
         """WritableDatabase supports put()
         """
@@ -140,6 +240,30 @@ class TestContextDatabaseOnWriteMode(unittest.TestCase):
         self.assertRaises(DatabaseException, self.context_db._put, context, b'key3', b'value3', True)
         self.assertRaises(DatabaseException, self.context_db._delete, context, b'key3', True)
 
+    def test_pre_images(self):
+        context = self.context
+        key_value_db = self.context_db.key_value_db
+        key_value_db.put(b'key0', b'value0')
+        key_value_db.put(b'key1', b'value1')
+
+        # Read from state_db
+        self.assertEqual(b'value0', self.context_db.get(context, b'key0'))
+        self.context_db._put(context, b'key0', b'new0', True)
+
+        # Written without being read
+        self.context_db._delete(context, b'key1', True)
+        self.context_db._put(context, b'key2', b'new2', True)
+
+        # Changed in this block after the first write
+        self.context_db._put(context, b'key0', b'new00', True)
+        self.assertEqual(b'new00', self.context_db.get(context, b'key0'))
+
+        pre_images = context.block_batch.pre_images
+        self.assertEqual({b'key0': b'value0', b'key1': b'value1', b'key2': None}, pre_images)
+
+        context.block_batch.clear()
+        self.assertEqual(0, len(context.block_batch.pre_images))
+
     def test_put_on_readonly_exception(self):
         context = self.context
         context.func_type = IconScoreFuncType.READONLY
@@ -312,3 +436,44 @@ class TestIconScoreDatabase(unittest.TestCase):
         context.type = IconScoreContextType.DIRECT
         db.put(key, value.to_bytes(32, DATA_BYTE_ORDER))
         self.assertEqual(value.to_bytes(32, DATA_BYTE_ORDER), db.get(key))
+
+    def test_get_sub_db(self):
+        sub_db = self.db.get_sub_db(b'dict')
+        self.assertIs(sub_db, self.db.get_sub_db(b'dict'))
+
+        nested_db = sub_db.get_sub_db(b'key')
+        self.assertIs(nested_db, sub_db.get_sub_db(b'key'))
+        self.assertIsNot(nested_db, self.db.get_sub_db(b'key'))
+
+        # Cached sub dbs make the same keys as before
+        self.assertEqual(
+            b'|'.join((self.address.to_bytes(), b'', b'', b'dict', b'key', b'value')),
+            self.db._hash_key(nested_db._hash_key(b'value')))
+
+    def test_get_sub_db_cache_size(self):
+        with patch('iconservice.database.db._MAX_SUB_DB_CACHE_SIZE', 2):
+            sub_db = self.db.get_sub_db(b'0')
+            other_db = self.db.get_sub_db(b'1')
+            self.assertIs(sub_db, self.db.get_sub_db(b'0'))
+
+            # The least recently used one is dropped
+            self.db.get_sub_db(b'2')
+            self.assertEqual(2, len(self.db._sub_dbs))
+            self.assertIs(sub_db, self.db.get_sub_db(b'0'))
+            self.assertIsNot(other_db, self.db.get_sub_db(b'1'))
+
+            # Nested sub dbs share the cache of the SCORE
+            sub_db.get_sub_db(b'key').get_sub_db(b'key')
+            self.assertEqual(2, len(self.db._sub_dbs))
+
+    def test_get_sub_db_on_multiple_threads(self):
+        def get_sub_dbs(i: int):
+            for j in range(100):
+                self.db.get_sub_db(str(j % 10).encode()).get_sub_db(str(i * 100 + j).encode())
+
+        with patch('iconservice.database.db._MAX_SUB_DB_CACHE_SIZE', 16):
+            with ThreadPoolExecutor(4) as executor:
+                for future in [executor.submit(get_sub_dbs, i) for i in range(8)]:
+                    future.result()
+
+            self.assertEqual(16, len(self.db._sub_dbs))
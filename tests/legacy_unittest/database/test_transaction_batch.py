@@ -99,6 +99,31 @@ class TestTransactionBatch(unittest.TestCase):
         self.assertEqual(TransactionBatchValue(b'value2', True), tx_batch[b'key2'])
         self.assertEqual(init_call_count, tx_batch.call_count)
 
+    def test_revert_call_restores_outer_values(self):
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value0', True)
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = TransactionBatchValue(b'value1', True)
+
+        tx_batch.enter_call()
+        tx_batch[b'key0'] = TransactionBatchValue(None, True)
+        tx_batch[b'key1'] = TransactionBatchValue(b'value1', True)
+        self.assertEqual(TransactionBatchValue(None, True), tx_batch[b'key0'])
+
+        tx_batch.revert_call()
+        self.assertEqual(TransactionBatchValue(b'value1', True), tx_batch[b'key0'])
+        self.assertNotIn(b'key1', tx_batch)
+        self.assertIsNone(tx_batch.get(b'key1'))
+
+        tx_batch.leave_call()
+        tx_batch.revert_call()
+        self.assertEqual(TransactionBatchValue(b'value0', True), tx_batch[b'key0'])
+
+        tx_batch.clear()
+        self.assertNotIn(b'key0', tx_batch)
+        self.assertIsNone(tx_batch[b'key0'])
+
     def test_delitem(self):
         tx_batch = TransactionBatch()
         tx_batch[b'key0'] = TransactionBatchValue(b'value0', True)
@@ -15,14 +15,16 @@
 
 import os
 import random
+import struct
 import unittest
 
+import msgpack
 import pytest
 
 from iconservice.base.block import Block
 from iconservice.base.exception import IllegalFormatException
 from iconservice.database.wal import (
-    _MAGIC_KEY, _FILE_VERSION, _OFFSET_VERSION, _HEADER_SIZE,
+    _MAGIC_KEY, _FILE_VERSION, _OFFSET_VERSION, _HEADER_SIZE, _HEADER_STRUCT_FORMAT,
     WriteAheadLogReader, WriteAheadLogWriter, WALogable, WALState
 )
 from iconservice.icon_constant import Revision
@@ -168,3 +170,66 @@ class TestWriteAheadLog(unittest.TestCase):
         reader = WriteAheadLogReader()
         with pytest.raises(IllegalFormatException):
             reader.open(self.path)
+
+    def _write_wal(self) -> int:
+        writer = WriteAheadLogWriter(Revision.IISS.value, 2, self.block, create_block_hash())
+        writer.open(self.path)
+        writer.write_walogable(WALogableData(self.log_data[0]))
+        writer.write_walogable(WALogableData(self.log_data[1]))
+        writer.close()
+
+        return os.path.getsize(self.path)
+
+    def test_torn_write(self):
+        file_size: int = self._write_wal()
+
+        # The last record is incomplete
+        with open(self.path, "rb+") as f:
+            f.truncate(file_size - 1)
+
+        reader = WriteAheadLogReader()
+        with pytest.raises(IllegalFormatException):
+            reader.open(self.path)
+
+    def test_crc_mismatch(self):
+        file_size: int = self._write_wal()
+
+        # Corrupt the value of the last record
+        with open(self.path, "rb+") as f:
+            f.seek(file_size - 5)
+            f.write(b"x")
+
+        reader = WriteAheadLogReader()
+        with pytest.raises(IllegalFormatException):
+            reader.open(self.path)
+
+    def test_read_version_1(self):
+        revision = Revision.IISS.value
+        instant_block_hash = create_block_hash()
+        block_data: bytes = self.block.to_bytes(revision)
+        logs = [b"".join(msgpack.packb([key, value]) for key, value in data.items()) for data in self.log_data]
+
+        offset: int = _HEADER_SIZE + 4 * len(logs) + 4 + len(block_data)
+        offsets = []
+        for log in logs:
+            offsets.append(offset)
+            offset += 4 + len(log)
+
+        with open(self.path, "wb") as f:
+            f.write(struct.pack(_HEADER_STRUCT_FORMAT + "II",
+                                _MAGIC_KEY, 1, revision, 0, instant_block_hash, len(logs), *offsets))
+            f.write(len(block_data).to_bytes(4, "big"))
+            f.write(block_data)
+            for log in logs:
+                f.write(len(log).to_bytes(4, "big"))
+                f.write(log)
+
+        reader = WriteAheadLogReader()
+        reader.open(self.path)
+        assert reader.version == 1
+        assert reader.block == self.block
+
+        for i in range(len(self.log_data)):
+            assert dict(reader.get_iterator(i)) == self.log_data[i]
+
+        reader.close()
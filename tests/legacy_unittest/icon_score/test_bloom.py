@@ -10,10 +10,13 @@
 #   test_casting_to_integer() : modify bloom filter result value
 #   test_casting_to_binary() : modify bloom filter result value
 #   test_icon_bloom() : add example for ICON
+#   test_bloom_builder() : add BloomBuilder
 
 from __future__ import unicode_literals
 import itertools
 
+import pytest
+
 from hypothesis import (
     strategies as st,
     given,
@@ -21,6 +24,7 @@ from hypothesis import (
 )
 
 from iconservice.utils.bloom import (
+    BloomBuilder,
     BloomFilter,
 )
 
@@ -78,6 +82,36 @@ def test_bloom_filter_from_iterable_method(log_entries):
     check_bloom(bloom, log_entries)
 
 
+@given(st.lists(log_entries, min_size=1, max_size=5))
+@settings(max_examples=200)
+def test_bloom_builder(blocks):
+    builder = BloomBuilder()
+    aggregated = BloomFilter()
+
+    # Log entries are built twice to use the cached bit indexes
+    for log_entries in blocks + blocks:
+        bloomables = list(itertools.chain.from_iterable(
+            itertools.chain([address], topics)
+            for address, topics
+            in log_entries
+        ))
+        bloom = builder.build(bloomables)
+        expected = BloomFilter.from_iterable(bloomables)
+
+        assert int(expected) == int(bloom)
+        check_bloom(bloom, log_entries)
+        aggregated |= expected
+
+    assert int(aggregated) == int(builder.aggregated_bloom)
+
+
+def test_bloom_builder_invalid_value():
+    builder = BloomBuilder()
+
+    with pytest.raises(TypeError):
+        builder.build(["value"])
+
+
 def test_casting_to_integer():
     bloom = BloomFilter()
 
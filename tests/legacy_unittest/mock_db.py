@@ -56,8 +56,11 @@ class MockPlyvelDB(object):
     def get_sub_db(self, key: bytes):
         return MockPlyvelDB(self.make_db())
 
-    def iterator(self) -> iter:
-        return iter(self._db)
+    def iterator(self, start: bytes = None, stop: bytes = None, include_stop: bool = False) -> iter:
+        if start is None and stop is None:
+            return iter(self._db)
+
+        return MockIterator(self._db, start, stop, include_stop)
 
     def prefixed_db(self, bytes_prefix) -> 'MockPlyvelDB':
         return MockPlyvelDB(MockPlyvelDB.make_db())
@@ -66,6 +69,39 @@ class MockPlyvelDB(object):
         return MockWriteBatch(self)
 
 
+class MockIterator(object):
+    """ Iterator(DB db, bytes start, bytes stop, bool include_stop) """
+    def __init__(self, db: dict, start: Optional[bytes], stop: Optional[bytes], include_stop: bool):
+        self._items = sorted(
+            (key, value) for key, value in db.items()
+            if (start is None or key >= start) and
+               (stop is None or key < stop or (include_stop and key == stop)))
+        self._index = 0
+
+    def seek(self, target: bytes):
+        """ Iterator.seek(self, bytes target) """
+        self._index = 0
+        while self._index < len(self._items) and self._items[self._index][0] < target:
+            self._index += 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._index >= len(self._items):
+            raise StopIteration
+
+        item = self._items[self._index]
+        self._index += 1
+        return item
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
 class MockWriteBatch(object):
     """ WriteBatch(DB db, bytes prefix, bool transaction, sync) """
     def clear(self):
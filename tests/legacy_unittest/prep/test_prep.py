@@ -18,10 +18,11 @@ import os
 import pytest
 
 from iconservice.base.address import AddressPrefix, Address
-from iconservice.base.exception import AccessDeniedException
+from iconservice.base.exception import AccessDeniedException, InvalidParamsException
 from iconservice.icon_constant import IISS_INITIAL_IREP, PenaltyReason, Revision
 from iconservice.icon_constant import PRepStatus, PRepFlag, PRepGrade
 from iconservice.prep.data.prep import PRep, PRepDictType
+from iconservice.utils.msgpack_for_db import MsgPackForDB
 
 NAME = "banana"
 EMAIL = "banana@example.com"
@@ -211,6 +212,33 @@ def test_from_bytes_and_to_bytes_with_revision_decentralization(prep):
     assert prep2.delegated == 0
 
 
+def test_from_bytes_with_block_statistics(prep):
+    data = prep.to_bytes(Revision.LATEST.value)
+
+    prep.update_block_statistics(is_validator=False)
+    prep.update_block_statistics(is_validator=True)
+    prep.last_generate_block_height = LAST_GENERATE_BLOCK_HEIGHT + 2
+    block_statistics = prep.block_statistics_to_bytes()
+
+    # Block statistics override the ones in the other P-Rep data
+    prep2 = PRep.from_bytes(data, block_statistics)
+    assert prep2.total_blocks == TOTAL_BLOCKS + 2
+    assert prep2.validated_blocks == VALIDATED_BLOCKS + 1
+    assert prep2.unvalidated_sequence_blocks == 0
+    assert prep2.last_generate_block_height == LAST_GENERATE_BLOCK_HEIGHT + 2
+    assert prep2.name == NAME
+    assert prep2.to_bytes(Revision.LATEST.value) == prep.to_bytes(Revision.LATEST.value)
+
+    prep2 = PRep.from_bytes(data)
+    assert prep2.total_blocks == TOTAL_BLOCKS
+    assert prep2.last_generate_block_height == LAST_GENERATE_BLOCK_HEIGHT
+
+    # Block statistics of an unknown version are not read
+    block_statistics = MsgPackForDB.dumps([1] + MsgPackForDB.loads(block_statistics)[1:])
+    with pytest.raises(InvalidParamsException):
+        PRep.from_bytes(data, block_statistics)
+
+
 def test_country(prep):
     assert prep.country == COUNTRY
 
@@ -128,10 +128,13 @@ class TestPRepAddressConverter(unittest.TestCase):
         assert new_node_address in new_converter._node_address_mapper
         assert len(new_converter._prev_node_address_mapper) == 1
         assert len(new_converter._node_address_mapper) == 1
-        assert id(new_converter._prev_node_address_mapper) != id(converter._prev_node_address_mapper)
-        assert id(new_converter._node_address_mapper) != id(converter._node_address_mapper)
+        # The mappers are shared until one of the converters changes them
+        assert id(new_converter._prev_node_address_mapper) == id(converter._prev_node_address_mapper)
+        assert id(new_converter._node_address_mapper) == id(converter._node_address_mapper)
 
         new_converter._delete_node_address(new_node_address)
+        assert id(new_converter._prev_node_address_mapper) != id(converter._prev_node_address_mapper)
+        assert id(new_converter._node_address_mapper) != id(converter._node_address_mapper)
         assert new_node_address == new_converter.get_prep_address_from_node_address(new_node_address)
         assert prep_address == converter.get_prep_address_from_node_address(new_node_address)
 
@@ -139,6 +142,33 @@ class TestPRepAddressConverter(unittest.TestCase):
         assert old_node_address == new_converter.get_prep_address_from_node_address(old_node_address)
         assert prep_address == converter.get_prep_address_from_node_address(old_node_address)
 
+    def test_copy_and_change_original(self):
+        converter = self.converter
+        node_address = self.node_addresses[0]
+        prep_address = self.prep_addresses[0]
+
+        new_converter = converter.copy()
+        converter.add_node_address(node_address, prep_address)
+        assert prep_address == converter.get_prep_address_from_node_address(node_address)
+        assert node_address == new_converter.get_prep_address_from_node_address(node_address)
+
+        new_converter.add_node_address(node_address, prep_address)
+        converter.reset_prev_node_address()
+        converter.delete_node_address(node_address, prep_address)
+        assert node_address in converter._prev_node_address_mapper
+        assert node_address in new_converter._node_address_mapper
+        assert len(new_converter._prev_node_address_mapper) == 0
+
+    def test_reset_empty_prev_node_address_on_copy(self):
+        converter = self.converter
+        converter.add_node_address(self.node_addresses[0], self.prep_addresses[0])
+
+        # Nothing to reset, so the mappers are still shared with the original
+        new_converter = converter.copy()
+        new_converter.reset_prev_node_address()
+        assert id(new_converter._prev_node_address_mapper) == id(converter._prev_node_address_mapper)
+        assert id(new_converter._node_address_mapper) == id(converter._node_address_mapper)
+
     def test_serialize(self):
         # empty
         data: bytes = PRepAddressConverter().to_bytes()
@@ -22,7 +22,7 @@ import pytest
 
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.exception import AccessDeniedException, InvalidParamsException
-from iconservice.icon_constant import PRepStatus
+from iconservice.icon_constant import PRepStatus, PenaltyReason
 from iconservice.prep.data import PRep, PRepContainer
 
 
@@ -221,6 +221,74 @@ def test_copy(create_prep_container):
             assert id(prep) == id(prep2)
 
 
+def test_copy_on_write(create_prep_container):
+    size: int = 10
+    preps: 'PRepContainer' = create_prep_container(size)
+    copied_preps: 'PRepContainer' = preps.copy(mutable=True)
+
+    # The copied PRepContainer shares P-Rep collections with the original one until it changes them
+    assert id(preps._prep_dict) == id(copied_preps._prep_dict)
+    assert id(preps._active_prep_list) == id(copied_preps._active_prep_list)
+
+    new_prep = _create_dummy_prep(size)
+    copied_preps.add(new_prep)
+    assert copied_preps.size(active_prep_only=True) == size + 1
+    assert preps.size(active_prep_only=True) == size
+    assert not preps.contains(new_prep.address)
+
+    prep: 'PRep' = copied_preps.get_by_index(0).copy()
+    prep.status = PRepStatus.UNREGISTERED
+    copied_preps.replace(prep)
+    assert copied_preps.size(active_prep_only=True) == size
+    assert copied_preps.total_delegated != preps.total_delegated
+    assert preps.get_by_index(0).status == PRepStatus.ACTIVE
+
+    # The original PRepContainer does not change the copied one either
+    preps = create_prep_container(size)
+    copied_preps = preps.copy(mutable=False)
+    preps.remove(preps.get_by_index(0).address)
+    assert preps.size() == size - 1
+    assert copied_preps.size() == size
+    assert copied_preps.index(copied_preps.get_by_index(0).address) == 0
+
+    # Removing a P-Rep which does not exist does not copy the collections
+    copied_preps = preps.copy(mutable=True)
+    copied_preps.remove(new_prep.address)
+    assert id(preps._prep_dict) == id(copied_preps._prep_dict)
+
+
+def test_get_suspended_preps(create_prep_container):
+    size: int = 20
+    preps: 'PRepContainer' = create_prep_container(size)
+    assert preps.get_suspended_preps() == []
+
+    for index in (15, 3, 9):
+        prep: 'PRep' = preps.get_by_index(index).copy()
+        prep.penalty = PenaltyReason.BLOCK_VALIDATION
+        preps.replace(prep)
+
+    expected = [prep for prep in preps if prep.is_suspended()]
+    assert len(expected) == 3
+    assert preps.get_suspended_preps() == expected
+
+    # Suspended P-Reps are kept apart in a copied PRepContainer
+    copied_preps: 'PRepContainer' = preps.copy(mutable=True)
+    prep = expected[0].copy()
+    prep.reset_block_validation_penalty()
+    copied_preps.replace(prep)
+    assert copied_preps.get_suspended_preps() == expected[1:]
+    assert preps.get_suspended_preps() == expected
+
+    prep = expected[1].copy()
+    prep.status = PRepStatus.DISQUALIFIED
+    copied_preps.replace(prep)
+    assert copied_preps.get_suspended_preps() == expected[2:]
+
+    copied_preps.remove(expected[2].address)
+    assert copied_preps.get_suspended_preps() == []
+    assert preps.get_suspended_preps() == expected
+
+
 def test_add(create_prep_container):
     size: int = 10
     preps: 'PRepContainer' = create_prep_container(size)
@@ -284,3 +352,31 @@ def test_replace(create_prep_container):
 
     old_prep = preps.replace(new_prep)
     assert old_prep is None
+
+
+def test_add_all():
+    size: int = 100
+    prep_list = [_create_dummy_prep(i) for i in range(size)]
+    prep_list.append(_create_dummy_prep(size, PRepStatus.UNREGISTERED))
+    prep_list[7].penalty = PenaltyReason.BLOCK_VALIDATION
+
+    expected = PRepContainer()
+    for prep in prep_list:
+        expected.add(prep)
+
+    preps = PRepContainer()
+    preps.add_all(prep_list)
+
+    assert preps.is_dirty()
+    assert preps.size(active_prep_only=True) == size
+    assert preps.size(active_prep_only=False) == size + 1
+    assert preps.total_delegated == expected.total_delegated
+    assert list(preps) == list(expected)
+    assert preps.get_suspended_preps() == [prep_list[7]]
+
+    with pytest.raises(InvalidParamsException):
+        preps.add_all([prep_list[0]])
+
+    preps.freeze()
+    with pytest.raises(AccessDeniedException):
+        preps.add_all([_create_dummy_prep(size + 1)])
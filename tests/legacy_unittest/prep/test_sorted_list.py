@@ -233,4 +233,59 @@ def test_append(create_sorted_list):
     with pytest.raises(ValueError):
         last_item: SortedItem = items[len(items) - 1]
         item = SortedItem(value=last_item.value - 1)
-        items.append(item)
\ No newline at end of file
+        items.append(item)
+
+def test_add_with_the_same_order_items():
+    items = SortedList()
+    for value in (3, 1, 2, 2, 0, 2):
+        items.add(SortedItem(value))
+
+    check_sorted_list(items)
+
+    # A new item is placed after the items which have the same order
+    item = SortedItem(2)
+    items.add(item)
+    assert items.index(item) == 5
+    assert items[6].value == 3
+
+    item = SortedItem(-1)
+    items.add(item)
+    assert items.index(item) == 0
+
+    item = SortedItem(4)
+    items.add(item)
+    assert items.index(item) == len(items) - 1
+
+
+def test_index_not_found(create_sorted_list):
+    items = create_sorted_list(100)
+
+    for value in (-10001, 10001):
+        assert items.index(SortedItem(value)) == -1
+
+    # An item which is not in the list is not found even though the same order exists
+    for item in items:
+        assert items.index(SortedItem(item.value)) == -1
+
+
+def test_add_all():
+    values = [random.randint(-10, 10) for _ in range(100)]
+    expected = SortedList()
+    items = SortedList()
+
+    for value in values[:50]:
+        item = SortedItem(value)
+        expected.add(item)
+        items.add(item)
+
+    new_items = [SortedItem(value) for value in values[50:]]
+    for item in new_items:
+        expected.add(item)
+    items.add_all(new_items)
+
+    # Items with the same order are placed in the same way as add()
+    check_sorted_list(items)
+    assert len(items) == len(expected)
+    for i in range(len(items)):
+        assert items[i] is expected[i]
+        assert items.index(items[i]) == i
@@ -30,6 +30,7 @@ from iconservice.icx import IcxStorage
 from iconservice.prep import PRepStorage
 from iconservice.prep.data import PRep, Term
 from iconservice.utils import ContextStorage
+from iconservice.utils.hashing.hash_generator import RootHashGenerator
 
 context = IconScoreContext(IconScoreContextType.DIRECT)
 context.storage = ContextStorage(deploy=None, fee=None, icx=Mock(spec=IcxStorage), iiss=None,
@@ -107,6 +108,28 @@ class TestTerm(unittest.TestCase):
             assert prep.address == prep_snapshot.address
             assert prep.delegated == prep_snapshot.delegated
 
+    def test_root_hash(self):
+        def _root_hash(preps) -> bytes:
+            values = (prep.address.to_bytes_including_prefix() for prep in preps[:PREP_MAIN_PREPS])
+            return RootHashGenerator.generate_root_hash(values=values, do_hash=True)
+
+        root_hash: bytes = self.term.root_hash
+        assert root_hash == _root_hash(self.preps)
+
+        # Changes of sub P-Reps do not affect the root hash
+        term = self.term.copy()
+        term.set_preps(self.preps[:PREP_MAIN_PREPS] + self.preps[PREP_MAIN_PREPS + 1:],
+                       PREP_MAIN_PREPS, PREP_MAIN_AND_SUB_PREPS)
+        assert term.root_hash == root_hash
+
+        preps = list(self.preps)
+        preps[0], preps[1] = preps[1], preps[0]
+        term.set_preps(preps, PREP_MAIN_PREPS, PREP_MAIN_AND_SUB_PREPS)
+        assert term.root_hash == _root_hash(preps) != root_hash
+
+        term.set_preps(self.preps, PREP_MAIN_PREPS, PREP_MAIN_AND_SUB_PREPS)
+        assert term.root_hash == root_hash
+
     def test_update_preps_with_critical_penalty(self):
         revision: int = 0
         # Remove an invalid Main P-Rep which gets a penalty
@@ -18,8 +18,10 @@ import os
 import shutil
 import unittest
 from collections import OrderedDict
+from unittest.mock import patch
 
 from iconservice.base.block import Block
+from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue
 from iconservice.database.db import KeyValueDatabase
 from iconservice.database.wal import WriteAheadLogReader, WALDBType
 from iconservice.icon_constant import Revision
@@ -147,6 +149,39 @@ class TestBackupManager(unittest.TestCase):
         self._check_if_rollback_is_done(self.rc_db, self.org_rc_db_data)
         self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
 
+    def test_run_with_pre_images(self):
+        instant_block_hash: bytes = hashlib.sha3_256(b"instant_block_hash").digest()
+        last_block = Block(
+            block_height=100,
+            block_hash=hashlib.sha3_256(b"block_hash").digest(),
+            timestamp=0,
+            prev_hash=hashlib.sha3_256(b"prev_hash").digest(),
+            cumulative_fee=0
+        )
+        block_batch = BlockBatch(last_block)
+        tx_batch = TransactionBatch()
+        tx_batch[b"key0"] = TransactionBatchValue(b"new value0", True)
+        tx_batch[b"key1"] = TransactionBatchValue(None, True)
+        block_batch.update(tx_batch)
+        block_batch.set_pre_image(b"key0", self.state_db.get(b"key0"))
+
+        with patch.object(self.state_db, "get", wraps=self.state_db.get) as get:
+            self.backup_manager.run(icx_db=self.state_db,
+                                    rc_db=self.rc_db,
+                                    revision=Revision.DECENTRALIZATION.value,
+                                    prev_block=last_block,
+                                    block_batch=block_batch,
+                                    iiss_wal=[],
+                                    is_calc_period_start_block=False,
+                                    instant_block_hash=instant_block_hash)
+
+            # Read only the key which has no pre-image
+            get.assert_called_once_with(b"key1")
+
+        self._commit_state_db(self.state_db, OrderedDict((key, value.value) for key, value in block_batch.items()))
+        self._rollback(last_block)
+        self._check_if_rollback_is_done(self.state_db, self.org_state_db_data)
+
     @staticmethod
     def _commit_state_db(db: 'KeyValueDatabase', block_batch: OrderedDict):
         db.write_batch(block_batch.items())
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import shutil
+import unittest
+from collections import OrderedDict
+
+from iconservice.base.block import Block
+from iconservice.base.exception import InternalServiceErrorException
+from iconservice.database.db import KeyValueDatabase
+from iconservice.icon_constant import Revision
+from iconservice.iiss.reward_calc.storage import Storage as RewardCalcStorage
+from iconservice.rollback.backup_manager import BackupManager
+from iconservice.rollback.rollback_manager import RollbackManager
+
+
+def _create_block(block_height: int) -> 'Block':
+    return Block(
+        block_height=block_height,
+        block_hash=hashlib.sha3_256(block_height.to_bytes(8, "big")).digest(),
+        timestamp=0,
+        prev_hash=hashlib.sha3_256((block_height - 1).to_bytes(8, "big")).digest(),
+        cumulative_fee=0
+    )
+
+
+class TestRollbackManager(unittest.TestCase):
+    def setUp(self) -> None:
+        state_db_root_path = "./test_rollback_manager_db"
+        shutil.rmtree(state_db_root_path, ignore_errors=True)
+
+        self.rc_data_path = os.path.join(state_db_root_path, "iiss")
+        self.backup_root_path = os.path.join(state_db_root_path, "backup")
+        os.mkdir(state_db_root_path)
+        os.mkdir(self.rc_data_path)
+        os.mkdir(self.backup_root_path)
+
+        self.state_db_root_path = state_db_root_path
+        self.state_db = KeyValueDatabase.from_path(os.path.join(state_db_root_path, "icon_dex"))
+        self.rc_db = RewardCalcStorage.create_current_db(self.rc_data_path)
+
+        self.backup_manager = BackupManager(self.backup_root_path, self.rc_data_path)
+
+    def tearDown(self) -> None:
+        self.state_db.close()
+        if self.rc_db:
+            self.rc_db.close()
+        shutil.rmtree(self.state_db_root_path, ignore_errors=True)
+
+    def _commit(self, block_height: int, block_batch: OrderedDict, rc_batch: OrderedDict):
+        self.backup_manager.run(icx_db=self.state_db,
+                                rc_db=self.rc_db,
+                                revision=Revision.DECENTRALIZATION.value,
+                                prev_block=_create_block(block_height),
+                                block_batch=block_batch,
+                                iiss_wal=rc_batch.items(),
+                                is_calc_period_start_block=False,
+                                instant_block_hash=bytes(32))
+
+        self.state_db.write_batch(block_batch.items())
+        self.rc_db.write_batch(rc_batch.items())
+
+    @staticmethod
+    def _get_all(db: 'KeyValueDatabase') -> dict:
+        return {key: value for key, value in db.iterator()}
+
+    def test_run_multiple_blocks(self):
+        self.state_db.write_batch([(b"key0", b"value0"), (b"key1", b"value1")])
+        rollback_block_height = 10
+        last_block_height = 15
+
+        state_db_data: dict = self._get_all(self.state_db)
+        rc_db_data: dict = self._get_all(self.rc_db)
+
+        for block_height in range(rollback_block_height, last_block_height):
+            block_batch = OrderedDict()
+            block_batch[b"key0"] = f"value0-{block_height}".encode()
+            block_batch[b"key1"] = None if block_height % 2 == 0 else b"value1"
+            block_batch[f"new{block_height}".encode()] = b"new"
+
+            rc_batch = OrderedDict()
+            rc_batch[f"rc{block_height}".encode()] = b"rc"
+            self._commit(block_height, block_batch, rc_batch)
+
+        self.rc_db.close()
+        self.rc_db = None
+
+        # Small write batches make each backup file be written with several write batches
+        rollback_manager = RollbackManager(
+            self.backup_root_path, self.rc_data_path, self.state_db, write_batch_size=2)
+        rollback_manager.run(last_block_height=last_block_height,
+                             rollback_block_height=rollback_block_height,
+                             term_start_block_height=0)
+
+        self.rc_db = RewardCalcStorage.create_current_db(self.rc_data_path)
+        self.assertEqual(state_db_data, self._get_all(self.state_db))
+        self.assertEqual(rc_db_data, self._get_all(self.rc_db))
+
+    def test_run_without_backup_file(self):
+        block_batch = OrderedDict()
+        block_batch[b"key0"] = b"value0"
+        self._commit(10, block_batch, OrderedDict())
+        self.rc_db.close()
+        self.rc_db = None
+
+        rollback_manager = RollbackManager(self.backup_root_path, self.rc_data_path, self.state_db)
+        with self.assertRaises(InternalServiceErrorException):
+            rollback_manager.run(last_block_height=12, rollback_block_height=10, term_start_block_height=0)
+
+        # No db has been changed
+        self.assertEqual(b"value0", self.state_db.get(b"key0"))
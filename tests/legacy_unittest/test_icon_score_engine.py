@@ -18,6 +18,8 @@
 """
 
 import unittest
+from collections import OrderedDict
+from copy import deepcopy
 from unittest.mock import Mock, patch
 
 from iconservice import *
@@ -26,7 +28,7 @@ from iconservice.base.exception import ScoreNotFoundException, InvalidParamsExce
 from iconservice.iconscore.icon_score_constant import ATTR_SCORE_GET_API, ATTR_SCORE_CALL, CONST_CLASS_ELEMENT_METADATAS
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.iconscore.icon_score_context import IconScoreContextType
-from iconservice.iconscore.icon_score_engine import IconScoreEngine
+from iconservice.iconscore.icon_score_engine import IconScoreEngine, copy_result
 from iconservice.iconscore.icon_score_mapper import IconScoreMapper
 from iconservice.iconscore.typing.element import FunctionMetadata
 from tests import create_address
@@ -123,6 +125,59 @@ class TestIconScoreEngine(unittest.TestCase):
         mocked_score_engine_validate_score_blacklist.assert_called()
         mocked_score_engine_call.assert_not_called()
 
+    @patch('iconservice.iconscore.icon_score_engine.IconScoreEngine._validate_score_blacklist')
+    @patch('iconservice.iconscore.icon_score_engine.IconScoreEngine._call')
+    def test_query_returns_copy(self,
+                                mocked_score_engine_call,
+                                mocked_score_engine_validate_score_blacklist):
+        context = IconScoreContext(IconScoreContextType.QUERY)
+        ret = {"preps": [{"address": create_address(AddressPrefix.EOA), "delegated": 10}]}
+        mocked_score_engine_call.return_value = ret
+
+        contract_address = create_address(AddressPrefix.CONTRACT)
+        result = IconScoreEngine.query(context, contract_address, 'call', {})
+
+        # The value kept by the SCORE is not changed by the caller
+        self.assertEqual(ret, result)
+        result["preps"][0]["delegated"] = 0
+        self.assertEqual(10, ret["preps"][0]["delegated"])
+
+    def test_copy_result(self):
+        address = create_address(AddressPrefix.EOA)
+        shared = [1, "a", b"b"]
+        value = {
+            "preps": [{"address": address, "delegated": 10, "name": "prep"}],
+            "shared0": shared,
+            "shared1": shared,
+            "ordered": OrderedDict(((2, True), (1, None))),
+            "struct": Address.from_string(str(address)),
+        }
+        value["self"] = value
+
+        ret = copy_result(value)
+        expected = deepcopy(value)
+
+        self.assertEqual(repr(expected), repr(ret))
+        self.assertIsInstance(ret["ordered"], OrderedDict)
+        self.assertEqual(list(expected["ordered"]), list(ret["ordered"]))
+
+        # Containers are copied
+        self.assertIsNot(value, ret)
+        self.assertIsNot(value["preps"], ret["preps"])
+        self.assertIsNot(value["preps"][0], ret["preps"][0])
+        self.assertIsNot(shared, ret["shared0"])
+
+        # Immutable objects are shared
+        self.assertIs(address, ret["preps"][0]["address"])
+        self.assertIs(value["preps"][0]["name"], ret["preps"][0]["name"])
+
+        # The same object and cycles are kept like deepcopy()
+        self.assertIs(ret["shared0"], ret["shared1"])
+        self.assertIs(ret, ret["self"])
+
+        for v in (None, 0, True, "str", b"bytes", address):
+            self.assertIs(v, copy_result(v))
+
     @patch('iconservice.iconscore.icon_score_context_util.IconScoreContextUtil.get_icon_score')
     @patch('iconservice.iconscore.icon_score_engine.IconScoreEngine._validate_score_blacklist')
     def test_get_score_api(self,
@@ -22,6 +22,7 @@ import pytest
 
 from iconservice.base.block import Block
 from iconservice.base.block import NULL_BLOCK
+from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue
 from iconservice.precommit_data_manager import PrecommitDataManager
 
 
@@ -176,6 +177,183 @@ class TestPrecommitDataManager(object):
             precommit_data = manager.get(block.hash)
             assert precommit_data.block_batch.block == block
 
+    def test_get_block_batch_overlay(self, create_precommit_data_manager):
+        """
+        root - parent - child
+
+        :param create_precommit_data_manager:
+        :return:
+        """
+        root = Block(
+            block_height=100,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=self.block_hash()
+        )
+        parent = Block(
+            block_height=root.height + 1,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=root.hash
+        )
+        child = Block(
+            block_height=parent.height + 1,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=parent.hash
+        )
+
+        manager = create_precommit_data_manager(root)
+
+        blocks = (parent, child)
+        values = (
+            {b'key0': b'parent0', b'key1': b'parent1', b'key2': b'parent2'},
+            {b'key1': b'child1', b'key2': None, b'key3': b'child3'},
+        )
+        for block, kv in zip(blocks, values):
+            tx_batch = TransactionBatch()
+            for key, value in kv.items():
+                tx_batch[key] = TransactionBatchValue(value, True)
+
+            precommit_data = Mock()
+            precommit_data.block_batch = BlockBatch(block)
+            precommit_data.block_batch.update(tx_batch)
+            manager.push(precommit_data)
+
+        # The root block has already been committed
+        assert manager.get_block_batch_overlay(root.hash) is None
+        assert manager.get_block_batch_overlay(self.block_hash()) is None
+
+        overlay = manager.get_block_batch_overlay(parent.hash)
+        assert len(overlay) == 3
+        assert overlay[b'key1'].value == b'parent1'
+
+        overlay = manager.get_block_batch_overlay(child.hash)
+        assert len(overlay) == 4
+        assert overlay[b'key0'].value == b'parent0'
+        assert overlay[b'key1'].value == b'child1'
+        # Tombstone for a deleted key
+        assert b'key2' in overlay
+        assert overlay[b'key2'].value is None
+        assert overlay[b'key3'].value == b'child3'
+        assert overlay.get(b'key4') is None
+
+        # The states of a committed block are not needed anymore
+        manager.commit(parent)
+        assert manager.get_block_batch_overlay(parent.hash) is None
+        assert manager.get_block_batch_overlay(child.hash) is overlay
+
+    def test_commit_with_pending_root_overlay(self, create_precommit_data_manager):
+        """
+        root - parent - child
+
+        :param create_precommit_data_manager:
+        :return:
+        """
+        root = Block(
+            block_height=100,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=self.block_hash()
+        )
+        parent = Block(
+            block_height=root.height + 1,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=root.hash
+        )
+
+        manager = create_precommit_data_manager(root)
+
+        tx_batch = TransactionBatch()
+        tx_batch[b'key0'] = TransactionBatchValue(b'parent0', True)
+        precommit_data = Mock()
+        precommit_data.block_batch = BlockBatch(parent)
+        precommit_data.block_batch.update(tx_batch)
+        manager.push(precommit_data)
+
+        # The states of parent have not been written to state_db yet
+        manager.commit(parent, flushed=False)
+        assert manager.last_block == parent
+        overlay = manager.get_block_batch_overlay(parent.hash)
+        assert overlay[b'key0'].value == b'parent0'
+
+        child = Block(
+            block_height=parent.height + 1,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=parent.hash
+        )
+        tx_batch = TransactionBatch()
+        tx_batch[b'key1'] = TransactionBatchValue(b'child1', True)
+        precommit_data = Mock()
+        precommit_data.block_batch = BlockBatch(child)
+        precommit_data.block_batch.update(tx_batch)
+        manager.push(precommit_data)
+
+        overlay = manager.get_block_batch_overlay(child.hash)
+        assert overlay[b'key0'].value == b'parent0'
+        assert overlay[b'key1'].value == b'child1'
+
+        # Ignore the block which is not the root
+        manager.release_root_overlay(child)
+        assert manager.get_block_batch_overlay(parent.hash) is not None
+
+        manager.release_root_overlay(parent)
+        assert manager.get_block_batch_overlay(parent.hash) is None
+        assert manager.get_block_batch_overlay(child.hash) is overlay
+
+    def test_detach_overlay_on_commit(self, create_precommit_data_manager):
+        """
+        root - parent - child - grandchild
+
+        :param create_precommit_data_manager:
+        :return:
+        """
+        root = Block(
+            block_height=100,
+            timestamp=self.timestamp(),
+            block_hash=self.block_hash(),
+            prev_hash=self.block_hash()
+        )
+        manager = create_precommit_data_manager(root)
+
+        blocks = []
+        prev_block = root
+        for i in range(3):
+            block = Block(
+                block_height=prev_block.height + 1,
+                timestamp=self.timestamp(),
+                block_hash=self.block_hash(),
+                prev_hash=prev_block.hash
+            )
+            tx_batch = TransactionBatch()
+            tx_batch[b'key0'] = TransactionBatchValue(b'value' + bytes([i]), True)
+            tx_batch[bytes([i])] = TransactionBatchValue(bytes([i]), True)
+            precommit_data = Mock()
+            precommit_data.block_batch = BlockBatch(block)
+            precommit_data.block_batch.update(tx_batch)
+            manager.push(precommit_data)
+
+            blocks.append(block)
+            prev_block = block
+
+        parent, child, grandchild = blocks
+        overlay = manager.get_block_batch_overlay(grandchild.hash)
+        assert overlay[b'key0'].value == b'value\x02'
+        assert len(overlay) == 4
+
+        manager.commit(parent, flushed=False)
+        manager.release_root_overlay(parent)
+        manager.commit(child, flushed=False)
+
+        # The states of parent are read from state_db after it is committed
+        assert manager.get_block_batch_overlay(grandchild.hash) is overlay
+        assert bytes([0]) not in overlay
+        assert overlay[bytes([1])].value == bytes([1])
+        assert overlay[b'key0'].value == b'value\x02'
+        assert len(overlay) == 3
+
     def test_push(self, manager):
         pass
 
@@ -18,8 +18,9 @@ import pytest
 
 from iconservice import Address
 from iconservice.base.address import AddressPrefix
-from iconservice.base.exception import InvalidParamsException
-from iconservice.database.db import IconScoreDatabase
+from iconservice.base.exception import InvalidParamsException, InvalidContainerAccessException
+from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.db import IconScoreDatabase, DatabaseObserver
 from iconservice.iconscore.context.context import ContextContainer
 from iconservice.iconscore.icon_container_db import ContainerUtil, DictDB, ArrayDB, VarDB
 from iconservice.iconscore.icon_score_context import IconScoreContextType, IconScoreContext
@@ -331,3 +332,72 @@ class TestIconContainerDB:
     def test_when_create_var_db_prefix_using_container_util_should_raise_error(self):
         with pytest.raises(InvalidParamsException):
             ContainerUtil.create_db_prefix(VarDB, 'vardb')
+
+    @pytest.mark.parametrize("value_type, value, expected_bytes", [
+        (int, 1, b'\x01'),
+        (int, True, b'\x01'),
+        (int, 'a', b'a'),
+        (str, 'a', b'a'),
+        (str, -1, b'\xff'),
+        (bool, False, b'\x00'),
+        (bytes, b'\x00\x01', b'\x00\x01'),
+        (Address, ADDRESS, ADDRESS.to_bytes()),
+        (dict, 256, b'\x01\x00'),
+    ])
+    def test_get_encoder(self, value_type, value, expected_bytes):
+        encode = ContainerUtil.get_encoder(value_type)
+        assert encode(value) == expected_bytes
+        assert encode(value) == ContainerUtil.encode_value(value)
+
+    @pytest.mark.parametrize("value_type, value, expected_value", [
+        (int, b'\xff', -1),
+        (int, None, 0),
+        (str, b'a', 'a'),
+        (str, None, ""),
+        (bool, b'\x01', True),
+        (bool, None, False),
+        (bytes, b'\x01', b'\x01'),
+        (bytes, None, None),
+        (Address, ADDRESS.to_bytes(), ADDRESS),
+        (Address, None, None),
+        (dict, b'\x01', None),
+    ])
+    def test_get_decoder(self, value_type, value, expected_value):
+        assert ContainerUtil.get_decoder(value_type)(value) == expected_value
+        assert ContainerUtil.decode_object(value, value_type) == expected_value
+        assert ContainerUtil.decode_objects([value, value], value_type) == [expected_value, expected_value]
+
+    def test_dict_db_get_values(self, score_db):
+        test_dict = DictDB('test_dict', score_db, value_type=int)
+        test_dict['a'] = 1
+        test_dict['b'] = 2
+
+        assert test_dict.get_values(['b', 'c', 'a']) == [2, 0, 1]
+
+        test_dict = DictDB('test_dict', score_db, depth=2, value_type=int)
+        with pytest.raises(InvalidContainerAccessException):
+            test_dict.get_values(['a'])
+
+    def test_array_db_iteration_on_invoke(self, score_db, context):
+        size = 300
+        test_array = ArrayDB('test_array', score_db, value_type=int)
+        for i in range(size):
+            test_array.put(i)
+
+        context.type = IconScoreContextType.INVOKE
+        context.block_batch = BlockBatch()
+        context.tx_batch = TransactionBatch()
+        test_array[1] = -1
+
+        gets = []
+        score_db.set_observer(DatabaseObserver(lambda *args: gets.append(args), None, None))
+
+        expected_values = [test_array[i] for i in range(size)]
+        expected_gets = [args for args in gets if not args[1].endswith(b'|size')]
+        gets.clear()
+
+        # Steps are applied to each item as if it were read one by one
+        assert list(test_array) == expected_values
+        assert [args for args in gets if not args[1].endswith(b'|size')] == expected_gets
+        assert len(expected_gets) == size
+        assert expected_values[:3] == [0, -1, 2]
@@ -180,6 +180,12 @@ class TestAutoValueEnum:
         assert data == expected
 
 
+def test_step_type_index():
+    assert [step_type.index for step_type in StepType] == list(range(len(StepType)))
+    assert StepType.DEFAULT.index == 0
+    assert StepType.API_CALL.index == len(StepType) - 1
+
+
 class TestStepTracer:
 
     def test_step_tracer(self):
@@ -256,21 +262,24 @@ class TestIconScoreStepCounter:
     @pytest.fixture
     def mock_step_counter(self):
         counter = IconScoreStepCounter(step_price=mock.ANY,
-                                       step_costs=mock.ANY,
+                                       step_costs={},
                                        step_limit=mock.ANY,
-                                       step_trace_flag=mock.ANY)
+                                       step_trace_flag=False)
         return counter
 
     @pytest.fixture
-    def mock_step_counter_for_apply_step(self, mock_step_counter):
-        def _data(external_call_count, step_costs_get_return_value):
-            mock_step_counter._external_call_count = external_call_count
-            mock_step_counter._step_costs.get = mock.Mock(return_value=step_costs_get_return_value)
-            mock_step_counter.consume_step = mock.Mock()
-            return mock_step_counter
+    def mock_step_counter_for_apply_step(self):
+        def _data(external_call_count, step_cost):
+            step_costs = {step_type: step_cost for step_type in StepType}
+            counter = IconScoreStepCounter(step_price=mock.ANY,
+                                           step_costs=step_costs,
+                                           step_limit=self.PIVOT_VALUE,
+                                           step_trace_flag=True)
+            counter._external_call_count = external_call_count
+            return counter
         return _data
 
-    @pytest.mark.parametrize("mock_step_counter_step_costs_return_value", [0, 1])
+    @pytest.mark.parametrize("mock_step_counter_step_cost", [0, 1])
     @pytest.mark.parametrize("mock_step_counter_external_call_count", [
         MAX_EXTERNAL_CALL_COUNT - 1,
         MAX_EXTERNAL_CALL_COUNT
@@ -279,13 +288,13 @@ class TestIconScoreStepCounter:
     @pytest.mark.parametrize("count", [0, 1])
     def test_apply_step(self,
                         mock_step_counter_for_apply_step,
-                        mock_step_counter_step_costs_return_value,
+                        mock_step_counter_step_cost,
                         mock_step_counter_external_call_count,
                         step_type,
                         count):
         mock_step_counter_for_apply_step = \
             mock_step_counter_for_apply_step(external_call_count=mock_step_counter_external_call_count,
-                                             step_costs_get_return_value=mock_step_counter_step_costs_return_value)
+                                             step_cost=mock_step_counter_step_cost)
 
         if step_type == StepType.CONTRACT_CALL and \
                 mock_step_counter_external_call_count > MAX_EXTERNAL_CALL_COUNT - 1:
@@ -294,9 +303,20 @@ class TestIconScoreStepCounter:
                 mock_step_counter_for_apply_step.apply_step(step_type, count)
             assert e.value.args[0] == 'Too many external calls'
         else:
-            expected_step = mock_step_counter_for_apply_step._step_costs.get(step_type, 0) * count
-            mock_step_counter_for_apply_step.apply_step(step_type, count)
-            mock_step_counter_for_apply_step.consume_step.assert_called_once_with(step_type, expected_step)
+            expected_step = mock_step_counter_for_apply_step.get_step_cost(step_type) * count
+            step_used = mock_step_counter_for_apply_step.apply_step(step_type, count)
+            assert step_used == expected_step
+            assert mock_step_counter_for_apply_step.step_tracer.steps == [(step_type, expected_step, expected_step)]
+
+    @pytest.mark.parametrize("step_type", [t for t in StepType])
+    def test_get_step_cost(self, step_type):
+        step_costs = {t: i + 1 for i, t in enumerate(StepType) if t != step_type}
+        counter = IconScoreStepCounter(step_price=mock.ANY,
+                                       step_costs=step_costs,
+                                       step_limit=mock.ANY)
+
+        for t in StepType:
+            assert counter.get_step_cost(t) == step_costs.get(t, 0)
 
     @pytest.fixture
     def mock_step_counter_for_consume_step(self, mock_step_counter):
@@ -304,7 +324,8 @@ class TestIconScoreStepCounter:
             mock_step_counter._max_step_used = max_step_used
             mock_step_counter._step_used = step_used
             mock_step_counter._step_limit = step_limit
-            mock_step_counter._trace_step = mock.Mock()
+            mock_step_counter._step_tracer = StepTracer()
+            mock_step_counter._step_tracer._cumulative_step = step_used
             return mock_step_counter
         return _data
 
@@ -313,31 +334,43 @@ class TestIconScoreStepCounter:
     @pytest.mark.parametrize("mock_step_counter_max_step_used", {PIVOT_VALUE - 1, PIVOT_VALUE, PIVOT_VALUE + 1})
     @pytest.mark.parametrize("step_type", [t for t in StepType])
     @pytest.mark.parametrize("step", [0, 2])
+    @pytest.mark.parametrize("apply", [False, True])
     def test_consume_step(self,
                           mock_step_counter_for_consume_step,
                           mock_step_counter_step_used,
                           mock_step_counter_step_limit,
                           mock_step_counter_max_step_used,
                           step_type,
-                          step):
+                          step,
+                          apply):
         mock_step_counter_for_consume_step = \
             mock_step_counter_for_consume_step(max_step_used=mock_step_counter_max_step_used,
                                                step_used=mock_step_counter_step_used,
                                                step_limit=mock_step_counter_step_limit)
 
+        def _consume_step():
+            if apply:
+                # apply_step() consumes steps in the same way with consume_step()
+                mock_step_counter_for_consume_step._step_cost_table[step_type.index] = step
+                return mock_step_counter_for_consume_step.apply_step(step_type, 1)
+            return mock_step_counter_for_consume_step.consume_step(step_type=step_type, step=step)
+
         expected_step_used = mock_step_counter_step_used + step
+        expected_max_step_used = max(mock_step_counter_max_step_used, expected_step_used)
 
         if expected_step_used > mock_step_counter_step_limit:
             with pytest.raises(OutOfStepException) as e:
-                mock_step_counter_for_consume_step.consume_step(step_type=step_type,
-                                                                step=step)
+                _consume_step()
 
             assert e.value.args[0] == mock_step_counter_step_limit
             assert e.value.args[1] == mock_step_counter_step_used
             assert e.value.args[2] == step
             assert e.value.args[3] == step_type
+            assert mock_step_counter_for_consume_step._step_used == mock_step_counter_step_limit
+            assert len(mock_step_counter_for_consume_step.step_tracer) == 0
         else:
-            step_used = mock_step_counter_for_consume_step.consume_step(step_type=step_type,
-                                                                        step=step)
-            mock_step_counter_for_consume_step._trace_step.assert_called_once_with(step_type, step)
+            step_used = _consume_step()
             assert step_used == expected_step_used
+            assert mock_step_counter_for_consume_step.step_tracer.steps == [(step_type, step, expected_step_used)]
+
+        assert mock_step_counter_for_consume_step.max_step_used == expected_max_step_used
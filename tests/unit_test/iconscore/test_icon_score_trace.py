@@ -106,6 +106,20 @@ class TestTrace:
         assert trace.data[0] == to_
         assert trace.data[3] == amount
 
+    def test_icx_is_cached_per_context(self, mapped_test_score):
+        icx = mapped_test_score.icx
+        assert icx is mapped_test_score.icx
+
+        # Another thread gets an Icx bound to its own context
+        ContextContainer._push_context(IconScoreContext())
+        try:
+            assert icx is not mapped_test_score.icx
+            assert mapped_test_score.icx is mapped_test_score.icx
+        finally:
+            ContextContainer._pop_context()
+
+        assert icx is mapped_test_score.icx
+
     def test_call(self, mapped_test_score):
         context = ContextContainer._get_context()
         score_address = Mock(spec=Address)
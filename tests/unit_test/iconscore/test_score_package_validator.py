@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from iconservice.base.exception import IllegalFormatException
+from iconservice.iconscore.score_package_validator import ScorePackageValidator
+
+WHITELIST = {"iconservice": ["*"], "os": ["path"]}
+
+SCORE_CODE = """
+from iconservice import *
+from os import path
+from .lib import func
+"""
+
+
+def _write_package(root: str, package: str, main_code: str, lib_code: str = "def func(): pass\n") -> str:
+    pkg_root_path = os.path.join(root, package)
+    os.makedirs(pkg_root_path)
+
+    with open(os.path.join(pkg_root_path, "main.py"), "w") as f:
+        f.write(main_code)
+    with open(os.path.join(pkg_root_path, "lib.py"), "w") as f:
+        f.write(lib_code)
+
+    return pkg_root_path
+
+
+@pytest.fixture
+def score_root(tmp_path, monkeypatch):
+    root = str(tmp_path / "score")
+    os.makedirs(root)
+    monkeypatch.syspath_prepend(root)
+    return root
+
+
+class TestScorePackageValidator:
+    def test_execute_with_cache(self, mocker, score_root, tmp_path):
+        cache_path = str(tmp_path / "cache")
+        pkg_root_path = _write_package(score_root, "validator_pkg0", SCORE_CODE)
+        validate = mocker.spy(ScorePackageValidator, "_validate_import_from_code")
+
+        ScorePackageValidator.execute(WHITELIST, pkg_root_path, "validator_pkg0", cache_path)
+        assert validate.call_count > 0
+        assert len(os.listdir(cache_path)) == 1
+
+        # The package with the same contents is not validated again
+        validate.reset_mock()
+        pkg_root_path = _write_package(score_root, "validator_pkg1", SCORE_CODE)
+        ScorePackageValidator.execute(WHITELIST, pkg_root_path, "validator_pkg1", cache_path)
+        validate.assert_not_called()
+
+        # The package with different contents is validated
+        pkg_root_path = _write_package(score_root, "validator_pkg2", SCORE_CODE, "def func(): return 1\n")
+        ScorePackageValidator.execute(WHITELIST, pkg_root_path, "validator_pkg2", cache_path)
+        assert validate.call_count > 0
+        assert len(os.listdir(cache_path)) == 2
+
+        # The same package is validated again with a different whitelist
+        with pytest.raises(IllegalFormatException):
+            ScorePackageValidator.execute({"iconservice": ["*"]}, pkg_root_path, "validator_pkg2", cache_path)
+        assert len(os.listdir(cache_path)) == 2
+
+    def test_execute_invalid_package_not_cached(self, score_root, tmp_path):
+        cache_path = str(tmp_path / "cache")
+        code = "from iconservice import *\nimport json\n"
+
+        for i in range(2):
+            pkg_root_path = _write_package(score_root, f"invalid_validator_pkg{i}", code)
+            with pytest.raises(IllegalFormatException):
+                ScorePackageValidator.execute(WHITELIST, pkg_root_path, f"invalid_validator_pkg{i}", cache_path)
+
+        assert not os.path.exists(cache_path)
+
+    def test_execute_without_cache(self, mocker, score_root):
+        pkg_root_path = _write_package(score_root, "validator_pkg3", SCORE_CODE)
+        make_cache_key = mocker.spy(ScorePackageValidator, "_make_cache_key")
+
+        ScorePackageValidator.execute(WHITELIST, pkg_root_path, "validator_pkg3")
+        make_cache_key.assert_not_called()
@@ -23,8 +23,12 @@ from typing_extensions import TypedDict
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.exception import InvalidParamsException
 from iconservice.iconscore.typing.conversion import (
+    ConvertOption,
+    ParamsConverter,
     convert_score_parameters,
+    create_converter,
     object_to_str,
+    str_to_object,
     str_to_object_in_struct,
 )
 from iconservice.iconscore.typing.element import normalize_signature
@@ -167,3 +171,73 @@ def test_str_to_object_in_struct(age, success):
     else:
         with pytest.raises(InvalidParamsException):
             str_to_object_in_struct(params, Person)
+
+
+@pytest.mark.parametrize(
+    "type_hint,value",
+    [
+        (int, "0x10"),
+        (int, "-10"),
+        (int, "zz"),
+        (int, 10),
+        (bool, "0x1"),
+        (bytes, "0x0102"),
+        (str, ["a"]),
+        (Address, "hx" + "12" * 20),
+        (Address, "hx12"),
+        (List[int], ["0x1", "0x2"]),
+        (List[int], "0x1"),
+        (Optional[int], None),
+        (Optional[int], 1.5),
+        (Dict[str, int], {"a": "0x1"}),
+        (Person, {"name": "john", "age": "0xa"}),
+        (Person, {"name": "john"}),
+        (Person, {"name": "john", "age": None, "married": "0x1"}),
+        (List[Person], [{"name": "john", "age": None}, "john"]),
+        (float, "1.0"),
+    ]
+)
+def test_create_converter(type_hint, value):
+    def convert(func):
+        try:
+            return func()
+        except BaseException as e:
+            return type(e), str(e)
+
+    converter = create_converter(type_hint)
+    assert convert(lambda: converter(value)) == convert(lambda: str_to_object(value, type_hint))
+
+
+@pytest.mark.parametrize("options", [ConvertOption.NONE, ConvertOption.IGNORE_UNKNOWN_PARAMS])
+def test_params_converter(options):
+    class TestScore:
+        def func(self, user: User, count: int, memo: str = None, to: Address = None):
+            pass
+
+    address = Address.from_data(AddressPrefix.EOA, os.urandom(20))
+    params = {
+        "user": {"name": "hello", "age": 30, "single": True, "wallet": address},
+        "count": 5,
+        "to": address,
+    }
+    sig = FunctionMetadata(TestScore.func).signature
+    converter = ParamsConverter(sig)
+
+    str_params = object_to_str(params)
+    assert converter.convert(dict(str_params), options) == params
+
+    # Default values are set to the given params as convert_score_parameters() does
+    for given_params in (dict(str_params), dict(str_params, unknown="0x1")):
+        expected_params = dict(given_params)
+
+        if options & ConvertOption.IGNORE_UNKNOWN_PARAMS:
+            ret = converter.convert(given_params, options)
+            assert ret == convert_score_parameters(expected_params, sig, options)
+            assert given_params == expected_params
+        elif "unknown" in given_params:
+            with pytest.raises(InvalidParamsException, match="Unknown param"):
+                converter.convert(given_params, options)
+
+    del str_params["count"]
+    with pytest.raises(InvalidParamsException, match="Argument not found: count"):
+        converter.convert(str_params, options)
@@ -20,16 +20,19 @@ from unittest.mock import PropertyMock
 import pytest
 
 from iconservice import Address
+from iconservice.base.address import AddressPrefix
 from iconservice.base.block import Block
 from iconservice.database.db import ContextDatabase
 from iconservice.icon_constant import Revision, IconScoreContextType
 from iconservice.iconscore.context.context import ContextContainer
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.icx.coin_part import CoinPart, CoinPartFlag, CoinPartType
+from iconservice.icx.delegation_part import DelegationPart
 from iconservice.icx.icx_account import Account
 from iconservice.icx.stake_part import StakePart
-from iconservice.icx.storage import Storage, Intent
+from iconservice.icx.storage import Storage, Intent, AccountPartFlag
 from iconservice.utils import ContextStorage
+from tests import create_address
 
 ADDRESS = Address.from_string(f"hx{'1234'*10}")
 UNSTAKE_LOCK_PERIOD = 20
@@ -103,3 +106,28 @@ class TestIcxStorage:
             account = storage.get_account(context, ADDRESS)
             assert account.balance == expected_balance
             assert account.unstakes_info == remaining_unstakes
+
+    def test_get_parts(self, storage, context):
+        addresses = [create_address(AddressPrefix.EOA) for _ in range(10)]
+
+        for i, address in enumerate(addresses[:7]):
+            stake_part = StakePart(stake=i + 1)
+            stake_part.set_complete(True)
+            stake_part.set_dirty(True)
+            delegation_part = DelegationPart(delegated_amount=(i + 1) * 10)
+            delegation_part.set_dirty(True)
+            account = Account(address, 0, Revision.LATEST.value,
+                              stake_part=stake_part, delegation_part=delegation_part)
+            storage.put_account(context, account)
+
+        stake_parts = storage.get_parts(context, StakePart, addresses)
+        delegation_parts = storage.get_parts(context, DelegationPart, addresses)
+        assert list(stake_parts) == addresses
+        assert list(delegation_parts) == addresses
+
+        for i, address in enumerate(addresses):
+            # Empty parts are returned for the addresses without them
+            expected_stake = i + 1 if i < 7 else 0
+            assert stake_parts[address].stake == expected_stake
+            assert stake_parts[address].stake == storage.get_part(context, AccountPartFlag.STAKE, address).stake
+            assert delegation_parts[address].delegated_amount == expected_stake * 10
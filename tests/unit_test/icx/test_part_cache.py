@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+
+import pytest
+
+from iconservice import Address
+from iconservice.base.block import Block
+from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue
+from iconservice.database.db import ContextDatabase
+from iconservice.icon_constant import IconScoreContextType, Revision
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.icx.coin_part import CoinPart
+from iconservice.icx.delegation_part import DelegationPart
+from iconservice.icx.part_cache import AccountPartCache
+from iconservice.icx.stake_part import StakePart
+
+ADDRESS = Address.from_string(f"hx{'1234' * 10}")
+
+
+@pytest.fixture(scope="function")
+def db():
+    db_name = 'part_cache.db'
+    db = ContextDatabase.from_path(db_name)
+    yield db
+    db.key_value_db.close()
+    shutil.rmtree(db_name)
+
+
+@pytest.fixture(scope="function")
+def context():
+    ctx = IconScoreContext(IconScoreContextType.INVOKE)
+    ctx.block = Block(1, None, 0, None, 0)
+    ctx.block_batch = BlockBatch(ctx.block)
+    ctx.tx_batch = TransactionBatch()
+    return ctx
+
+
+def _put_committed(db: 'ContextDatabase', key: bytes, value: bytes):
+    db.key_value_db.put(key, value)
+
+
+class TestAccountPartCache:
+    def test_get_committed(self, db, context):
+        key: bytes = CoinPart.make_key(ADDRESS)
+        _put_committed(db, key, CoinPart(balance=100).to_bytes(Revision.LATEST.value))
+
+        cache = AccountPartCache(db)
+        part = cache.get(context, CoinPart, key)
+        assert part.balance == 100
+        assert cache.value_misses == 1
+        assert cache.part_misses == 1
+
+        # Modifying the returned part must not affect the cached one
+        part.deposit(10)
+        part = cache.get(context, CoinPart, key)
+        assert part.balance == 100
+        assert cache.value_hits == 1
+        assert cache.part_hits == 1
+
+        # No part
+        assert cache.get(context, StakePart, StakePart.make_key(ADDRESS)) is None
+
+    def test_get_from_batch(self, db, context):
+        key: bytes = CoinPart.make_key(ADDRESS)
+        _put_committed(db, key, CoinPart(balance=100).to_bytes(Revision.LATEST.value))
+
+        cache = AccountPartCache(db)
+        assert cache.get(context, CoinPart, key).balance == 100
+
+        # The uncommitted state in tx_batch precedes the committed one
+        value: bytes = CoinPart(balance=200).to_bytes(Revision.LATEST.value)
+        context.tx_batch[key] = TransactionBatchValue(value, True)
+        assert cache.get(context, CoinPart, key).balance == 200
+
+        context.block_batch.update(context.tx_batch)
+        context.tx_batch.clear()
+        assert cache.get(context, CoinPart, key).balance == 200
+
+        # Deleted state in block_batch
+        context.tx_batch[key] = TransactionBatchValue(None, True)
+        assert cache.get(context, CoinPart, key) is None
+        context.tx_batch.clear()
+
+        # Apply the committed block to the cache
+        db.key_value_db.put(key, value)
+        cache.commit(context.block_batch)
+        context.block_batch.clear()
+        assert cache.get(context, CoinPart, key).balance == 200
+        assert cache.value_misses == 1
+
+    def test_copy(self, db, context):
+        delegations = [(ADDRESS, 10)]
+        key: bytes = DelegationPart.make_key(ADDRESS)
+        _put_committed(db, key, DelegationPart(delegations=delegations).to_bytes())
+
+        key_for_stake: bytes = StakePart.make_key(ADDRESS)
+        stake_part = StakePart(stake=10, unstakes_info=[[5, 20]])
+        stake_part.set_complete(True)
+        _put_committed(db, key_for_stake, stake_part.to_bytes(Revision.LATEST.value))
+
+        cache = AccountPartCache(db)
+        part = cache.get(context, DelegationPart, key)
+        part.delegations.append((ADDRESS, 20))
+        assert cache.get(context, DelegationPart, key).delegations == delegations
+
+        part = cache.get(context, StakePart, key_for_stake)
+        part.set_complete(True)
+        part.unstakes_info[0][0] = 0
+
+        part = cache.get(context, StakePart, key_for_stake)
+        part.set_complete(True)
+        assert part.unstakes_info == [[5, 20]]
+
+    def test_max_size(self, db, context):
+        cache = AccountPartCache(db, max_size=2)
+
+        keys = []
+        for i in range(3):
+            address = Address.from_data(ADDRESS.prefix, i.to_bytes(4, "big"))
+            key: bytes = CoinPart.make_key(address)
+            _put_committed(db, key, CoinPart(balance=i + 1).to_bytes(Revision.LATEST.value))
+            keys.append(key)
+
+        for key in keys:
+            cache.get(context, CoinPart, key)
+        assert len(cache) == 2
+
+        # The least recently used one has been evicted
+        cache.get(context, CoinPart, keys[0])
+        assert cache.value_misses == 4
+
+        cache.clear()
+        assert len(cache) == 0
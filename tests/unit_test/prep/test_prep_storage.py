@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import PropertyMock
+
+import pytest
+
+from iconservice.database.batch import BlockBatch, TransactionBatch
+from iconservice.database.db import ContextDatabase
+from iconservice.icon_constant import Revision
+from iconservice.iconscore.icon_score_context import IconScoreContextType, IconScoreContext
+from iconservice.prep import PRepStorage
+from iconservice.prep.data import PRep
+from tests import create_address
+
+
+@pytest.fixture
+def context():
+    context = IconScoreContext(IconScoreContextType.DIRECT)
+    context.tx_batch = TransactionBatch()
+    context.block_batch = BlockBatch()
+    yield context
+
+
+@pytest.fixture
+def storage(tmp_path):
+    db = ContextDatabase.from_path(str(tmp_path / "prep.db"))
+    yield PRepStorage(db)
+    db.key_value_db.close()
+
+
+@pytest.fixture
+def set_revision(mocker):
+    def _set_revision(revision: int):
+        mocker.patch.object(IconScoreContext, "revision", PropertyMock(return_value=revision))
+
+    return _set_revision
+
+
+def _update_block_statistics(prep: 'PRep', block_height: int) -> 'PRep':
+    prep = prep.copy()
+    prep.update_block_statistics(is_validator=True)
+    prep.last_generate_block_height = block_height
+    return prep
+
+
+class TestPRepStorage:
+    def test_put_prep_before_revision(self, context, storage, set_revision, mocker):
+        set_revision(Revision.SEPARATE_PREP_BLOCK_STATISTICS.value - 1)
+        prep = PRep(create_address(), name="prep0", block_height=1)
+        storage.put_prep(context, prep)
+
+        prep = _update_block_statistics(prep, 10)
+        storage.put_prep(context, prep)
+
+        key: bytes = PRep.make_block_statistics_key(prep.address)
+        assert storage._db.get(context, key) is None
+
+        # Block statistics are not read before the revision
+        get = mocker.spy(storage._db, "get")
+        assert storage.get_prep(context, prep.address).to_bytes(context.revision) == prep.to_bytes(context.revision)
+        assert [call[0][1] for call in get.call_args_list] == [PRep.make_key(prep.address)]
+
+    def test_put_prep_block_statistics(self, context, storage, set_revision):
+        set_revision(Revision.SEPARATE_PREP_BLOCK_STATISTICS.value)
+        prep = PRep(create_address(), name="prep0", block_height=1)
+        storage.put_prep(context, prep)
+        data: bytes = storage._db.get(context, PRep.make_key(prep.address))
+
+        # Only block statistics are written when they are the only changes
+        prep = _update_block_statistics(prep, 10)
+        storage.put_prep(context, prep)
+        assert storage._db.get(context, PRep.make_key(prep.address)) == data
+
+        prep2: 'PRep' = storage.get_prep(context, prep.address)
+        assert prep2.total_blocks == prep2.validated_blocks == 1
+        assert prep2.last_generate_block_height == 10
+
+        # All P-Rep data are written when the other data are changed as well
+        prep = _update_block_statistics(prep, 11)
+        prep.name = "prep1"
+        storage.put_prep(context, prep)
+
+        prep2 = storage.get_prep(context, prep.address)
+        assert prep2.name == "prep1"
+        assert prep2.total_blocks == 2
+        assert prep2.last_generate_block_height == 11
+
+        prep3 = PRep(create_address(), name="prep3", block_height=2)
+        storage.put_prep(context, prep3)
+
+        preps = {prep.address: prep for prep in storage.get_prep_iterator()}
+        assert len(preps) == 2
+        assert preps[prep.address].to_bytes(context.revision) == prep.to_bytes(context.revision)
+        assert preps[prep3.address].to_bytes(context.revision) == prep3.to_bytes(context.revision)
+
+        storage.delete_prep(context, prep.address)
+        assert storage._db.get(context, PRep.make_block_statistics_key(prep.address)) is None
@@ -85,11 +85,36 @@ class TestSCORELoader:
         mock_utils.get_package_name_by_address_and_tx_hash.assert_called_once_with(address, tx_hash)
         mock_icon_score_class_loader._load_package_json.assert_called_once_with(deploy_path)
         mock_icon_score_class_loader._get_package_info.assert_called_once_with(package_json)
-        mock_importlib.invalidate_caches.assert_called_once()
+        mock_importlib.invalidate_caches.assert_not_called()
         mock_importlib.import_module.assert_called_once_with(f".{main_file}", package_name)
 
         assert ins_ret_value == ret_module()
 
+    @pytest.mark.parametrize("missing_module_name", [
+        "addr", "addr.hash", "addr.hash.file", "addr.hash.lib"
+    ])
+    def test_import_module_invalidate_caches(self, mock_importlib, missing_module_name):
+        module = mock.Mock()
+        mock_importlib.import_module.side_effect = [
+            ModuleNotFoundError(name=missing_module_name), module
+        ]
+
+        ret = IconScoreClassLoader._import_module(".file", "addr.hash")
+
+        assert ret is module
+        mock_importlib.invalidate_caches.assert_called_once()
+        assert mock_importlib.import_module.call_count == 2
+
+    @pytest.mark.parametrize("missing_module_name", [None, "os2", "address"])
+    def test_import_module_not_found(self, mock_importlib, missing_module_name):
+        mock_importlib.import_module.side_effect = ModuleNotFoundError(name=missing_module_name)
+
+        with pytest.raises(ModuleNotFoundError):
+            IconScoreClassLoader._import_module(".file", "addr.hash")
+
+        mock_importlib.invalidate_caches.assert_not_called()
+        mock_importlib.import_module.assert_called_once_with(".file", "addr.hash")
+
     @pytest.mark.parametrize("package_json, expected_module, expected_score", [
         ({VERSION: mock.ANY, MAIN_MODULE: "token", MAIN_SCORE: "Token"}, "token", "Token"),
         ({VERSION: mock.ANY, MAIN_FILE: "token", MAIN_SCORE: "Token"}, "token", "Token"),
@@ -99,3 +124,33 @@ class TestSCORELoader:
         main_module, main_score = IconScoreClassLoader._get_package_info(package_json)
         assert expected_module == main_module
         assert expected_score == main_score
+
+    def test_run_while_preloading(self, mocker, tmp_path):
+        score_root_path = str(tmp_path)
+        IconScoreClassLoader.init(score_root_path)
+        address = create_address()
+        tx_hash = create_tx_hash()
+        loaded = []
+
+        def _load(score_address, _tx_hash, _score_root_path):
+            if len(loaded) == 0:
+                # run() is called on another thread while the SCORE is preloaded
+                loaded.append("preload")
+                # The SCORE is not preloaded again during loading
+                IconScoreClassLoader.preload(score_address, _tx_hash, _score_root_path)
+                assert IconScoreClassLoader.run(score_address, _tx_hash, _score_root_path) == "run"
+                return "preload"
+
+            loaded.append("run")
+            return "run"
+
+        mocker.patch.object(IconScoreClassLoader, "_load", side_effect=_load)
+
+        IconScoreClassLoader.preload(address, tx_hash, score_root_path)
+
+        # The class preloaded after run() is not kept
+        assert loaded == ["preload", "run"]
+        assert IconScoreClassLoader._preloaded_classes == {}
+        assert IconScoreClassLoader._preloading == set()
+        assert IconScoreClassLoader.run(address, tx_hash, score_root_path) == "run"
+        IconScoreClassLoader.close(score_root_path)
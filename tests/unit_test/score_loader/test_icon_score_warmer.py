@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from iconservice.base.address import AddressPrefix
+from iconservice.score_loader.icon_score_class_loader import IconScoreClassLoader
+from iconservice.score_loader.icon_score_warmer import IconScoreWarmer, SCORE_USAGE_FILE
+from tests import create_address, create_tx_hash
+
+
+@pytest.fixture
+def score_root_path(tmp_path):
+    path = str(tmp_path)
+    IconScoreClassLoader.init(path)
+    yield path
+    IconScoreClassLoader.close(path)
+
+
+@pytest.fixture
+def mock_load(mocker):
+    def _load(score_address, tx_hash, _score_root_path):
+        return (score_address, tx_hash)
+
+    return mocker.patch.object(IconScoreClassLoader, "_load", side_effect=_load)
+
+
+def _create_usages(count: int) -> list:
+    return [(create_address(AddressPrefix.CONTRACT), create_tx_hash()) for _ in range(count)]
+
+
+class TestIconScoreWarmer:
+    def test_warm_up(self, score_root_path, mock_load):
+        usages = _create_usages(5)
+
+        # The first process loads SCOREs and saves them to the usage file on close
+        warmer = IconScoreWarmer(score_root_path, max_count=3)
+        warmer.start()
+        for score_address, tx_hash in usages:
+            IconScoreClassLoader.run(score_address, tx_hash, score_root_path)
+        warmer.close()
+        IconScoreClassLoader.close(score_root_path)
+
+        assert os.path.exists(os.path.join(score_root_path, SCORE_USAGE_FILE))
+
+        # The next process loads the 3 most recently used SCOREs in advance except for the one loaded already
+        IconScoreClassLoader.init(score_root_path)
+        mock_load.reset_mock()
+        IconScoreClassLoader.run(*usages[4], score_root_path)
+
+        warmer = IconScoreWarmer(score_root_path, max_count=3)
+        warmer.start()
+        warmer._executor.shutdown()
+
+        assert [call[0][:2] for call in mock_load.call_args_list] == [usages[4], usages[3], usages[2]]
+        assert IconScoreClassLoader.get_usages() == usages[2:]
+
+        # Preloaded SCOREs are not loaded again
+        mock_load.reset_mock()
+        assert IconScoreClassLoader.run(*usages[2], score_root_path) == usages[2]
+        mock_load.assert_not_called()
+        assert IconScoreClassLoader.get_usages() == [usages[3], usages[4], usages[2]]
+
+        # A SCORE updated after the warm-up is loaded again
+        tx_hash = create_tx_hash()
+        assert IconScoreClassLoader.run(usages[3][0], tx_hash, score_root_path) == (usages[3][0], tx_hash)
+        mock_load.assert_called_once()
+
+        warmer.close()
+
+    def test_warm_up_failure(self, score_root_path, mocker):
+        usages = _create_usages(2)
+        IconScoreClassLoader.add_past_usages(usages)
+        IconScoreWarmer(score_root_path, max_count=10).close()
+        IconScoreClassLoader.close(score_root_path)
+        IconScoreClassLoader.init(score_root_path)
+
+        mock_load = mocker.patch.object(IconScoreClassLoader, "_load", side_effect=FileNotFoundError)
+        warmer = IconScoreWarmer(score_root_path, max_count=10)
+        warmer.start()
+        warmer._executor.shutdown()
+
+        assert mock_load.call_count == 2
+        assert IconScoreClassLoader.get_usages() == usages
+        warmer.close()
+
+    def test_invalid_usage_file(self, score_root_path, mock_load):
+        with open(os.path.join(score_root_path, SCORE_USAGE_FILE), "w") as f:
+            f.write("[[\"hx1234\", \"zz\"]]")
+
+        warmer = IconScoreWarmer(score_root_path, max_count=10)
+        warmer.start()
+        assert warmer._executor is None
+        warmer.close()
+
+        mock_load.assert_not_called()
+
+    def test_disabled(self, score_root_path, mock_load):
+        usages = _create_usages(1)
+        IconScoreClassLoader.run(*usages[0], score_root_path)
+
+        warmer = IconScoreWarmer(score_root_path, max_count=0)
+        warmer.start()
+        warmer.close()
+
+        assert not os.path.exists(os.path.join(score_root_path, SCORE_USAGE_FILE))
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import copy
 import threading
 from unittest.mock import Mock
 
@@ -22,8 +23,9 @@ from iconcommons import IconConfig
 
 from iconservice.base.exception import FatalException, InvalidBaseTransactionException, IconServiceBaseException
 from iconservice.base.type_converter_templates import ConstantKeys
-from iconservice.icon_constant import RPCMethod, ENABLE_THREAD_FLAG
-from iconservice.icon_inner_service import IconScoreInnerTask
+from iconservice.icon_config import default_icon_config
+from iconservice.icon_constant import RPCMethod, ENABLE_THREAD_FLAG, ConfigKey
+from iconservice.icon_inner_service import IconScoreInnerTask, THREAD_QUERY, THREAD_INVOKE, THREAD_STATUS
 from iconservice.icon_service_engine import IconServiceEngine
 from iconservice.iconscore.icon_score_step import OutOfStepException
 from tests import create_block_hash
@@ -33,7 +35,7 @@ from tests import create_block_hash
 def inner_task(mocker, request):
     mocker.patch.object(IconScoreInnerTask, "_open")
     mocker.patch.object(IconScoreInnerTask, "_close")
-    inner_task = IconScoreInnerTask(Mock(spec=IconConfig))
+    inner_task = IconScoreInnerTask(IconConfig("", copy.deepcopy(default_icon_config)))
     inner_task._thread_flag = request.param
     icon_service_engine = Mock(spec=IconServiceEngine)
     inner_task._icon_service_engine = icon_service_engine
@@ -231,3 +233,24 @@ class TestIconInnerService:
         assert status_requests[0] != call_thread_id
         assert status_requests[0] != estimate_thread_id
         assert call_thread_id != estimate_thread_id
+
+    def test_thread_pool_size(self, mocker):
+        mocker.patch.object(IconScoreInnerTask, "_open")
+        conf = IconConfig("", copy.deepcopy(default_icon_config))
+        conf.update_conf({
+            ConfigKey.THREAD_POOL_SIZE: {
+                ConfigKey.THREAD_POOL_SIZE_QUERY: 4,
+                ConfigKey.THREAD_POOL_SIZE_STATUS: 0,
+            }
+        })
+
+        inner_task = IconScoreInnerTask(conf)
+        thread_pool = inner_task._thread_pool
+
+        assert thread_pool[THREAD_INVOKE]._max_workers == 1
+        assert thread_pool[THREAD_QUERY]._max_workers == 4
+        # An invalid size is replaced with 1
+        assert thread_pool[THREAD_STATUS]._max_workers == 1
+
+        for executor in thread_pool.values():
+            executor.shutdown()
@@ -45,6 +45,30 @@ def test_make_flag(engine, fee, audit, validator):
     assert flag == (fee_flag_value | audit_flag_value | validator_flag_value)
 
 
+def test_make_db_options(engine):
+    conf = {
+        ConfigKey.DB_LRU_CACHE_SIZE: 512 * 1024 * 1024,
+        ConfigKey.DB_BLOOM_FILTER_BITS: 10,
+        ConfigKey.DB_WRITE_BUFFER_SIZE: 64 * 1024 * 1024,
+        ConfigKey.DB_MAX_OPEN_FILES: 5000,
+        ConfigKey.DB_BLOCK_SIZE: 16 * 1024,
+        ConfigKey.DB_COMPRESSION: "none",
+        "unknown": 1,
+    }
+    options = engine._make_db_options(conf)
+    assert options == {
+        "lru_cache_size": 512 * 1024 * 1024,
+        "bloom_filter_bits": 10,
+        "write_buffer_size": 64 * 1024 * 1024,
+        "max_open_files": 5000,
+        "block_size": 16 * 1024,
+        "compression": None,
+    }
+
+    options = engine._make_db_options({ConfigKey.DB_BLOOM_FILTER_BITS: 0, ConfigKey.DB_COMPRESSION: "snappy"})
+    assert options == {"compression": "snappy"}
+
+
 @pytest.mark.parametrize("method", [
     "icx_getBalance", "icx_getTotalSupply", "icx_call", "icx_sendTransaction",
     "debug_estimateStep", "icx_getScoreApi", "ise_getStatus"])
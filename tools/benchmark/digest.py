@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the streaming digest of a batch with the previous one joining all data
+
+python3 -m tools.benchmark.digest
+"""
+
+import os
+import tracemalloc
+from collections import OrderedDict
+
+from iconservice.database.batch import TransactionBatchValue, digest
+from iconservice.utils import sha3_256
+from tools.benchmark.utils import measure, print_result
+
+
+def joined_digest(ordered_dict: OrderedDict) -> bytes:
+    data = []
+
+    for key, tx_batch_value in ordered_dict.items():
+        if tx_batch_value.include_state_root_hash is True:
+            value: bytes = tx_batch_value.value
+        else:
+            continue
+        data.append(key)
+        if value is not None:
+            data.append(value)
+    value: bytes = b'|'.join(data)
+    return sha3_256(value)
+
+
+def create_batch(count: int, value_size: int) -> OrderedDict:
+    batch = OrderedDict()
+    for i in range(count):
+        value = None if i % 10 == 0 else os.urandom(value_size)
+        batch[os.urandom(32)] = TransactionBatchValue(value, True)
+
+    return batch
+
+
+def peak_memory(func, batch: OrderedDict) -> int:
+    tracemalloc.start()
+    func(batch)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak
+
+
+def main():
+    cases = (
+        ("100k small values", 100_000, 32),
+        ("10k 1KB values", 10_000, 1024),
+        ("1k 16KB values", 1_000, 16 * 1024),
+        ("64 256KB values", 64, 256 * 1024),
+    )
+
+    for name, count, value_size in cases:
+        batch = create_batch(count, value_size)
+        assert digest(batch) == joined_digest(batch)
+
+        old = measure(lambda: joined_digest(batch), repeat=5)
+        new = measure(lambda: digest(batch), repeat=5)
+        print_result(name, old, new)
+        print(f"{'':<40} peak memory old={peak_memory(joined_digest, batch):,}B "
+              f"new={peak_memory(digest, batch):,}B")
+
+
+if __name__ == "__main__":
+    main()
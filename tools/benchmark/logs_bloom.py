@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the logs blooms of a block built by BloomBuilder with the previous ones adding values to BloomFilter
+
+python3 -m tools.benchmark.logs_bloom
+"""
+
+from typing import List
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.icon_service_engine import IconServiceEngine
+from iconservice.iconscore.icon_score_event_log import EventLog, EventLogEmitter
+from iconservice.utils.bloom import BloomBuilder, BloomFilter
+from tools.benchmark.utils import measure, print_result
+
+TRANSFER_SIGNATURE = "ICXTransfer(Address,Address,int)"
+TOKEN_TRANSFER_SIGNATURE = "Transfer(Address,Address,int,bytes)"
+
+
+def create_block_event_logs(tx_count: int) -> List[List[EventLog]]:
+    """Returns the event logs of the transactions in a block
+    transferring ICX and tokens between a small number of accounts
+    """
+    scores = [Address.from_data(AddressPrefix.CONTRACT, f"score{i}".encode()) for i in range(10)]
+    accounts = [Address.from_data(AddressPrefix.EOA, f"account{i}".encode()) for i in range(100)]
+
+    block = []
+    for i in range(tx_count):
+        score = scores[i % len(scores)]
+        from_ = accounts[i % len(accounts)]
+        to = accounts[(i * 7 + 1) % len(accounts)]
+
+        block.append([
+            EventLog(score, [TRANSFER_SIGNATURE, score, to, i], []),
+            EventLog(score, [TOKEN_TRANSFER_SIGNATURE, from_, to, i * 10], [b""]),
+        ])
+
+    return block
+
+
+def generate_logs_blooms_old(block: List[List[EventLog]]) -> List[BloomFilter]:
+    blooms = []
+
+    for event_logs in block:
+        logs_bloom = BloomFilter()
+        for event_log in event_logs:
+            logs_bloom.add(EventLogEmitter.get_ordered_bytes(0xff, event_log.score_address))
+            for i, indexed_item in enumerate(event_log.indexed):
+                logs_bloom.add(EventLogEmitter.get_ordered_bytes(i, indexed_item))
+        blooms.append(logs_bloom)
+
+    return blooms
+
+
+def generate_logs_blooms_new(block: List[List[EventLog]]) -> List[BloomFilter]:
+    bloom_builder = BloomBuilder()
+    return [IconServiceEngine._generate_logs_bloom(event_logs, bloom_builder) for event_logs in block]
+
+
+def main():
+    for tx_count in (100, 1000, 5000):
+        block = create_block_event_logs(tx_count)
+        old_blooms = [int(bloom) for bloom in generate_logs_blooms_old(block)]
+        new_blooms = [int(bloom) for bloom in generate_logs_blooms_new(block)]
+        assert old_blooms == new_blooms
+
+        old = measure(lambda: generate_logs_blooms_old(block), repeat=10)
+        new = measure(lambda: generate_logs_blooms_new(block), repeat=10)
+        print_result(f"{tx_count} txs", old, new)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare loading P-Reps from StateDB on startup with the previous one
+over thousands of P-Rep candidates among many other stakers
+
+* Read P-Rep records with stake and delegated amount of each P-Rep
+* Add active P-Reps to PRepContainer sorted by delegated amount
+
+python3 -m tools.benchmark.prep_load
+"""
+
+import random
+import shutil
+import tempfile
+from typing import List, Tuple
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.base.block import Block
+from iconservice.database.db import ContextDatabase
+from iconservice.icon_constant import IconScoreContextType, Revision
+from iconservice.iconscore.context.context import ContextContainer
+from iconservice.iconscore.icon_score_context import IconScoreContext
+from iconservice.icx.coin_part import CoinPart
+from iconservice.icx.delegation_part import DelegationPart
+from iconservice.icx.icx_account import Account
+from iconservice.icx.stake_part import StakePart
+from iconservice.icx.storage import Intent, Storage as IcxStorage
+from iconservice.prep.data import PRep, PRepContainer
+from iconservice.prep.engine import Engine
+from iconservice.prep.prep_address_converter import PRepAddressConverter
+from iconservice.prep.storage import Storage as PRepStorage
+from iconservice.utils import ContextStorage
+from tools.benchmark.utils import measure, print_result
+
+STAKER_COUNT = 20_000
+
+
+def create_db(path: str, prep_count: int) -> 'ContextDatabase':
+    db = ContextDatabase.from_path(path)
+    kv_db = db.key_value_db
+    addresses: List['Address'] = [Address.from_data(AddressPrefix.EOA, f"account{i}".encode())
+                                  for i in range(STAKER_COUNT)]
+
+    for i, address in enumerate(addresses):
+        coin_part = CoinPart(balance=random.randint(0, 10 ** 6) * 10 ** 18)
+        kv_db.put(CoinPart.make_key(address), coin_part.to_bytes(Revision.LATEST.value))
+
+        stake_part = StakePart(stake=random.randint(0, 10 ** 6) * 10 ** 18)
+        stake_part.set_complete(True)
+        kv_db.put(StakePart.make_key(address), stake_part.to_bytes(Revision.LATEST.value))
+
+        # P-Reps are a part of stakers
+        if i < prep_count:
+            delegation_part = DelegationPart(delegated_amount=random.randint(0, 10 ** 6) * 10 ** 18)
+            kv_db.put(DelegationPart.make_key(address), delegation_part.to_bytes())
+
+            prep = PRep(address, block_height=i)
+            kv_db.put(PRep.make_key(address), prep.to_bytes(Revision.LATEST.value))
+
+    return db
+
+
+def load_preps_old(context: 'IconScoreContext') -> Tuple['PRepContainer', 'PRepAddressConverter']:
+    converter = PRepAddressConverter()
+    icx_storage: 'IcxStorage' = context.storage.icx
+    preps = PRepContainer()
+
+    for prep in context.storage.prep.get_prep_iterator():
+        converter.add_node_address(node=prep.node_address, prep=prep.address)
+
+        account: 'Account' = icx_storage.get_account(context, prep.address, Intent.ALL)
+        prep.stake = account.stake
+        prep.delegated = account.delegated_amount
+
+        preps.add(prep)
+
+    preps.freeze()
+    return preps, converter
+
+
+def load_preps_new(context: 'IconScoreContext') -> Tuple['PRepContainer', 'PRepAddressConverter']:
+    engine = Engine()
+    engine.prep_address_converter = PRepAddressConverter()
+    return engine._load_preps(context), engine.prep_address_converter
+
+
+def summarize(preps: 'PRepContainer', converter: 'PRepAddressConverter') -> list:
+    return [(prep.address, prep.stake, prep.delegated,
+             converter.get_prep_address_from_node_address(prep.node_address)) for prep in preps]
+
+
+def main():
+    random.seed(0)
+
+    context = IconScoreContext(IconScoreContextType.DIRECT)
+    context.block = Block(0, None, 0, None, 0)
+    ContextContainer._push_context(context)
+
+    for count in (1_000, 3_000, 10_000):
+        path: str = tempfile.mkdtemp()
+        db = create_db(path, count)
+        context.storage = ContextStorage(
+            deploy=None, fee=None, icx=IcxStorage(db), iiss=None, prep=PRepStorage(db),
+            issue=None, meta=None, rc=None, inv=None)
+
+        assert summarize(*load_preps_old(context)) == summarize(*load_preps_new(context))
+
+        old = measure(lambda: load_preps_old(context), repeat=10)
+        new = measure(lambda: load_preps_new(context), repeat=10)
+        print_result(f"{count} P-Reps", old, new)
+
+        db.key_value_db.close()
+        shutil.rmtree(path)
+
+    ContextContainer._pop_context()
+
+
+if __name__ == "__main__":
+    main()
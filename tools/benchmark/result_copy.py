@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare copy_result() with deepcopy() over getPReps-style query results
+
+python3 -m tools.benchmark.result_copy
+"""
+
+from copy import deepcopy
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.iconscore.icon_score_engine import copy_result
+from tools.benchmark.utils import measure, print_result
+
+
+def create_prep(i: int) -> dict:
+    return {
+        "address": Address.from_data(AddressPrefix.EOA, f"prep{i}".encode()),
+        "status": 0,
+        "penalty": 0,
+        "grade": 2,
+        "name": f"node{i}",
+        "country": "KOR",
+        "city": "Seoul",
+        "stake": i * 10 ** 18,
+        "delegated": i * 10 ** 20,
+        "totalBlocks": i * 100,
+        "validatedBlocks": i * 99,
+        "unvalidatedSequenceBlocks": 0,
+        "irep": 50_000 * 10 ** 18,
+        "irepUpdateBlockHeight": i,
+        "lastGenerateBlockHeight": -1,
+        "blockHeight": i,
+        "txIndex": 0,
+        "nodeAddress": Address.from_data(AddressPrefix.EOA, f"node{i}".encode()),
+        "email": f"node{i}@example.com",
+        "website": f"https://node{i}.example.com",
+        "details": f"https://node{i}.example.com/details.json",
+        "p2pEndpoint": f"node{i}.example.com:7100",
+    }
+
+
+def create_result(size: int) -> dict:
+    preps = [create_prep(i) for i in range(size)]
+
+    return {
+        "blockHeight": 100,
+        "startRanking": 1,
+        "totalDelegated": sum(prep["delegated"] for prep in preps),
+        "totalStake": sum(prep["stake"] for prep in preps),
+        "preps": preps,
+    }
+
+
+def main():
+    for size in (100, 1000, 10000):
+        result = create_result(size)
+        assert copy_result(result) == deepcopy(result)
+
+        repeat = max(1, 10000 // size)
+        old = measure(lambda: deepcopy(result), repeat=repeat)
+        new = measure(lambda: copy_result(result), repeat=repeat)
+        print_result(f"getPReps: {size} preps", old, new)
+
+
+if __name__ == "__main__":
+    main()
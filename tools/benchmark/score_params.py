@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the compiled parameter converters of SCORE methods with convert_score_parameters()
+over the sample SCOREs in tests/integrate_test/samples
+
+python3 -m tools.benchmark.score_params
+"""
+
+import importlib
+import json
+import os
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, Tuple, Union
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.icon_constant import PACKAGE_JSON_FILE
+from iconservice.iconscore.icon_score_constant import CONST_CLASS_ELEMENT_METADATAS
+from iconservice.iconscore.typing import get_origin, get_args, get_annotations, is_struct
+from iconservice.iconscore.typing.conversion import convert_score_parameters
+from iconservice.iconscore.typing.element import FunctionMetadata
+from tools.benchmark.utils import measure, print_result
+
+SAMPLES_PATH = os.path.join("tests", "integrate_test", "samples")
+
+_SAMPLE_VALUES = {
+    bool: "0x1",
+    bytes: "0x0123456789",
+    int: "0x1234",
+    str: "sample",
+    Address: str(Address.from_data(AddressPrefix.EOA, b"sample")),
+}
+
+
+def load_score_classes(samples_path: str) -> List[type]:
+    classes = []
+
+    for root, _, files in os.walk(samples_path):
+        if PACKAGE_JSON_FILE not in files:
+            continue
+
+        with open(os.path.join(root, PACKAGE_JSON_FILE)) as f:
+            package_json: dict = json.load(f)
+
+        # Each SCORE is imported as a package with a unique name like IconScoreClassLoader does
+        package_name = f"benchmark_score_{len(sys.modules)}_{os.path.basename(root)}"
+        package = ModuleType(package_name)
+        package.__path__ = [root]
+        sys.modules[package_name] = package
+
+        try:
+            main_module: str = package_json.get("main_module", package_json.get("main_file"))
+            module = importlib.import_module(f".{main_module}", package_name)
+            classes.append(getattr(module, package_json["main_score"]))
+        except BaseException:
+            # Some samples are invalid on purpose
+            continue
+
+    return classes
+
+
+def sample_value(type_hint: type) -> Any:
+    origin = get_origin(type_hint)
+
+    if origin in _SAMPLE_VALUES:
+        return _SAMPLE_VALUES[origin]
+    if is_struct(origin):
+        return {k: sample_value(v) for k, v in get_annotations(origin, {}).items()}
+    if origin is list:
+        return [sample_value(get_args(type_hint)[0]) for _ in range(3)]
+    if origin is Union:
+        return sample_value(get_args(type_hint)[0])
+
+    raise TypeError(f"Unsupported type hint: {type_hint}")
+
+
+def collect_calls(classes: List[type]) -> List[Tuple[FunctionMetadata, Dict[str, Any]]]:
+    calls = []
+
+    for cls in classes:
+        elements = getattr(cls, CONST_CLASS_ELEMENT_METADATAS, {})
+
+        for name in elements:
+            metadata = elements[name]
+            if not isinstance(metadata, FunctionMetadata):
+                continue
+
+            parameters = metadata.signature.parameters
+            params = {k: sample_value(parameter.annotation) for k, parameter in parameters.items()}
+            calls.append((metadata, params))
+
+    return calls
+
+
+def convert_all_old(calls: List[Tuple[FunctionMetadata, Dict[str, Any]]]) -> list:
+    return [convert_score_parameters(dict(params), metadata.signature) for metadata, params in calls]
+
+
+def convert_all_new(calls: List[Tuple[FunctionMetadata, Dict[str, Any]]]) -> list:
+    return [metadata.params_converter.convert(dict(params)) for metadata, params in calls]
+
+
+def main():
+    classes = load_score_classes(SAMPLES_PATH)
+    calls = collect_calls(classes)
+    with_params = [call for call in calls if len(call[1]) > 0]
+
+    print(f"{len(classes)} SCOREs, {len(calls)} methods, {len(with_params)} methods with parameters")
+
+    cases = (
+        ("all methods", calls),
+        ("methods with parameters", with_params),
+    )
+
+    for name, case in cases:
+        assert convert_all_old(case) == convert_all_new(case)
+
+        old = measure(lambda: convert_all_old(case), repeat=200)
+        new = measure(lambda: convert_all_new(case), repeat=200)
+        print_result(name, old, new)
+
+
+if __name__ == "__main__":
+    main()
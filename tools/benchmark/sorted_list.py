@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare SortedList using bisect with the previous one
+over 10k delegation updates of 1k active P-Reps
+
+python3 -m tools.benchmark.sorted_list
+"""
+
+import random
+from typing import List, Tuple
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.prep.data.prep import PRep
+from iconservice.prep.data.sorted_list import SortedList, Sortable
+from tools.benchmark.utils import measure, print_result
+
+PREP_COUNT = 1_000
+UPDATE_COUNT = 10_000
+
+
+class PreviousSortedList(object):
+    """SortedList looking for the position of a new item with a linear scan"""
+
+    def __init__(self, sorted_list=()):
+        self._items = list(sorted_list)
+
+    def add(self, new_item: 'Sortable'):
+        index = 0
+        order = new_item.order()
+
+        for item in self._items:
+            if order < item.order():
+                break
+
+            index += 1
+
+        self._items.insert(index, new_item)
+
+    def index(self, item: 'Sortable') -> int:
+        order = item.order()
+
+        left: int = 0
+        right: int = len(self._items)
+
+        while left < right:
+            i = (left + right) // 2
+            item_in_list: 'Sortable' = self._items[i]
+
+            if order == item_in_list.order():
+                return self._precise_index(i, item)
+
+            if order < item_in_list.order():
+                right = i
+            else:
+                left = i + 1
+
+        return -1
+
+    def _precise_index(self, base_index: int, target_item: 'Sortable') -> int:
+        if id(target_item) == id(self._items[base_index]):
+            return base_index
+
+        for i in range(base_index - 1, -1, -1):
+            item: 'Sortable' = self._items[i]
+            if target_item.order() != item.order():
+                break
+
+            if id(target_item) == id(item):
+                return i
+
+        for i in range(base_index + 1, len(self._items)):
+            item: 'Sortable' = self._items[i]
+            if target_item.order() != item.order():
+                break
+
+            if id(target_item) == id(item):
+                return i
+
+        return -1
+
+    def remove(self, item: 'Sortable') -> 'Sortable':
+        index: int = self.index(item)
+
+        if index > -1:
+            return self._items.pop(index)
+
+        raise ValueError(f"Value not found")
+
+    def __iter__(self):
+        for item in self._items:
+            yield item
+
+
+def create_preps(count: int) -> List['PRep']:
+    preps = []
+
+    for i in range(count):
+        address = Address.from_data(AddressPrefix.EOA, f"prep{i}".encode())
+        preps.append(PRep(address, delegated=random.randint(0, 10 ** 6) * 10 ** 18, block_height=i))
+
+    return preps
+
+
+def create_updates(preps: List['PRep'], count: int) -> List[Tuple['PRep', 'PRep']]:
+    """Returns pairs of an old P-Rep and its copy with new delegated amount like PRepContainer.replace() gets"""
+    preps = list(preps)
+    updates = []
+
+    for _ in range(count):
+        i = random.randrange(len(preps))
+        new_prep = preps[i].copy()
+        new_prep.delegated = max(0, new_prep.delegated + random.randint(-10 ** 4, 10 ** 4) * 10 ** 18)
+        updates.append((preps[i], new_prep))
+        preps[i] = new_prep
+
+    return updates
+
+
+def run(list_type: type, preps: List['PRep'], updates: List[Tuple['PRep', 'PRep']]) -> list:
+    items = list_type()
+    for prep in preps:
+        items.add(prep)
+
+    for old_prep, new_prep in updates:
+        items.remove(old_prep)
+        items.add(new_prep)
+        items.index(new_prep)
+
+    return list(items)
+
+
+def main():
+    random.seed(0)
+    preps = create_preps(PREP_COUNT)
+    updates = create_updates(preps, UPDATE_COUNT)
+
+    assert run(PreviousSortedList, preps, updates) == run(SortedList, preps, updates)
+
+    old = measure(lambda: run(PreviousSortedList, preps, updates), repeat=5)
+    new = measure(lambda: run(SortedList, preps, updates), repeat=5)
+    print_result(f"{PREP_COUNT} P-Reps x {UPDATE_COUNT} updates", old, new)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare IconScoreStepCounter using the step cost table with the previous one
+over the steps applied by a db-heavy SCORE call
+
+python3 -m tools.benchmark.step_counter
+"""
+
+from typing import List, Optional, Tuple
+
+from iconservice.base.exception import InvalidRequestException
+from iconservice.icon_constant import MAX_EXTERNAL_CALL_COUNT
+from iconservice.iconscore.icon_score_step import IconScoreStepCounter, OutOfStepException, StepTracer, StepType
+from tools.benchmark.utils import measure, print_result
+
+STEP_COSTS = {
+    StepType.DEFAULT: 100_000,
+    StepType.CONTRACT_CALL: 25_000,
+    StepType.CONTRACT_CREATE: 1_000_000_000,
+    StepType.CONTRACT_UPDATE: 1_600_000_000,
+    StepType.CONTRACT_DESTRUCT: -70_000,
+    StepType.CONTRACT_SET: 30_000,
+    StepType.GET: 25,
+    StepType.SET: 320,
+    StepType.REPLACE: 80,
+    StepType.DELETE: -240,
+    StepType.INPUT: 200,
+    StepType.EVENT_LOG: 100,
+    StepType.API_CALL: 10_000,
+}
+STEP_LIMIT = 2_500_000_000
+
+
+class PreviousStepCounter(object):
+    """IconScoreStepCounter looking up step costs in a dict for every step"""
+
+    def __init__(self, step_price: int, step_costs: dict, step_limit: int, step_trace_flag: bool = False):
+        self._step_price = step_price
+        self._step_costs: dict = step_costs
+        self._step_limit: int = step_limit
+        self._step_used: int = 0
+        self._external_call_count: int = 0
+        self._max_step_used: int = 0
+        self._step_tracer: Optional[StepTracer] = StepTracer() if step_trace_flag else None
+
+    @property
+    def step_used(self) -> int:
+        return max(self._step_used, self._step_costs.get(StepType.DEFAULT, 0))
+
+    def apply_step(self, step_type: StepType, count: int) -> int:
+        if step_type == StepType.CONTRACT_CALL:
+            self._external_call_count += 1
+            if self._external_call_count > MAX_EXTERNAL_CALL_COUNT:
+                raise InvalidRequestException('Too many external calls')
+
+        step: int = self._step_costs.get(step_type, 0) * count
+
+        return self.consume_step(step_type, step)
+
+    def consume_step(self, step_type: StepType, step: int) -> int:
+        step_used: int = self._step_used + step
+
+        self._max_step_used = max(self._max_step_used, step_used)
+
+        if step_used > self._step_limit:
+            step_used = self._step_used
+            self._step_used = self._step_limit
+            raise OutOfStepException(self._step_limit, step_used, step, step_type)
+
+        self._step_used = step_used
+        self._trace_step(step_type, step)
+
+        return step_used
+
+    def _trace_step(self, step_type: StepType, step: int):
+        if self._step_tracer is not None:
+            self._step_tracer.add(step_type, step, self._step_used)
+
+
+def create_steps(db_access_count: int) -> List[Tuple[StepType, int]]:
+    """Returns the steps applied by a SCORE call reading and writing a value for each db access"""
+    steps = [(StepType.CONTRACT_CALL, 1), (StepType.INPUT, 64)]
+
+    for i in range(db_access_count):
+        steps.append((StepType.GET, 32))
+        steps.append((StepType.REPLACE if i % 4 else StepType.SET, 32))
+        if i % 10 == 0:
+            steps.append((StepType.EVENT_LOG, 100))
+
+    return steps
+
+
+def run(counter_class: type, steps: List[Tuple[StepType, int]]) -> int:
+    counter = counter_class(10 ** 10, dict(STEP_COSTS), STEP_LIMIT)
+    apply_step = counter.apply_step
+
+    for step_type, count in steps:
+        apply_step(step_type, count)
+
+    return counter.step_used
+
+
+def main():
+    for db_access_count in (10, 100, 1000):
+        steps = create_steps(db_access_count)
+        assert run(IconScoreStepCounter, steps) == run(PreviousStepCounter, steps)
+
+        old = measure(lambda: run(PreviousStepCounter, steps), repeat=2000)
+        new = measure(lambda: run(IconScoreStepCounter, steps), repeat=2000)
+        print_result(f"{len(steps)} steps", old, new)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the P-Rep work on term transitions with the previous one
+over thousands of P-Rep candidates
+
+* Collect the P-Reps whose block validation penalties are released
+* Elect main and sub P-Reps for the next term and make the root hash of main P-Reps
+
+python3 -m tools.benchmark.term_transition
+"""
+
+import random
+from typing import Iterable, List, Tuple
+
+from iconservice.base.address import Address, AddressPrefix
+from iconservice.icon_constant import PenaltyReason, PRepStatus, PREP_MAIN_PREPS, PREP_MAIN_AND_SUB_PREPS
+from iconservice.prep.data import PRep, PRepContainer, Term
+from iconservice.prep.data.term import PRepSnapshot
+from iconservice.utils.hashing.hash_generator import RootHashGenerator
+from tools.benchmark.utils import measure, print_result
+
+TERM_COUNT = 10
+SUSPENDED_PREP_COUNT = 3
+
+
+class PreviousTerm(Term):
+    """Term making the root hash of main P-Reps from scratch"""
+
+    def _generate_root_hash(self):
+        def _gen(snapshots: Iterable['PRepSnapshot']) -> bytes:
+            for snapshot in snapshots:
+                yield snapshot.address.to_bytes_including_prefix()
+
+        self._merkle_root_hash: bytes = \
+            RootHashGenerator.generate_root_hash(values=_gen(self._main_preps), do_hash=True)
+
+
+def create_preps(count: int) -> 'PRepContainer':
+    preps = PRepContainer()
+
+    for i in range(count):
+        address = Address.from_data(AddressPrefix.EOA, f"prep{i}".encode())
+        preps.add(PRep(address, delegated=random.randint(0, 10 ** 6) * 10 ** 18, block_height=i))
+
+    # Suspended P-Reps are not elected until their penalties are released
+    for index in random.sample(range(PREP_MAIN_AND_SUB_PREPS, count), SUSPENDED_PREP_COUNT):
+        prep: 'PRep' = preps.get_by_index(index).copy()
+        prep.penalty = PenaltyReason.BLOCK_VALIDATION
+        preps.replace(prep)
+
+    preps.freeze()
+    return preps
+
+
+def get_suspended_preps_old(preps: 'PRepContainer') -> List['PRep']:
+    return [prep for prep in preps
+            if prep.penalty == PenaltyReason.BLOCK_VALIDATION and prep.status == PRepStatus.ACTIVE]
+
+
+def get_suspended_preps_new(preps: 'PRepContainer') -> List['PRep']:
+    return preps.get_suspended_preps()
+
+
+def run(preps: 'PRepContainer', get_suspended_preps: callable, term_type: type) -> List[Tuple[list, bytes]]:
+    ret = []
+
+    for sequence in range(TERM_COUNT):
+        suspended_preps: List['PRep'] = get_suspended_preps(preps)
+
+        term = term_type(sequence, sequence * 43120, 43120, 0, 800_000_000 * 10 ** 18, preps.total_delegated)
+        term.set_preps(preps.get_preps(0, PREP_MAIN_AND_SUB_PREPS), PREP_MAIN_PREPS, PREP_MAIN_AND_SUB_PREPS)
+        ret.append(([prep.address for prep in suspended_preps], term.root_hash))
+
+    return ret
+
+
+def main():
+    random.seed(0)
+
+    for count in (1_000, 3_000, 10_000):
+        preps = create_preps(count)
+        assert run(preps, get_suspended_preps_old, PreviousTerm) == run(preps, get_suspended_preps_new, Term)
+
+        old = measure(lambda: run(preps, get_suspended_preps_old, PreviousTerm), repeat=20)
+        new = measure(lambda: run(preps, get_suspended_preps_new, Term), repeat=20)
+        print_result(f"{count} P-Reps x {TERM_COUNT} terms", old, new)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from typing import Callable
+
+
+def measure(func: Callable, repeat: int) -> float:
+    """Returns the best elapsed time in seconds among repeated calls
+
+    :param func: function to measure
+    :param repeat: the number of calls
+    """
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def print_result(name: str, old: float, new: float):
+    print(f"{name:<40} old={old * 1000:10.3f}ms new={new * 1000:10.3f}ms speedup={old / new:6.2f}x")
@@ -282,7 +282,8 @@ class PrepConverter(Converter):
             PRepStorage.TERM_KEY: self._convert_term
         })
         self._flexible_key_convert_methods.extend([
-            (self._is_prep_data, self._convert_prep)
+            (self._is_prep_data, self._convert_prep),
+            (self._is_prep_block_statistics, self._convert_prep_block_statistics)
         ])
 
     """ Static """
@@ -310,6 +311,19 @@ class PrepConverter(Converter):
         prep_address = Address.from_bytes(key[len(PRep.PREFIX):])
         return f"Prep: {prep_address}", str(PRep.from_bytes(value))
 
+    @classmethod
+    def _is_prep_block_statistics(cls, key: bytes):
+        prefix: bytes = PRep.BLOCK_STATISTICS_PREFIX
+        if key.startswith(prefix) and len(key) == len(prefix) + ICON_ADDRESS_BYTES_SIZE:
+            return True
+        return False
+
+    @classmethod
+    def _convert_prep_block_statistics(cls, key: bytes, value: bytes):
+        prep_address = Address.from_bytes(key[len(PRep.BLOCK_STATISTICS_PREFIX):])
+        data = MsgPackForDB.loads(value)
+        return f"Prep block statistics: {prep_address}", str(data)
+
 
 class IISSConverter(Converter):
     def __init__(self):